@@ -108,7 +108,11 @@ class BlockItem(Classified, ElementPresentation[Block]):
             *(
                 self.show_attributes
                 and self.subject
-                and [attributes_compartment(self.subject)]
+                and [
+                    attributes_compartment(
+                        self.subject, self.element_shapes("attributes")
+                    )
+                ]
                 or []
             ),
             *(
@@ -126,28 +130,42 @@ class BlockItem(Classified, ElementPresentation[Block]):
         )
 
     def block_compartment(self, name, predicate, css_name):
-        # We need to fix the attribute value, since the for loop changes it.
-        def lazy_format(attribute):
-            return lambda: format_property(attribute) or self.diagram.gettext("unnamed")
+        def attribute_shape(attribute):
+            return CssNode(
+                css_name,
+                attribute,
+                Text(
+                    text=lambda: format_property(attribute)
+                    or self.diagram.gettext("unnamed")
+                ),
+            )
 
         return CssNode(
             "compartment",
             self.subject,
             Box(
                 CssNode("heading", self.subject, Text(text=name)),
-                *(
-                    CssNode(css_name, attribute, Text(text=lazy_format(attribute)))
-                    for attribute in self.subject.ownedAttribute
-                    if predicate(attribute)
+                *self.element_shapes(css_name)(
+                    (
+                        attribute
+                        for attribute in self.subject.ownedAttribute
+                        if predicate(attribute)
+                    ),
+                    attribute_shape,
                 ),
                 draw=draw_top_separator,
             ),
         )
 
     def operations_compartment(self, name, predicate):
-        def lazy_format(operation):
-            return lambda: format_operation(operation) or self.diagram.gettext(
-                "unnamed"
+        def operation_shape(operation):
+            return CssNode(
+                "operation",
+                operation,
+                Text(
+                    text=lambda: format_operation(operation)
+                    or self.diagram.gettext("unnamed")
+                ),
             )
 
         return CssNode(
@@ -155,9 +173,8 @@ class BlockItem(Classified, ElementPresentation[Block]):
             self.subject,
             Box(
                 CssNode("heading", self.subject, Text(text=name)),
-                *(
-                    CssNode("operation", operation, Text(text=lazy_format(operation)))
-                    for operation in self.subject.ownedOperation
+                *self.element_shapes("operations")(
+                    self.subject.ownedOperation, operation_shape
                 ),
                 draw=draw_top_separator,
             ),
@@ -65,13 +65,21 @@ class DataTypeItem(Classified, ElementPresentation[UML.DataType]):
             *(
                 self.show_attributes
                 and self.subject
-                and [attributes_compartment(self.subject)]
+                and [
+                    attributes_compartment(
+                        self.subject, self.element_shapes("attributes")
+                    )
+                ]
                 or []
             ),
             *(
                 self.show_operations
                 and self.subject
-                and [operations_compartment(self.subject)]
+                and [
+                    operations_compartment(
+                        self.subject, self.element_shapes("operations")
+                    )
+                ]
                 or []
             ),
             *(self.show_stereotypes and stereotype_compartments(self.subject) or []),
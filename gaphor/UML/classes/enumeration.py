@@ -6,7 +6,14 @@ from gaphor.diagram.presentation import (
     Classified,
     ElementPresentation,
 )
-from gaphor.diagram.shapes import Box, CssNode, Text, draw_border, draw_top_separator
+from gaphor.diagram.shapes import (
+    Box,
+    CssNode,
+    ElementShapes,
+    Text,
+    draw_border,
+    draw_top_separator,
+)
 from gaphor.diagram.support import represents
 from gaphor.UML.classes.klass import (
     attribute_watches,
@@ -39,7 +46,7 @@ class EnumerationItem(Classified, ElementPresentation[UML.Enumeration]):
             "subject[NamedElement].name"
         ).watch("subject[NamedElement].namespace.name").watch(
             "subject[Enumeration].ownedLiteral", self.update_shapes
-        ).watch("subject[Enumeration].ownedLiteral.name", self.update_shapes)
+        ).watch("subject[Enumeration].ownedLiteral.name")
         attribute_watches(self, "Enumeration")
         operation_watches(self, "Enumeration")
         stereotype_watches(self)
@@ -71,19 +78,31 @@ class EnumerationItem(Classified, ElementPresentation[UML.Enumeration]):
             *(
                 self.show_enumerations
                 and self.subject
-                and [enumerations_compartment(self.subject)]
+                and [
+                    enumerations_compartment(
+                        self.subject, self.element_shapes("enumerations")
+                    )
+                ]
                 or []
             ),
             *(
                 self.show_attributes
                 and self.subject
-                and [attributes_compartment(self.subject)]
+                and [
+                    attributes_compartment(
+                        self.subject, self.element_shapes("attributes")
+                    )
+                ]
                 or []
             ),
             *(
                 self.show_operations
                 and self.subject
-                and [operations_compartment(self.subject)]
+                and [
+                    operations_compartment(
+                        self.subject, self.element_shapes("operations")
+                    )
+                ]
                 or []
             ),
             *(self.show_stereotypes and stereotype_compartments(self.subject) or []),
@@ -91,24 +110,16 @@ class EnumerationItem(Classified, ElementPresentation[UML.Enumeration]):
         )
 
 
-def enumerations_compartment(subject):
-    def lazy_format(literal):
-        return lambda: format(literal)
+def enumerations_compartment(subject, shapes: ElementShapes | None = None):
+    def literal_shape(literal):
+        return CssNode("enumeration", literal, Text(text=lambda: literal.name))
 
+    shapes = shapes or ElementShapes()
     return CssNode(
         "compartment",
         subject,
         Box(
-            *(
-                CssNode(
-                    "enumeration",
-                    literal,
-                    Text(
-                        text=lazy_format(literal.name),
-                    ),
-                )
-                for literal in subject.ownedLiteral
-            ),
+            *shapes(subject.ownedLiteral, literal_shape),
             draw=draw_top_separator,
         ),
     )
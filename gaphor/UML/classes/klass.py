@@ -7,7 +7,14 @@ from gaphor.diagram.presentation import (
     Classified,
     ElementPresentation,
 )
-from gaphor.diagram.shapes import Box, CssNode, Text, draw_border, draw_top_separator
+from gaphor.diagram.shapes import (
+    Box,
+    CssNode,
+    ElementShapes,
+    Text,
+    draw_border,
+    draw_top_separator,
+)
 from gaphor.diagram.support import represents
 from gaphor.UML.classes.stereotype import stereotype_compartments, stereotype_watches
 from gaphor.UML.compartments import name_compartment
@@ -57,13 +64,21 @@ class ClassItem(Classified, ElementPresentation[UML.Class]):
             *(
                 self.show_attributes
                 and self.subject
-                and [attributes_compartment(self.subject)]
+                and [
+                    attributes_compartment(
+                        self.subject, self.element_shapes("attributes")
+                    )
+                ]
                 or []
             ),
             *(
                 self.show_operations
                 and self.subject
-                and [operations_compartment(self.subject)]
+                and [
+                    operations_compartment(
+                        self.subject, self.element_shapes("operations")
+                    )
+                ]
                 or []
             ),
             *(self.show_stereotypes and stereotype_compartments(self.subject) or []),
@@ -105,51 +120,50 @@ def operation_watches(presentation, cast):
     )
 
 
-def attributes_compartment(subject):
-    # We need to scope the attribute value, since the for loop changes it.
-    def lazy_format(attribute):
-        return lambda: format(attribute)
+def attributes_compartment(subject, shapes: ElementShapes | None = None):
+    def attribute_shape(attribute):
+        return CssNode("attribute", attribute, Text(text=lambda: format(attribute)))
 
+    shapes = shapes or ElementShapes()
     return CssNode(
         "compartment",
         subject,
         Box(
-            *(
-                CssNode(
-                    "attribute",
-                    attribute,
-                    Text(
-                        text=lazy_format(attribute),
-                    ),
-                )
-                for attribute in subject.ownedAttribute
-                if not attribute.association
+            *shapes(
+                (
+                    attribute
+                    for attribute in subject.ownedAttribute
+                    if not attribute.association
+                ),
+                attribute_shape,
             ),
             draw=draw_top_separator,
         ),
     )
 
 
-def operations_compartment(subject):
-    def lazy_format(operation):
-        return lambda: format(
-            operation, visibility=True, type=True, multiplicity=True, default=True
+def operations_compartment(subject, shapes: ElementShapes | None = None):
+    def operation_shape(operation):
+        return CssNode(
+            "operation",
+            operation,
+            Text(
+                text=lambda: format(
+                    operation,
+                    visibility=True,
+                    type=True,
+                    multiplicity=True,
+                    default=True,
+                )
+            ),
         )
 
+    shapes = shapes or ElementShapes()
     return CssNode(
         "compartment",
         subject,
         Box(
-            *(
-                CssNode(
-                    "operation",
-                    operation,
-                    Text(
-                        text=lazy_format(operation),
-                    ),
-                )
-                for operation in subject.ownedOperation
-            ),
+            *shapes(subject.ownedOperation, operation_shape),
             draw=draw_top_separator,
         ),
     )
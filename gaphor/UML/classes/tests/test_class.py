@@ -97,3 +97,27 @@ def test_compartment_resizing(element_factory):
 
     width = klass.width
     assert width >= 170.0
+
+
+def test_attribute_shapes_are_reused(element_factory):
+    diagram = element_factory.create(Diagram)
+    klass = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+    attr = element_factory.create(UML.Property)
+    klass.subject.ownedAttribute = attr
+    (attr_shape,) = compartments(klass)[0].child.children
+
+    klass.subject.ownedAttribute = element_factory.create(UML.Property)
+
+    assert 2 == len(compartments(klass)[0].child.children)
+    assert compartments(klass)[0].child.children[0] is attr_shape
+
+
+def test_removed_attribute_shape_is_dropped(element_factory):
+    diagram = element_factory.create(Diagram)
+    klass = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+    attr = element_factory.create(UML.Property)
+    klass.subject.ownedAttribute = attr
+
+    attr.unlink()
+
+    assert 0 == len(compartments(klass)[0].child.children)
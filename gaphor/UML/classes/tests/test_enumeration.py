@@ -0,0 +1,16 @@
+"""Test enumerations."""
+
+from gaphor import UML
+from gaphor.UML.classes.enumeration import enumerations_compartment
+
+
+def test_enumeration_literal_shows_name(element_factory):
+    enum = element_factory.create(UML.Enumeration)
+    literal = element_factory.create(UML.EnumerationLiteral)
+    literal.name = "RED"
+    enum.ownedLiteral = literal
+
+    compartment = enumerations_compartment(enum)
+    literal_shape = compartment.child.children[0]
+
+    assert literal_shape.child.text() == "RED"
@@ -0,0 +1,169 @@
+"""Generate synthetic UML models of any size.
+
+Synthetic models make performance problems reproducible without sharing
+confidential models. The same size and seed produce the same model
+structure.
+
+Generate a model from the command line with::
+
+    python -m gaphor.UML.syntheticmodel --packages 100 --classes 100 large.gaphor
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import dataclass
+
+import gaphor.UML.classes  # noqa: F401 Register class diagram items
+from gaphor import UML
+from gaphor.core.modeling import Diagram, ElementFactory
+from gaphor.diagram.drop import drop
+from gaphor.storage import storage
+
+
+@dataclass(frozen=True)
+class ModelSize:
+    """The shape of a synthetic model.
+
+    Packages form a tree: every package has up to ``nesting`` nested
+    packages. Every package holds ``classes`` classes, every class
+    ``attributes`` attributes and ``relationships`` associations or
+    generalizations to other classes in the same package. With
+    ``diagrams``, every package gets a class diagram that shows its
+    classes and their relationships.
+    """
+
+    packages: int = 10
+    classes: int = 10
+    attributes: int = 5
+    relationships: int = 1
+    nesting: int = 5
+    diagrams: bool = True
+
+
+def generate(
+    element_factory: ElementFactory, size: ModelSize, seed: int = 0
+) -> list[UML.Package]:
+    """Create a synthetic model in ``element_factory``.
+
+    Returns the created packages.
+    """
+    rnd = random.Random(seed)
+    packages: list[UML.Package] = []
+    for p in range(size.packages):
+        package = element_factory.create(UML.Package)
+        package.name = f"Package{p}"
+        if p and size.nesting:
+            package.package = packages[(p - 1) // size.nesting]
+        packages.append(package)
+
+        classes = [
+            _create_class(element_factory, package, f"Class{p}_{c}", size.attributes)
+            for c in range(size.classes)
+        ]
+        relationships = [
+            _create_relationship(cls, classes[rnd.randrange(c)], rnd)
+            for c, cls in enumerate(classes)
+            if c
+            for _ in range(size.relationships)
+        ]
+
+        if size.diagrams:
+            _create_diagram(element_factory, package, classes, relationships)
+
+    return packages
+
+
+def _create_class(element_factory, package, name, attributes):
+    cls = element_factory.create(UML.Class)
+    cls.name = name
+    cls.package = package
+    for a in range(attributes):
+        attribute = element_factory.create(UML.Property)
+        attribute.name = f"attribute{a}"
+        attribute.typeValue = "int"
+        cls.ownedAttribute = attribute
+    return cls
+
+
+def _create_relationship(specific, general, rnd):
+    # Generalizations only point to classes created earlier, so there are no cycles
+    if rnd.random() < 0.5:
+        return UML.recipes.create_generalization(general, specific)
+    association = UML.recipes.create_association(specific, general)
+    association.package = specific.package
+    return association
+
+
+def _create_diagram(element_factory, package, classes, relationships):
+    diagram = element_factory.create(Diagram)
+    diagram.name = f"{package.name} classes"
+    diagram.element = package
+
+    columns = max(1, int(len(classes) ** 0.5))
+    for n, cls in enumerate(classes):
+        drop(cls, diagram, x=(n % columns) * 200, y=(n // columns) * 150)
+    for relationship in relationships:
+        drop(relationship, diagram, x=0, y=0)
+    return diagram
+
+
+def save_model(filename, size: ModelSize, seed: int = 0) -> int:
+    """Generate a model and save it to ``filename``.
+
+    Returns the number of elements in the model.
+    """
+    element_factory = ElementFactory()
+    generate(element_factory, size, seed)
+    with open(filename, "w", encoding="utf-8") as out:
+        storage.save(out, element_factory)
+    return element_factory.size()
+
+
+def main(argv=None):
+    defaults = ModelSize()
+    parser = argparse.ArgumentParser(description="Generate a synthetic UML model.")
+    parser.add_argument("--packages", type=int, default=defaults.packages)
+    parser.add_argument(
+        "--classes", type=int, default=defaults.classes, help="classes per package"
+    )
+    parser.add_argument(
+        "--attributes",
+        type=int,
+        default=defaults.attributes,
+        help="attributes per class",
+    )
+    parser.add_argument(
+        "--relationships",
+        type=int,
+        default=defaults.relationships,
+        help="associations and generalizations per class",
+    )
+    parser.add_argument(
+        "--nesting",
+        type=int,
+        default=defaults.nesting,
+        help="nested packages per package",
+    )
+    parser.add_argument(
+        "--no-diagrams", action="store_true", help="do not create diagrams"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("model", help="file to write the model to")
+    args = parser.parse_args(argv)
+
+    size = ModelSize(
+        packages=args.packages,
+        classes=args.classes,
+        attributes=args.attributes,
+        relationships=args.relationships,
+        nesting=args.nesting,
+        diagrams=not args.no_diagrams,
+    )
+    count = save_model(args.model, size, args.seed)
+    print(f"Wrote {count} elements to {args.model}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+from gaphor import UML
+from gaphor.core.modeling import Diagram, ElementFactory
+from gaphor.UML.syntheticmodel import ModelSize, generate, main
+
+
+def structure(element_factory):
+    return sorted(
+        (type(e).__name__, getattr(e, "name", None) or "")
+        for e in element_factory.select()
+    )
+
+
+def test_generate_model(element_factory):
+    size = ModelSize(packages=3, classes=4, attributes=2, relationships=1)
+
+    packages = generate(element_factory, size)
+
+    assert len(packages) == 3
+    assert len(element_factory.lselect(UML.Class)) == 12
+    assert all(len(c.ownedAttribute) >= 2 for c in element_factory.select(UML.Class))
+    assert (
+        len(element_factory.lselect(UML.Generalization))
+        + len(element_factory.lselect(UML.Association))
+        == 3 * 3
+    )
+
+
+def test_packages_are_nested(element_factory):
+    packages = generate(
+        element_factory, ModelSize(packages=4, classes=1, nesting=2, diagrams=False)
+    )
+
+    assert packages[0].package is None
+    assert packages[1].package is packages[0]
+    assert packages[2].package is packages[0]
+    assert packages[3].package is packages[1]
+
+
+def test_diagrams_show_classes_and_relationships(element_factory):
+    generate(element_factory, ModelSize(packages=1, classes=5, relationships=1))
+
+    diagram = next(element_factory.select(Diagram))
+
+    assert diagram.element is next(element_factory.select(UML.Package))
+    assert len(diagram.ownedPresentation) == 5 + 4
+    assert all(
+        diagram.connections.get_connection(item.head)
+        for item in diagram.ownedPresentation
+        if hasattr(item, "head")
+    )
+
+
+def test_model_is_reproducible():
+    size = ModelSize(packages=2, classes=10, relationships=2)
+    first = ElementFactory()
+    second = ElementFactory()
+
+    generate(first, size, seed=1)
+    generate(second, size, seed=1)
+
+    assert structure(first) == structure(second)
+
+
+def test_save_model(tmp_path, capsys):
+    model = tmp_path / "model.gaphor"
+
+    main(["--packages", "2", "--classes", "3", str(model)])
+
+    assert "<Class " in model.read_text(encoding="utf-8")
+    assert "Wrote" in capsys.readouterr().out
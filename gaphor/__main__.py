@@ -1,6 +1,9 @@
+import multiprocessing
 import sys
 
 from gaphor.main import main
 
 if __name__ == "__main__":
+    # Worker processes are used for parsing models, also in frozen builds
+    multiprocessing.freeze_support()
     sys.exit(main(sys.argv))
@@ -67,12 +67,32 @@ header = textwrap.dedent(
     """.format("ruff")  # work around tooling triggers
 )
 
+# Properties with specialized accessors have the same API, so only the
+# imports change.
+accessors_header = header.replace(
+    """\
+    association,
+    attribute as _attribute,
+    derived,
+    derivedunion,
+    enumeration as _enumeration,
+""",
+    """\
+    derived,
+    fastassociation as association,
+    fastattribute as _attribute,
+    fastderivedunion as derivedunion,
+    fastenumeration as _enumeration,
+""",
+)
+
 
 def main(
     modelfile: str,
     supermodelfiles: list[tuple[str, str]] | None = None,
     overridesfile: str | None = None,
     outfile: str | None = None,
+    accessors: bool = False,
 ):
     logging.basicConfig()
 
@@ -106,7 +126,7 @@ def main(
     with open(outfile, "w", encoding="utf-8") if outfile else contextlib.nullcontext(
         sys.stdout
     ) as out:  # type: ignore[attr-defined]
-        for line in coder(model, super_models, overrides):
+        for line in coder(model, super_models, overrides, accessors):
             print(line, file=out)
 
 
@@ -132,7 +152,13 @@ def coder(
     model: ElementFactory,
     super_models: list[tuple[ModelingLanguage, ElementFactory]],
     overrides: Overrides | None,
+    accessors: bool = False,
 ) -> Iterable[str]:
+    """Generate the code for a model.
+
+    With ``accessors``, properties are generated with specialized
+    accessors, which read values directly.
+    """
     classes = list(
         order_classes(
             c
@@ -144,7 +170,7 @@ def coder(
         )
     )
 
-    yield header
+    yield accessors_header if accessors else header
     if overrides and overrides.header:
         yield overrides.header
 
@@ -490,6 +516,12 @@ if __name__ == "__main__":
         "-o", dest="outfile", type=Path, help="Python data model filename"
     )
     parser.add_argument("-r", dest="overridesfile", type=Path, help="Override filename")
+    parser.add_argument(
+        "-a",
+        dest="accessors",
+        action="store_true",
+        help="Generate properties with specialized accessors",
+    )
     parser.add_argument(
         "-s",
         dest="supermodelfiles",
@@ -503,4 +535,10 @@ if __name__ == "__main__":
         [s.split(":") for s in args.supermodelfiles] if args.supermodelfiles else []
     )
 
-    main(args.modelfile, supermodelfiles, args.overridesfile, args.outfile)
+    main(
+        args.modelfile,
+        supermodelfiles,
+        args.overridesfile,
+        args.outfile,
+        args.accessors,
+    )
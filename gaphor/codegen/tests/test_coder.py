@@ -6,6 +6,7 @@ from gaphor.codegen.coder import (
     attribute,
     bases,
     class_declaration,
+    coder,
     is_enumeration,
     is_in_profile,
     is_in_toplevel_package,
@@ -284,3 +285,10 @@ def test_replace_simple_attribute(uml_metamodel: ElementFactory):
     assert a.name == "specification"
     assert a.typeValue == "str"
     assert not a.type
+
+
+def test_coder_with_specialized_accessors():
+    header = next(iter(coder(ElementFactory(), [], None, accessors=True)))
+
+    assert "fastassociation as association" in header
+    assert "fastattribute as _attribute" in header
@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 from functools import singledispatch
 
+from gaphor.core.changeset.index import PendingChangeIndex
 from gaphor.core.modeling.coremodel import (
     ElementChange,
     RefChange,
@@ -13,7 +16,16 @@ def applicable(change, element_factory) -> bool:
 
 
 @singledispatch
-def apply_change(change, element_factory, modeling_factory):
+def apply_change(
+    change,
+    element_factory,
+    modeling_factory,
+    pending_changes: PendingChangeIndex | None = None,
+):
+    """Apply a pending change to the model.
+
+    Provide a ``pending_changes`` index when applying many changes.
+    """
     raise NotImplementedError
 
 
@@ -26,7 +38,7 @@ def _(change: ElementChange, element_factory) -> bool:
 
 
 @apply_change.register
-def _(change: ElementChange, element_factory, modeling_factory):
+def _(change: ElementChange, element_factory, modeling_factory, pending_changes=None):
     if change.applied:
         return
     if change.op == "add":
@@ -51,7 +63,7 @@ def _(change: ValueChange, element_factory):
 
 
 @apply_change.register
-def _(change: ValueChange, element_factory, modeling_factory):
+def _(change: ValueChange, element_factory, modeling_factory, pending_changes=None):
     if change.applied:
         return
     element = element_factory[change.element_id]
@@ -68,7 +80,7 @@ def _(change: RefChange, element_factory):
 
 
 @apply_change.register
-def _(change: RefChange, element_factory, modeling_factory):
+def _(change: RefChange, element_factory, modeling_factory, pending_changes=None):
     if change.applied:
         return
     element = element_factory[change.element_id]
@@ -85,13 +97,9 @@ def _(change: RefChange, element_factory, modeling_factory):
     change.applied = True
 
     if prop and prop.opposite:
-        if other := next(
-            element_factory.select(
-                lambda e: isinstance(e, RefChange)
-                and e.element_id == change.property_ref
-                and e.property_ref == change.element_id
-                and e.property_name == prop.opposite
-            ),
-            None,
+        if pending_changes is None:
+            pending_changes = PendingChangeIndex(element_factory)
+        if other := pending_changes.ref_change(
+            change.property_ref, change.element_id, prop.opposite
         ):
             other.applied = True
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
+from gaphor.core.modeling.coremodel import (
+    ElementChange,
+    PendingChange,
+    RefChange,
+    ValueChange,
+)
+
+
+class PendingChangeIndex:
+    """Look up pending changes by element id and property reference.
+
+    Pending changes are created once, when models are compared, and
+    only their ``applied`` state changes afterwards. The index is a
+    snapshot of the pending changes in a model: create a new index
+    if changes are added or removed.
+    """
+
+    def __init__(self, element_factory):
+        self._element_changes: dict[str, ElementChange] = {}
+        self._value_changes: dict[str, list[ValueChange]] = defaultdict(list)
+        self._ref_changes: dict[str, list[RefChange]] = defaultdict(list)
+        self._ref_change_by_key: dict[tuple[str, str, str], RefChange] = {}
+
+        for change in element_factory.select(PendingChange):
+            element_id = change.element_id
+            if isinstance(change, ElementChange):
+                self._element_changes.setdefault(element_id, change)
+            elif isinstance(change, ValueChange):
+                self._value_changes[element_id].append(change)
+            elif isinstance(change, RefChange):
+                self._ref_changes[element_id].append(change)
+                self._ref_change_by_key.setdefault(
+                    (element_id, change.property_ref, change.property_name), change
+                )
+
+    def element_change(self, element_id: str) -> ElementChange | None:
+        """The (first) change that adds or removes an element."""
+        return self._element_changes.get(element_id)
+
+    def value_changes(self, element_id: str) -> list[ValueChange]:
+        """Attribute changes for an element, in model order."""
+        return self._value_changes.get(element_id, [])
+
+    def value_change(self, element_id: str, property_name: str) -> ValueChange | None:
+        return next(
+            (
+                c
+                for c in self.value_changes(element_id)
+                if c.property_name == property_name
+            ),
+            None,
+        )
+
+    def ref_changes(self, element_id: str) -> list[RefChange]:
+        """Reference changes for an element, in model order."""
+        return self._ref_changes.get(element_id, [])
+
+    def ref_change(
+        self, element_id: str, property_ref: str, property_name: str
+    ) -> RefChange | None:
+        """The reference change from ``element_id`` to ``property_ref``."""
+        return self._ref_change_by_key.get((element_id, property_ref, property_name))
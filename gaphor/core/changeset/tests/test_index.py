@@ -0,0 +1,70 @@
+from gaphor.core.changeset.apply import apply_change
+from gaphor.core.changeset.index import PendingChangeIndex
+from gaphor.core.modeling import (
+    Diagram,
+    Element,
+    ElementChange,
+    RefChange,
+    ValueChange,
+)
+
+
+def test_index_element_change(element_factory):
+    change: ElementChange = element_factory.create(ElementChange)
+    change.element_id = "1234"
+
+    index = PendingChangeIndex(element_factory)
+
+    assert index.element_change("1234") is change
+    assert index.element_change("5678") is None
+
+
+def test_index_value_changes(element_factory):
+    name: ValueChange = element_factory.create(ValueChange)
+    name.element_id = "1234"
+    name.property_name = "name"
+    body: ValueChange = element_factory.create(ValueChange)
+    body.element_id = "1234"
+    body.property_name = "body"
+
+    index = PendingChangeIndex(element_factory)
+
+    assert index.value_changes("1234") == [name, body]
+    assert index.value_change("1234", "body") is body
+    assert index.value_changes("5678") == []
+
+
+def test_index_ref_changes(element_factory):
+    change: RefChange = element_factory.create(RefChange)
+    change.element_id = "1234"
+    change.property_name = "ownedDiagram"
+    change.property_ref = "5678"
+
+    index = PendingChangeIndex(element_factory)
+
+    assert index.ref_changes("1234") == [change]
+    assert index.ref_change("1234", "5678", "ownedDiagram") is change
+    assert index.ref_change("5678", "1234", "element") is None
+
+
+def test_apply_opposite_relation_with_index(element_factory, modeling_language):
+    element = element_factory.create(Element)
+    diagram = element_factory.create(Diagram)
+
+    change: RefChange = element_factory.create(RefChange)
+    change.op = "add"
+    change.element_id = element.id
+    change.property_name = "ownedDiagram"
+    change.property_ref = diagram.id
+
+    other: RefChange = element_factory.create(RefChange)
+    other.op = "update"
+    other.element_id = diagram.id
+    other.property_name = "element"
+    other.property_ref = element.id
+
+    index = PendingChangeIndex(element_factory)
+    apply_change(change, element_factory, modeling_language, index)
+
+    assert change.applied
+    assert other.applied
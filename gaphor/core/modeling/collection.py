@@ -133,6 +133,25 @@ class collection(Generic[T]):
         self.object.handle(AssociationUpdated(self.object, self.property))
 
 
+class emptycollection(collection[T]):
+    """Collection for an association that has no items stored.
+
+    It is handed out instead of storing an empty collection on the
+    element. Items added to the association are kept in a collection
+    stored on the element, which this collection refers to from then on.
+    """
+
+    def __init__(self, property, object, type: Type[T]):
+        self.property = property
+        self.object = object
+        self.type = type
+
+    @property
+    def items(self) -> list[T]:  # type: ignore[override]
+        c = self.property.stored(self.object)
+        return [] if c is None else c.items  # type: ignore[no-any-return]
+
+
 _recurseproxy_trigger = slice(None, None, None)
 
 
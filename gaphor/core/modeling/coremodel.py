@@ -5,11 +5,11 @@
 from __future__ import annotations
 
 from gaphor.core.modeling.properties import (
-    association,
-    attribute as _attribute,
     derived,
-    derivedunion,
-    enumeration as _enumeration,
+    fastassociation as association,
+    fastattribute as _attribute,
+    fastderivedunion as derivedunion,
+    fastenumeration as _enumeration,
     redefine,
     relation_many,
     relation_one,
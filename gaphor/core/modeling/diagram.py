@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import (
@@ -281,6 +282,7 @@ class Diagram(Element):
         self._compiled_style_sheet: CompiledStyleSheet | None = None
         self._registered_views: set[gaphas.model.View] = set()
         self._dirty_items: set[gaphas.Item] = set()
+        self._updates_deferred = False
 
         self._watcher = self.watcher()
         self._watcher.watch("ownedPresentation", self._owned_presentation_changed)
@@ -305,18 +307,20 @@ class Diagram(Element):
         if event and event.property is not Presentation.parent:
             return
 
-        ownedPresentation = self.ownedPresentation
+        children: dict[Presentation | None, list[Presentation]] = {}
+        for item in self.ownedPresentation:
+            children.setdefault(item.parent, []).append(item)
 
         def traverse_items(parent=None) -> Iterable[Presentation]:
-            for item in ownedPresentation:
-                if item.parent is parent:
-                    yield item
-                    yield from traverse_items(item)
+            for item in children.get(parent, ()):
+                yield item
+                yield from traverse_items(item)
 
         new_order = sorted(
             traverse_items(), key=lambda e: int(isinstance(e, gaphas.Line))
         )
-        self.ownedPresentation.order(new_order.index)
+        positions = {item: n for n, item in enumerate(new_order)}
+        self.ownedPresentation.order(positions.__getitem__)
 
     @property
     def styleSheet(self) -> StyleSheet | None:
@@ -424,8 +428,15 @@ class Diagram(Element):
         All items that requested an update via :meth:`request_update`
         are now updates. If an item has an ``update(context: UpdateContext)``
         method, it's invoked. Constraints are solved.
+
+        While updates are deferred, items are only marked dirty.
+        The shapes of ``dirty_items`` are sized again.
         """
+        for item in dirty_items:
+            item.invalidate_shapes()
         self._update_dirty_items(dirty_items)
+        if self._updates_deferred:
+            return
 
         # Clear our (cached) style sheet first
         self._compiled_style_sheet = None
@@ -443,6 +454,20 @@ class Diagram(Element):
 
         self._dirty_items.clear()
 
+    @contextmanager
+    def deferred_updates(self):
+        """Postpone updates until the next update outside this context.
+
+        Items are not updated, so no text is measured. This allows
+        models to be loaded and queried without a text rendering
+        backend.
+        """
+        self._updates_deferred = True
+        try:
+            yield self
+        finally:
+            self._updates_deferred = False
+
     # gaphas.model.Model protocol:
 
     @property
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import TYPE_CHECKING, Callable, Iterator, Protocol, TypeVar, overload
 from uuid import uuid1
 
@@ -41,8 +42,9 @@ Id = str
 
 
 def uuid_generator():
+    # Ids are interned, like the ids of loaded elements
     while True:
-        yield str(uuid1())
+        yield sys.intern(str(uuid1()))
 
 
 _generator: Iterator[str] = uuid_generator()
@@ -70,6 +72,9 @@ def self_and_owners(element: Element | None) -> Iterator[Element]:
 class Element:
     """Base class for all model data classes."""
 
+    # Core fields live in slots, property values in the instance dict
+    __slots__ = ("_id", "_model", "_unlink_lock", "__dict__", "__weakref__")
+
     note: attribute[str] = attribute("note", str)
     comment: relation_many[Comment]
     ownedDiagram: relation_many[Diagram]
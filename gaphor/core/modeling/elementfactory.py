@@ -25,6 +25,7 @@ from gaphor.core.modeling.event import (
     ModelFlushed,
 )
 from gaphor.core.modeling.presentation import Presentation
+from gaphor.core.modeling.query import ElementIndexes, Query
 
 T = TypeVar("T", bound=Element)
 P = TypeVar("P", bound=Presentation)
@@ -68,6 +69,7 @@ class ElementFactory(Service):
         self.event_manager: EventHandler | None = event_manager
         self.element_dispatcher = element_dispatcher
         self._elements: dict[Id, Element] = OrderedDict()
+        self.indexes = ElementIndexes(self.values)
         if event_manager:
             event_manager.subscribe(self._on_unlink_event)
 
@@ -111,6 +113,7 @@ class ElementFactory(Service):
         with self.block_events(event_recorder):
             element = type(id=id, **type_args)  # type: ignore[arg-type]
         self._elements[id] = element
+        self.indexes.add(element)
         self.handle(ElementCreated(self, element, diagram))
         event_recorder.replay()
         return element
@@ -166,6 +169,23 @@ class ElementFactory(Service):
         """
         return list(self.select(expression))
 
+    @overload
+    def query(self, type: type[T]) -> Query[T]:
+        ...
+
+    @overload
+    def query(self, type: None = None) -> Query[Element]:
+        ...
+
+    def query(self, type=None):
+        """Query elements, optionally of a specific type.
+
+        Queries use indexes on element type, name and owner. See
+        :mod:`gaphor.core.modeling.query`.
+        """
+        query = Query(self)
+        return query.of_type(type) if type else query
+
     def keys(self) -> Iterator[Id]:
         """Return a list with all id's in the factory."""
         return iter(self._elements.keys())
@@ -198,6 +218,7 @@ class ElementFactory(Service):
             for element in self.lselect():
                 element.unlink()
 
+        self.indexes.clear()
         self.handle(ModelFlushed(self))
 
     @contextmanager
@@ -216,6 +237,7 @@ class ElementFactory(Service):
 
     def handle(self, event: object) -> None:
         """Handle events coming from elements."""
+        self.indexes.handle(event)
         if self.event_manager:
             self.event_manager.handle(event)
         elif isinstance(event, UnlinkEvent):
@@ -230,6 +252,7 @@ class ElementFactory(Service):
             del self._elements[element.id]
         except KeyError:
             return
+        self.indexes.remove(element)
         if self.event_manager:
             self.event_manager.handle(
                 ElementDeleted(self, event.element, event.diagram)
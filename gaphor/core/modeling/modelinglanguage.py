@@ -1,9 +1,47 @@
 """C4 Model Language entrypoint."""
 
+from __future__ import annotations
+
+from collections.abc import Iterable
+
 from gaphor.abc import ModelingLanguage
 from gaphor.core.modeling import coremodel
 
 
+class ElementTypeTable:
+    """Element types by name, for a sequence of modeling languages.
+
+    Languages are consulted in order: the first language that defines
+    a name takes precedence. Element types found are kept, so each
+    name is looked up in the languages only once. Unknown names are not
+    kept, so the table can not grow beyond the names the languages
+    define. Create a new table if the languages change.
+    """
+
+    def __init__(self, modeling_languages: Iterable[ModelingLanguage]):
+        self._modeling_languages = tuple(modeling_languages)
+        self._element_types: dict[str, type] = {}
+
+    def lookup(self, name: str) -> type | None:
+        try:
+            return self._element_types[name]
+        except KeyError:
+            element_type = next(
+                (
+                    element_type
+                    for provider in self._modeling_languages
+                    if (element_type := provider.lookup_element(name))
+                ),
+                None,
+            )
+            if element_type:
+                self._element_types[name] = element_type
+            return element_type
+
+    def __len__(self) -> int:
+        return len(self._element_types)
+
+
 class CoreModelingLanguage(ModelingLanguage):
     @property
     def name(self) -> str:
@@ -29,7 +67,7 @@ class MockModelingLanguage(ModelingLanguage):
     """This class can be used to instantly combine modeling languages."""
 
     def __init__(self, *modeling_languages: ModelingLanguage):
-        self._modeling_languages = modeling_languages
+        self._element_types = ElementTypeTable(modeling_languages)
 
     @property
     def name(self) -> str:
@@ -48,13 +86,4 @@ class MockModelingLanguage(ModelingLanguage):
         return ()
 
     def lookup_element(self, name):
-        return next(
-            filter(
-                None,
-                [
-                    provider.lookup_element(name)
-                    for provider in self._modeling_languages
-                ],
-            ),
-            None,
-        )
+        return self._element_types.lookup(name)
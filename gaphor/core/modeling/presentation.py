@@ -54,11 +54,19 @@ class Presentation(Matrices, Element, Generic[S]):
     def request_update(self) -> None:
         """Mark this presentation object for update.
 
-        Updates are orchestrated by diagrams.
+        Updates are orchestrated by diagrams. Since the content of the
+        item may have changed, its shapes are sized again.
         """
+        self.invalidate_shapes()
         if self.diagram:
             self.diagram.request_update(self)
 
+    def invalidate_shapes(self) -> None:
+        """Size the shapes of this item again on the next update.
+
+        Items that only move keep the size of their shapes.
+        """
+
     def watch(self, path: str, handler: Handler | None = None) -> Self:
         """Watch a certain path of elements starting with ``self``.
 
@@ -135,6 +143,8 @@ class Presentation(Matrices, Element, Generic[S]):
         if new_parent := event.new_value:
             new_parent.matrix_i2c.add_handler(self._on_matrix_changed)
 
+        # Styles can depend on the parent item
+        self.invalidate_shapes()
         self._on_matrix_changed(None, ())
 
     def _on_matrix_changed(self, matrix, old_value):
@@ -142,7 +152,8 @@ class Presentation(Matrices, Element, Generic[S]):
             self.matrix_i2c.set(*(self.matrix * self.parent.matrix_i2c))
         else:
             self.matrix_i2c.set(*self.matrix)
-        self.request_update()
+        if self.diagram:
+            self.diagram.request_update(self)
         if matrix is self.matrix:
             self.handle(MatrixUpdated(self, old_value))
 
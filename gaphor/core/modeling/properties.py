@@ -39,7 +39,7 @@ from typing import (
     overload,
 )
 
-from gaphor.core.modeling.collection import collection
+from gaphor.core.modeling.collection import collection, emptycollection
 from gaphor.core.modeling.event import (
     AssociationAdded,
     AssociationDeleted,
@@ -55,7 +55,17 @@ from gaphor.core.modeling.event import (
     RedefinedSet,
 )
 
-__all__ = ["attribute", "enumeration", "association", "derivedunion", "redefine"]
+__all__ = [
+    "attribute",
+    "enumeration",
+    "association",
+    "derivedunion",
+    "redefine",
+    "fastattribute",
+    "fastenumeration",
+    "fastassociation",
+    "fastderivedunion",
+]
 
 
 log = logging.getLogger(__name__)
@@ -363,8 +373,18 @@ class association(umlproperty):
     def _get_many(self, obj) -> collection[T]:
         v: collection[T] | None = getattr(obj, self._name, None)
         if v is None:
-            # Create the empty collection here since it may
-            # be used to add.
+            # Most associations are never written. Only store a
+            # collection once an item is added.
+            return emptycollection(self, obj, self.type)
+        return v
+
+    def stored(self, obj) -> T | collection[T] | None:
+        """The value stored on the element, or None if there is none."""
+        return getattr(obj, self._name, None)
+
+    def _collection(self, obj) -> collection[T]:
+        v: collection[T] | None = getattr(obj, self._name, None)
+        if v is None:
             v = collection(self, obj, self.type)
             setattr(obj, self._name, v)
         return v
@@ -418,7 +438,7 @@ class association(umlproperty):
             raise TypeError(f"Value should be of type {self.type.__name__}")
 
         # Set the actual value
-        c: collection = self._get_many(obj)
+        c: collection = self._collection(obj)
         if value in c:
             if from_load:
                 c.items.remove(value)
@@ -484,8 +504,8 @@ class association(umlproperty):
 
         self._del_opposite(obj, value, from_opposite)
 
-        c: collection
-        if c := self._get_many(obj):
+        c: collection | None
+        if c := getattr(obj, self._name, None):
             items: list = c.items
             try:
                 index = items.index(value)
@@ -716,7 +736,11 @@ class derived(umlproperty, Generic[T]):
 
 
 def object_has_property(obj, prop):
-    found = getattr(type(obj), prop.name, None)
+    return class_has_property(type(obj), prop)
+
+
+def class_has_property(cls, prop):
+    found = getattr(cls, prop.name, None)
     while isinstance(found, redefine):
         found = found.original
     return prop is found
@@ -747,7 +771,9 @@ class derivedunion(derived[T]):
             if s is exclude or not object_has_property(obj, s):
                 continue
 
-            tmp: Iterable[T] | T | None = s.get(obj)
+            tmp: Iterable[T] | T | None = (
+                s.stored(obj) if isinstance(s, association) else s.get(obj)
+            )
             if isinstance(tmp, Iterable):
                 u.update(tmp)
             elif tmp:
@@ -905,3 +931,92 @@ class redefine(umlproperty):
                     + str(event)
                     + " for redefined association"
                 )
+
+
+# The classes below are drop-in replacements for the generic properties.
+# Reading a value does not dispatch through ``get()``, but is done right
+# in ``__get__``. Setting values and events are the same. The code
+# generator uses them for generated models (``coder.py --accessors``).
+
+
+class fastattribute(attribute[T]):
+    """Attribute with a specialized accessor."""
+
+    def __get__(self, obj, class_=None):
+        return getattr(obj, self._name, self.default) if obj else self
+
+
+class fastenumeration(enumeration):
+    """Enumeration with a specialized accessor."""
+
+    def __get__(self, obj, class_=None):
+        return getattr(obj, self._name, self.default) if obj else self
+
+
+class fastassociation(association):
+    """Association with a specialized accessor."""
+
+    def __get__(self, obj, class_=None):
+        if not obj:
+            return self
+        v = getattr(obj, self._name, None)
+        if v is None and self.upper != 1:
+            return emptycollection(self, obj, self.type)
+        return v
+
+
+class fastderivedunion(derivedunion[T]):
+    """Derived union with a specialized accessor.
+
+    The subsets that apply to an element class are looked up once per
+    class, instead of for every update of the union.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        type: type[T],
+        lower: Lower = 0,
+        upper: Upper = "*",
+        *subsets: relation,
+    ):
+        self._class_subsets: dict[type, list[tuple[umlproperty, Callable, bool]]] = {}
+        super().__init__(name, type, lower, upper, *subsets)
+
+    def __get__(self, obj, class_=None):
+        if not obj:
+            return self
+        uc = getattr(obj, self._name, None)
+        if uc is None or uc.version != self.version:
+            uc = self._update(obj)
+        return uc.data
+
+    def add(self, subset):
+        super().add(subset)
+        self._class_subsets.clear()
+        self.version += 1
+
+    def _subsets(self, cls) -> list[tuple[umlproperty, Callable, bool]]:
+        try:
+            return self._class_subsets[cls]
+        except KeyError:
+            # Read stored association values directly, so no empty
+            # collections are created for the union
+            subsets = self._class_subsets[cls] = [
+                (s, s.stored if isinstance(s, association) else s.get, s.upper == 1)
+                for s in self.subsets
+                if class_has_property(cls, s)
+            ]
+            return subsets
+
+    def _union(self, obj, exclude=None):
+        u: set[T] = set()
+        for s, get, single in self._subsets(type(obj)):
+            if s is exclude:
+                continue
+            if tmp := get(obj):
+                if single:
+                    u.add(tmp)
+                else:
+                    u.update(tmp)
+        return list(u)
@@ -0,0 +1,286 @@
+"""Query model elements.
+
+Queries are composed from type filters, attribute filters and
+association traversals::
+
+    element_factory.query(UML.Class).where(name="Car").traverse("ownedAttribute")
+
+Queries on element type, name and owner are served from secondary
+indexes. Indexes are created on first use, and kept up to date from
+element events. Use :meth:`Query.explain` to see how a query is
+executed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
+
+from gaphor.core.modeling.collection import collection
+from gaphor.core.modeling.element import Element
+from gaphor.core.modeling.event import ElementUpdated
+
+if TYPE_CHECKING:
+    from gaphor.core.modeling.elementfactory import ElementFactory
+
+T = TypeVar("T", bound=Element)
+
+
+class Index:
+    """Elements by key.
+
+    Elements are indexed on ``key(element)``. The index is updated
+    when one of the ``properties`` of an element changes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        key: Callable[[Element], Hashable],
+        properties: Iterable[str] = (),
+    ):
+        self.name = name
+        self.key = key
+        self.properties = frozenset(properties)
+        self._elements: dict[Hashable, dict[Element, None]] = {}
+        self._keys: dict[Element, Hashable] = {}
+
+    def add(self, element: Element) -> None:
+        key = self.key(element)
+        self._keys[element] = key
+        self._elements.setdefault(key, {})[element] = None
+
+    def remove(self, element: Element) -> None:
+        try:
+            key = self._keys.pop(element)
+        except KeyError:
+            return
+        elements = self._elements[key]
+        del elements[element]
+        if not elements:
+            del self._elements[key]
+
+    def update(self, element: Element) -> None:
+        if element in self._keys:
+            self.remove(element)
+            self.add(element)
+
+    def lookup(self, key: Hashable) -> Iterable[Element]:
+        return self._elements.get(key, ())
+
+    def keys(self) -> Iterable[Hashable]:
+        return self._elements.keys()
+
+    def __contains__(self, element: Element) -> bool:
+        return element in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def _name(element: Element) -> Hashable:
+    return getattr(element, "name", None)
+
+
+def _owner(element: Element) -> Hashable:
+    return element.owner  # type: ignore[no-any-return]
+
+
+INDEXES: dict[str, Callable[[], Index]] = {
+    "type": lambda: Index("type", type),
+    "name": lambda: Index("name", _name, ["name"]),
+    "owner": lambda: Index("owner", _owner, ["owner"]),
+}
+
+
+class ElementIndexes:
+    """The secondary indexes of an element factory.
+
+    Indexes are created when they're first requested.
+    """
+
+    def __init__(self, elements: Callable[[], Iterable[Element]]):
+        self._all_elements = elements
+        self._indexes: dict[str, Index] = {}
+
+    def index(self, name: str) -> Index:
+        if not (index := self._indexes.get(name)):
+            index = self._indexes[name] = INDEXES[name]()
+            for element in self._all_elements():
+                index.add(element)
+        return index
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._indexes
+
+    def add(self, element: Element) -> None:
+        for index in self._indexes.values():
+            index.add(element)
+
+    def remove(self, element: Element) -> None:
+        for index in self._indexes.values():
+            index.remove(element)
+
+    def handle(self, event: object) -> None:
+        if self._indexes and isinstance(event, ElementUpdated):
+            name = event.property.name
+            for index in self._indexes.values():
+                if name in index.properties:
+                    index.update(event.element)
+
+    def clear(self) -> None:
+        self._indexes.clear()
+
+
+class Step(NamedTuple):
+    kind: str
+    name: str
+    value: Any
+
+    def __str__(self):
+        if self.kind == "type":
+            return f"type {self.value.__name__}"
+        if self.kind == "equals":
+            return f"{self.name} = {self.value!r}"
+        if self.kind == "prefix":
+            return f"{self.name} starts with {self.value!r}"
+        if self.kind == "traverse":
+            return f"traverse {self.name}"
+        return f"filter {self.name}"
+
+    def matches(self, element: Element) -> bool:
+        if self.kind == "type":
+            return isinstance(element, self.value)
+        if self.kind == "equals":
+            return getattr(element, self.name, None) == self.value  # type: ignore[no-any-return]
+        if self.kind == "prefix":
+            value = getattr(element, self.name, None)
+            return isinstance(value, str) and value.startswith(self.value)
+        return self.value(element)  # type: ignore[no-any-return]
+
+
+def traverse(elements: Iterable[Element], association: str) -> Iterator[Element]:
+    seen: set[Element] = set()
+    for element in elements:
+        value = getattr(element, association, None)
+        for related in value if isinstance(value, collection) else (value,):
+            if isinstance(related, Element) and related not in seen:
+                seen.add(related)
+                yield related
+
+
+class Query(Generic[T]):
+    """A query on the elements of an element factory.
+
+    Queries are immutable: each method returns a new query. The query
+    is executed when it's iterated.
+    """
+
+    def __init__(self, element_factory: ElementFactory, steps: tuple[Step, ...] = ()):
+        self._element_factory = element_factory
+        self._steps = steps
+
+    def _with(self, *steps: Step) -> Query[Any]:
+        return Query(self._element_factory, self._steps + steps)
+
+    def of_type(self, type: type[T]) -> Query[T]:
+        """Elements that are an instance of ``type``."""
+        return self._with(Step("type", "type", type))
+
+    def where(self, **values: object) -> Query[T]:
+        """Elements with attributes equal to the given values."""
+        return self._with(*(Step("equals", n, v) for n, v in values.items()))
+
+    def where_prefix(self, **prefixes: str) -> Query[T]:
+        """Elements with (string) attributes that start with a prefix."""
+        return self._with(*(Step("prefix", n, p) for n, p in prefixes.items()))
+
+    def owned_by(self, owner: Element) -> Query[T]:
+        """Elements owned by ``owner``."""
+        return self.where(owner=owner)
+
+    def filter(self, predicate: Callable[[T], bool]) -> Query[T]:
+        """Elements for which ``predicate(element)`` is true."""
+        name = getattr(predicate, "__name__", "predicate")
+        return self._with(Step("filter", name, predicate))
+
+    def traverse(self, association: str) -> Query[Element]:
+        """The elements referenced by ``association``.
+
+        Each element is returned once.
+        """
+        return self._with(Step("traverse", association, None))
+
+    def _plan(self) -> tuple[Step | None, list[Step]]:
+        """The step that is served from an index, and the remaining steps."""
+        head = []
+        for step in self._steps:
+            if step.kind == "traverse":
+                break
+            head.append(step)
+
+        def priority(step):
+            if step.kind == "equals" and step.name in ("name", "owner"):
+                return 0 if step.name == "name" else 1
+            if step.kind == "prefix" and step.name == "name":
+                return 2
+            return 3 if step.kind == "type" else None
+
+        candidates = [s for s in head if priority(s) is not None]
+        if not candidates:
+            return None, list(self._steps)
+        indexed = min(candidates, key=priority)
+        return indexed, [s for s in self._steps if s is not indexed]
+
+    def explain(self) -> str:
+        """Describe how the query is executed."""
+        indexed, steps = self._plan()
+        lines = [
+            f"{_index_name(indexed)} index: {indexed}"
+            if indexed
+            else "scan all elements"
+        ]
+        lines.extend(str(step) for step in steps)
+        return "\n".join(lines)
+
+    def _source(self, indexed: Step | None) -> Iterable[Element]:
+        indexes = self._element_factory.indexes
+        if indexed is None:
+            return self._element_factory.values()
+        index = indexes.index(_index_name(indexed))
+        if indexed.kind == "type":
+            return [
+                e
+                for t in list(index.keys())
+                if issubclass(t, indexed.value)  # type: ignore[arg-type]
+                for e in index.lookup(t)
+            ]
+        if indexed.kind == "prefix":
+            return [
+                e
+                for k in list(index.keys())
+                if isinstance(k, str) and k.startswith(indexed.value)
+                for e in index.lookup(k)
+            ]
+        return list(index.lookup(indexed.value))
+
+    def __iter__(self) -> Iterator[T]:
+        indexed, steps = self._plan()
+        elements: Iterable[Element] = self._source(indexed)
+        for step in steps:
+            if step.kind == "traverse":
+                elements = traverse(elements, step.name)
+            else:
+                elements = filter(step.matches, elements)
+        return iter(elements)  # type: ignore[arg-type]
+
+    def first(self) -> T | None:
+        return next(iter(self), None)
+
+    def __repr__(self):
+        return f"<Query {'; '.join(str(s) for s in self._steps) or 'all'}>"
+
+
+def _index_name(step: Step | None) -> str:
+    assert step
+    return "type" if step.kind == "type" else step.name
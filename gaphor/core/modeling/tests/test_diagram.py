@@ -128,3 +128,22 @@ def test_order_grouped_presentations(diagram):
     example_1.parent = example_2
 
     assert list(diagram.get_all_items()) == [example_2, example_1]
+
+
+def test_deferred_updates_do_not_update_items(diagram):
+    updated = []
+
+    class UpdatedExample(Example):
+        def update(self, context):
+            updated.append(self)
+
+    example = diagram.create(UpdatedExample)
+
+    with diagram.deferred_updates():
+        diagram.update({example})
+
+    assert not updated
+
+    diagram.update()
+
+    assert updated == [example]
@@ -1,6 +1,8 @@
+import sys
+
 import pytest
 
-from gaphor.core.modeling.element import Element
+from gaphor.core.modeling.element import Element, generate_id
 
 
 def test_element_note():
@@ -15,3 +17,16 @@ def test_element_can_not_set_random_property():
 
     with pytest.raises(AttributeError):
         e.random_property = 1
+
+
+def test_element_core_fields_are_not_in_instance_dict():
+    e = Element()
+    e.note = "Hello"
+
+    assert vars(e) == {"_note": "Hello"}
+
+
+def test_generated_ids_are_interned():
+    id = generate_id()
+
+    assert sys.intern("".join(id)) is id
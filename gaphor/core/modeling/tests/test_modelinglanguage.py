@@ -1,6 +1,19 @@
 import pytest
 
-from gaphor.core.modeling.modelinglanguage import CoreModelingLanguage
+from gaphor.core.modeling.modelinglanguage import (
+    CoreModelingLanguage,
+    ElementTypeTable,
+)
+
+
+class CountingModelingLanguage(CoreModelingLanguage):
+    def __init__(self, **element_types):
+        self.element_types_ = element_types
+        self.lookups = 0
+
+    def lookup_element(self, name):
+        self.lookups += 1
+        return self.element_types_.get(name)
 
 
 def test_name():
@@ -25,3 +38,30 @@ def test_toolbox():
 
     with pytest.raises(ValueError):
         modeling_language.toolbox_definition  # noqa: B018
+
+
+def test_element_type_table_looks_up_names_once():
+    modeling_language = CountingModelingLanguage(Foo=int)
+    table = ElementTypeTable([modeling_language])
+
+    assert table.lookup("Foo") is int
+    assert table.lookup("Foo") is int
+    assert modeling_language.lookups == 1
+
+
+def test_element_type_table_does_not_keep_unknown_names():
+    table = ElementTypeTable([CountingModelingLanguage(Foo=int)])
+
+    assert table.lookup("Bar") is None
+    assert table.lookup("Baz") is None
+    assert len(table) == 0
+
+
+def test_element_type_table_first_language_takes_precedence():
+    first = CountingModelingLanguage(Foo=int)
+    second = CountingModelingLanguage(Foo=str, Bar=str)
+    table = ElementTypeTable([first, second])
+
+    assert table.lookup("Foo") is int
+    assert table.lookup("Bar") is str
+    assert second.lookups == 1
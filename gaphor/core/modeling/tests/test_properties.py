@@ -12,6 +12,10 @@ from gaphor.core.modeling.properties import (
     derived,
     derivedunion,
     enumeration,
+    fastassociation,
+    fastattribute,
+    fastderivedunion,
+    fastenumeration,
     relation_many,
     relation_one,
 )
@@ -303,6 +307,54 @@ def test_association_swap():
     assert a.one[1] is b1
 
 
+def test_reading_empty_association_does_not_store_collection():
+    class A(Element):
+        one: relation_many[B]
+
+    class B(Element):
+        pass
+
+    A.one = association("one", B, 0, "*")
+
+    a = A()
+
+    assert not a.one
+    assert "_one" not in vars(a)
+
+    a.one = B()
+
+    assert len(a.one) == 1
+    assert "_one" in vars(a)
+
+
+def test_add_to_empty_association_through_reference():
+    class A(Element):
+        one: relation_many[B]
+
+    class B(Element):
+        two: relation_one[A]
+
+    A.one = association("one", B, 0, "*", opposite="two")
+    B.two = association("two", A, 0, 1, opposite="one")
+
+    a = A()
+    b1 = B()
+    b2 = B()
+
+    one = a.one
+    one.append(b1)
+    b2.two = a
+
+    assert list(one) == [b1, b2]
+    assert one == a.one
+
+    one.remove(b1)
+    one.remove(b2)
+
+    assert not one
+    assert "_one" not in vars(a)
+
+
 def test_association_unlink_1():
     class A(Element):
         one: relation_many[B]
@@ -670,3 +722,66 @@ def test_composite():
     a.unlink()
     assert a.is_unlinked
     assert b.is_unlinked
+
+
+def test_fast_accessors():
+    class A(Element):
+        one: relation_one[A]
+        many: relation_many[A]
+        u: relation_many[A]
+
+    A.attr = fastattribute("attr", str, "default")
+    A.enum = fastenumeration("enum", ("one", "two"), "one")
+    A.one = fastassociation("one", A, upper=1)
+    A.many = fastassociation("many", A)
+    A.u = fastderivedunion("u", A, 0, "*", A.one, A.many)
+
+    a = A()
+
+    assert A.attr.name == "attr"
+    assert a.attr == "default"
+    assert a.enum == "one"
+    assert a.one is None
+    assert not a.many
+    assert not a.u
+
+    a.attr = "value"
+    a.enum = "two"
+    a.one = b = A()
+    a.many = c = A()
+
+    assert a.attr == "value"
+    assert a.enum == "two"
+    assert a.one is b
+    assert list(a.many) == [c]
+    assert set(a.u) == {b, c}
+
+    del a.one
+
+    assert list(a.u) == [c]
+
+
+def test_fast_derivedunion_only_uses_subsets_of_class():
+    class A(Element):
+        a: relation_many[A]
+        u: relation_many[A]
+
+    class B(A):
+        b: relation_many[A]
+
+    A.a = association("a", A)
+    B.b = association("b", A)
+    A.u = fastderivedunion("u", A, 0, "*", A.a)
+
+    a = A()
+    b = B()
+    a.a = A()
+    b.b = A()
+
+    assert len(a.u) == 1
+    assert len(b.u) == 0
+
+    A.u.add(B.b)
+
+    assert len(a.u) == 1
+    assert len(b.u) == 1
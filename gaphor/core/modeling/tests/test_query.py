@@ -0,0 +1,141 @@
+import pytest
+
+from gaphor import UML
+from gaphor.core.modeling import Diagram
+
+
+@pytest.fixture
+def model(element_factory):
+    package = element_factory.create(UML.Package)
+    package.name = "vehicles"
+    car = element_factory.create(UML.Class)
+    car.name = "Car"
+    car.package = package
+    cart = element_factory.create(UML.Class)
+    cart.name = "Cart"
+    bike = element_factory.create(UML.Class)
+    bike.name = "Bike"
+    bike.package = package
+    wheel = element_factory.create(UML.Property)
+    wheel.name = "wheel"
+    car.ownedAttribute = wheel
+    return package, car, cart, bike, wheel
+
+
+def test_query_all_elements(element_factory, model):
+    assert set(element_factory.query()) == set(element_factory.select())
+
+
+def test_query_by_type(element_factory, model):
+    _, car, cart, bike, _ = model
+
+    assert set(element_factory.query(UML.Class)) == {car, cart, bike}
+    assert set(element_factory.query(UML.Classifier)) == {car, cart, bike}
+    assert not list(element_factory.query(Diagram))
+
+
+def test_query_by_name(element_factory, model):
+    _, car, _, _, _ = model
+
+    assert list(element_factory.query().where(name="Car")) == [car]
+    assert not list(element_factory.query(UML.Property).where(name="Car"))
+
+
+def test_query_by_name_prefix(element_factory, model):
+    _, car, cart, _, _ = model
+
+    assert set(element_factory.query(UML.Class).where_prefix(name="Car")) == {
+        car,
+        cart,
+    }
+
+
+def test_query_by_owner(element_factory, model):
+    package, car, _, bike, _ = model
+
+    assert set(element_factory.query(UML.Class).owned_by(package)) == {car, bike}
+
+
+def test_query_traverse(element_factory, model):
+    _, _, _, _, wheel = model
+
+    query = element_factory.query(UML.Class).where(name="Car")
+
+    assert list(query.traverse("ownedAttribute")) == [wheel]
+    assert list(query.traverse("ownedAttribute").traverse("owner")) == [query.first()]
+
+
+def test_query_with_predicate(element_factory, model):
+    _, _, _, bike, _ = model
+
+    query = element_factory.query(UML.Class).filter(lambda e: e.name.endswith("e"))
+
+    assert list(query) == [bike]
+
+
+def test_query_index_follows_name_changes(element_factory, model):
+    _, car, _, _, _ = model
+    query = element_factory.query().where(name="Auto")
+
+    assert not list(query)
+
+    car.name = "Auto"
+
+    assert list(query) == [car]
+    assert not list(element_factory.query().where(name="Car"))
+
+
+def test_query_index_follows_owner_changes(element_factory, model):
+    package, _, cart, _, _ = model
+    query = element_factory.query().owned_by(package)
+
+    assert cart not in set(query)
+
+    cart.package = package
+
+    assert cart in set(query)
+
+
+def test_query_index_follows_new_and_removed_elements(element_factory, model):
+    _, car, _, _, _ = model
+    query = element_factory.query(UML.Class)
+    list(query)
+
+    truck = element_factory.create(UML.Class)
+    car.unlink()
+
+    assert truck in set(query)
+    assert car not in set(query)
+
+
+def test_indexes_are_created_on_demand(element_factory, model):
+    assert "name" not in element_factory.indexes
+
+    list(element_factory.query().where(name="Car"))
+
+    assert "name" in element_factory.indexes
+    assert "owner" not in element_factory.indexes
+
+
+def test_explain_query(element_factory):
+    query = (
+        element_factory.query(UML.Class)
+        .where(name="Car")
+        .traverse("ownedAttribute")
+        .where(name="wheel")
+    )
+
+    assert query.explain() == "\n".join(
+        [
+            "name index: name = 'Car'",
+            "type Class",
+            "traverse ownedAttribute",
+            "name = 'wheel'",
+        ]
+    )
+
+
+def test_explain_query_without_index(element_factory):
+    query = element_factory.query().filter(lambda e: True)
+
+    assert query.explain().startswith("scan all elements")
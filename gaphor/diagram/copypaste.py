@@ -17,10 +17,17 @@ and yields it. On the next invocation it will populate the element and perform
 complete the model loading.
 
 `copy()` and `paste()` use `Element`'s `save()` and `load()` methods.
+
+Copy data can be exchanged between processes with `encode_copy_data()` and
+`decode_copy_data()`.
 """
 
 from __future__ import annotations
 
+import json
+import sys
+import zlib
+from collections import deque
 from collections.abc import Iterable
 from functools import singledispatch
 from typing import Callable, Collection, Iterator, NamedTuple
@@ -31,6 +38,8 @@ from gaphor.core.modeling.element import Element, Id
 
 Opaque = object
 
+COPY_DATA_VERSION = 1
+
 
 class CopyData(NamedTuple):
     elements: dict[Id, Opaque]
@@ -47,16 +56,17 @@ def copy_full(
     if not lookup:
         return CopyData(elements=elements, diagram_refs=diagram_refs)
 
-    def copy_owned(e):
+    # Walk owned elements breadth first, so deeply nested models do not
+    # hit the recursion limit
+    owners = deque(lookup(ref) for ref in list(elements.keys()))
+    while owners:
+        e = owners.popleft()
         for o in e.ownedElement:
             if o.owner is e:
                 for ref, data in copy(o):
                     if ref not in elements:
                         elements[ref] = data
-                        copy_owned(o)
-
-    for ref in list(elements.keys()):
-        copy_owned(lookup(ref))
+                        owners.append(o)
 
     return CopyData(elements=elements, diagram_refs=diagram_refs)
 
@@ -201,7 +211,7 @@ def _paste_presentation(copy_data: PresentationCopy, _diagram, lookup):
     for name, ser in data.items():
         for value in deserialize(ser, lookup):
             item.load(name, value)
-    diagram.update({item})
+    diagram.request_update(item)
 
 
 def _paste(copy_data: Opaque, diagram: Diagram, full: bool) -> set[Presentation]:
@@ -211,6 +221,13 @@ def _paste(copy_data: Opaque, diagram: Diagram, full: bool) -> set[Presentation]
 
     # Map the original diagram ids to our new target diagram
     new_elements: dict[Id, Element] = {ref: diagram for ref in copy_data.diagram_refs}
+    diagram_items: dict[Id, Presentation] | None = None
+
+    def diagram_lookup(ref: Id) -> Presentation | None:
+        nonlocal diagram_items
+        if diagram_items is None:
+            diagram_items = {item.id: item for item in diagram.get_all_items()}
+        return diagram_items.get(ref)
 
     def element_lookup(ref: Id):
         if ref in new_elements:
@@ -229,7 +246,7 @@ def _paste(copy_data: Opaque, diagram: Diagram, full: bool) -> set[Presentation]
         if full and looked_up and not isinstance(looked_up, Presentation):
             return looked_up
 
-        if looked_up := diagram.lookup(ref):
+        if looked_up := diagram_lookup(ref):
             return looked_up
 
     for old_id in copy_data.elements.keys():
@@ -237,12 +254,97 @@ def _paste(copy_data: Opaque, diagram: Diagram, full: bool) -> set[Presentation]
             continue
         element_lookup(old_id)
 
+    new_items = {
+        e
+        for e in new_elements.values()
+        if isinstance(e, Presentation) and e.diagram is diagram
+    }
+
+    # Update all pasted items at once, instead of once per item
+    diagram.update(new_items)
+
     for element in new_elements.values():
         assert element
         element.postload()
 
-    return {
-        e
-        for e in new_elements.values()
-        if isinstance(e, Presentation) and e.diagram is diagram
+    return new_items
+
+
+def encode_copy_data(copy_data: CopyData) -> bytes:
+    """Encode copy data as compressed JSON.
+
+    Classes are stored by name. Element values are already encoded by
+    `serialize()`.
+    """
+
+    def encode(value):
+        if isinstance(value, type):
+            return {"__class__": f"{value.__module__}:{value.__qualname__}"}
+        elif isinstance(value, tuple) and hasattr(value, "_fields"):
+            return {
+                "__copy__": f"{type(value).__module__}:{type(value).__qualname__}",
+                "fields": [encode(v) for v in value],
+            }
+        elif isinstance(value, dict):
+            return {k: encode(v) for k, v in value.items()}
+        elif isinstance(value, list):
+            return {"__list__": [encode(v) for v in value]}
+        elif isinstance(value, tuple):
+            return [encode(v) for v in value]
+        return value
+
+    data = {
+        "version": COPY_DATA_VERSION,
+        "elements": encode(copy_data.elements),
+        "diagram_refs": sorted(copy_data.diagram_refs),
     }
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+
+def decode_copy_data(data: bytes) -> CopyData:
+    """Decode copy data created by `encode_copy_data()`.
+
+    Only element classes and copy types known to `paste()` are
+    accepted. Modules are not imported.
+    """
+
+    def lookup_class(name):
+        module_name, _, qualname = name.partition(":")
+        obj = sys.modules.get(module_name)
+        for attr in qualname.split("."):
+            obj = getattr(obj, attr, None)
+        if not isinstance(obj, type):
+            raise ValueError(f"Unknown class {name} in copy data")
+        return obj
+
+    def decode(value):
+        if isinstance(value, dict):
+            if "__class__" in value:
+                cls = lookup_class(value["__class__"])
+                if not issubclass(cls, Element):
+                    raise ValueError(f"{cls} is not a model element")
+                return cls
+            elif "__copy__" in value:
+                cls = lookup_class(value["__copy__"])
+                if not issubclass(cls, tuple) or cls not in paste.registry:
+                    raise ValueError(f"No paster for {cls}")
+                return cls(*(decode(v) for v in value["fields"]))
+            elif "__list__" in value:
+                return [decode(v) for v in value["__list__"]]
+            return {k: decode(v) for k, v in value.items()}
+        elif isinstance(value, list):
+            return tuple(decode(v) for v in value)
+        return value
+
+    try:
+        decoded = json.loads(zlib.decompress(data))
+    except (zlib.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid copy data") from e
+
+    if decoded.get("version") != COPY_DATA_VERSION:
+        raise ValueError(f"Unsupported copy data version {decoded.get('version')}")
+
+    return CopyData(
+        elements={ref: decode(value) for ref, value in decoded["elements"].items()},
+        diagram_refs=set(decoded["diagram_refs"]),
+    )
@@ -1,12 +1,17 @@
 """Service dedicated to exporting diagrams to a variety of file formats."""
 
+from __future__ import annotations
+
 import re
+from collections.abc import Callable, Mapping
+from typing import Any, NamedTuple
 
 import cairo
 from gaphas.geometry import Rectangle
-from gaphas.painter import FreeHandPainter, PainterChain
+from gaphas.painter import FreeHandPainter
 
 from gaphor.core.modeling.diagram import StyledDiagram
+from gaphor.core.styling import Color
 from gaphor.diagram.painter import DiagramTypePainter, ItemPainter
 
 
@@ -14,16 +19,45 @@ def escape_filename(diagram_name):
     return re.sub("\\W+", "_", diagram_name)
 
 
-def render(diagram, new_surface, padding=8, write_to_png=None) -> None:
+class Recording(NamedTuple):
+    """A diagram, painted on recording surfaces."""
+
+    items: cairo.RecordingSurface
+    diagram_type: cairo.RecordingSurface
+    bounding_box: Rectangle
+    type_padding: float
+    padding: float
+    background_color: Color | None
+
+
+def record_diagram(diagram, padding=8) -> Recording:
+    """Paint a diagram once, so it can be replayed on several surfaces."""
     diagram.update(diagram.ownedPresentation)
 
-    painter = new_painter(diagram)
+    # The recordings provide the bounding box (including font metrics)
+    items = record(new_painter(diagram), diagram.get_all_items())
+    diagram_type = record(DiagramTypePainter(diagram), ())
+
+    bounding_box = ink_extents(items)
+    type_bounding_box = ink_extents(diagram_type)
+    type_padding = type_bounding_box.height
+    if type_padding:
+        bounding_box += type_bounding_box
+
+    return Recording(
+        items,
+        diagram_type,
+        bounding_box,
+        type_padding,
+        padding,
+        diagram.style(StyledDiagram(diagram)).get("background-color"),
+    )
 
-    # Update bounding boxes with a temporary Cairo Context
-    # (used for stuff like calculating font metrics)
-    bounding_box = calc_bounding_box(diagram, painter)
-    type_padding = diagram_type_height(diagram)
 
+def replay(recording: Recording, new_surface, write_to_png=None) -> None:
+    bounding_box = recording.bounding_box
+    padding = recording.padding
+    type_padding = recording.type_padding
     w, h = (
         bounding_box.width + 2 * padding,
         bounding_box.height + 2 * padding + type_padding,
@@ -32,61 +66,102 @@ def render(diagram, new_surface, padding=8, write_to_png=None) -> None:
     with new_surface(w, h) as surface:
         cr = cairo.Context(surface)
 
-        bg_color = diagram.style(StyledDiagram(diagram)).get("background-color")
+        bg_color = recording.background_color
         if bg_color and bg_color[3]:
             cr.rectangle(0, 0, w, h)
             cr.set_source_rgba(*bg_color)
             cr.fill()
 
-        cr.translate(
-            -bounding_box.x + padding, -bounding_box.y + padding + type_padding
+        cr.set_source_surface(
+            recording.items,
+            -bounding_box.x + padding,
+            -bounding_box.y + padding + type_padding,
         )
-        painter.paint(diagram.get_all_items(), cr)
+        cr.paint()
+        cr.set_source_surface(recording.diagram_type, 0, 0)
+        cr.paint()
         cr.show_page()
 
         if write_to_png:
             surface.write_to_png(write_to_png)
 
 
-def diagram_type_height(diagram):
-    if not diagram.diagramType:
-        return 0
-
-    bounding_box = calc_bounding_box(diagram, DiagramTypePainter(diagram))
-
-    return bounding_box.height
+def render(diagram, new_surface, padding=8, write_to_png=None) -> None:
+    replay(record_diagram(diagram, padding), new_surface, write_to_png)
 
 
-def calc_bounding_box(diagram, painter):
+def record(painter, items) -> cairo.RecordingSurface:
     surface = cairo.RecordingSurface(cairo.Content.COLOR_ALPHA, None)
     cr = cairo.Context(surface)
-    painter.paint(diagram.get_all_items(), cr)
+    painter.paint(items, cr)
+    return surface
+
+
+def ink_extents(surface: cairo.RecordingSurface) -> Rectangle:
     return Rectangle(*surface.ink_extents())
 
 
 def save_svg(filename, diagram):
-    render(diagram, lambda w, h: cairo.SVGSurface(filename, w, h))
+    replay_svg(filename, record_diagram(diagram))
 
 
 def save_png(filename, diagram):
-    render(
-        diagram,
+    replay_png(filename, record_diagram(diagram))
+
+
+def save_pdf(filename, diagram):
+    replay_pdf(filename, record_diagram(diagram))
+
+
+def save_eps(filename, diagram):
+    replay_eps(filename, record_diagram(diagram))
+
+
+def save_formats(filenames: Mapping[str, Any], diagram) -> None:
+    """Save a diagram in several formats at once.
+
+    ``filenames`` maps a format (``svg``, ``png``, ``pdf`` or ``eps``)
+    to a file name. The diagram is painted only once.
+    """
+    if unknown := set(filenames) - set(REPLAY_FUNCTIONS):
+        raise ValueError(f"Unknown file format(s): {', '.join(sorted(unknown))}")
+
+    recording = record_diagram(diagram)
+    for format, filename in filenames.items():
+        REPLAY_FUNCTIONS[format](filename, recording)
+
+
+def replay_svg(filename, recording: Recording) -> None:
+    replay(recording, lambda w, h: cairo.SVGSurface(filename, w, h))
+
+
+def replay_png(filename, recording: Recording) -> None:
+    replay(
+        recording,
         lambda w, h: cairo.ImageSurface(cairo.FORMAT_ARGB32, int(w + 1), int(h + 1)),
         write_to_png=filename,
     )
 
 
-def save_pdf(filename, diagram):
-    render(diagram, lambda w, h: cairo.PDFSurface(filename, w, h))
+def replay_pdf(filename, recording: Recording) -> None:
+    replay(recording, lambda w, h: cairo.PDFSurface(filename, w, h))
 
 
-def save_eps(filename, diagram):
+def replay_eps(filename, recording: Recording) -> None:
     def new_surface(w, h):
         surface = cairo.PSSurface(filename, w, h)
         surface.set_eps(True)
         return surface
 
-    render(diagram, new_surface)
+    replay(recording, new_surface)
+
+
+REPLAY_FUNCTIONS: dict[str, Callable[[Any, Recording], None]] = {
+    "svg": replay_svg,
+    "png": replay_png,
+    "pdf": replay_pdf,
+    "eps": replay_eps,
+}
 
 
 def new_painter(diagram):
@@ -95,4 +170,4 @@ def new_painter(diagram):
     item_painter = (
         FreeHandPainter(ItemPainter(), sloppiness) if sloppiness else ItemPainter()
     )
-    return PainterChain().append(item_painter).append(DiagramTypePainter(diagram))
+    return item_painter
@@ -1,7 +1,9 @@
 """PictureItem diagram item."""
 
 import base64
+import hashlib
 import io
+from collections import OrderedDict
 
 import cairo
 from PIL import Image
@@ -11,6 +13,54 @@ from gaphor.diagram.presentation import ElementPresentation
 from gaphor.diagram.shapes import Box, IconBox
 from gaphor.diagram.support import represents
 
+# Maximum amount of memory used by decoded pictures
+MAX_SURFACE_CACHE_SIZE = 64 * 1024 * 1024
+
+
+class SurfaceCache:
+    """Decoded picture surfaces, by content hash.
+
+    Least recently used surfaces are evicted once the total size of the
+    cached image data exceeds ``max_size`` bytes.
+    """
+
+    def __init__(self, max_size: int = MAX_SURFACE_CACHE_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._surfaces: OrderedDict[str, cairo.ImageSurface] = OrderedDict()
+
+    def get(self, key: str) -> cairo.ImageSurface | None:
+        if surface := self._surfaces.get(key):
+            self._surfaces.move_to_end(key)
+        return surface
+
+    def put(self, key: str, surface: cairo.ImageSurface) -> None:
+        if key in self._surfaces:
+            self.size -= _surface_size(self._surfaces.pop(key))
+        self._surfaces[key] = surface
+        self.size += _surface_size(surface)
+        while self.size > self.max_size and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.size -= _surface_size(evicted)
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
+def _surface_size(surface: cairo.ImageSurface) -> int:
+    return surface.get_stride() * surface.get_height()  # type: ignore[no-any-return]
+
+
+def content_hash(content: str) -> str:
+    return hashlib.blake2b(content.encode("ascii"), digest_size=16).hexdigest()
+
+
+surface_cache = SurfaceCache()
+
 
 @represents(Picture)
 class PictureItem(ElementPresentation):
@@ -21,8 +71,13 @@ class PictureItem(ElementPresentation):
         self.height = 200
 
         self.shape = IconBox(Box(draw=self.draw_image))
+        self._content_key: str | None = None
+
+        self.watch("subject[Picture].content", self._on_content_changed)
 
-        self.watch("subject[Picture].content")
+    def _on_content_changed(self, event=None):
+        self._content_key = None
+        self.request_update()
 
     def create_default_surface(self):
         width = int(self.width)
@@ -58,10 +113,15 @@ class PictureItem(ElementPresentation):
         return 1.0, surface
 
     def create_content_surface(self):
-        base64_img_bytes = self.subject.content.encode("ascii")
-        image_data = base64.decodebytes(base64_img_bytes)
-        image = Image.open(io.BytesIO(image_data))
-        surface = self._from_pil(image)
+        if not (key := self._content_key):
+            key = self._content_key = content_hash(self.subject.content)
+
+        if not (surface := surface_cache.get(key)):
+            base64_img_bytes = self.subject.content.encode("ascii")
+            image_data = base64.decodebytes(base64_img_bytes)
+            image = Image.open(io.BytesIO(image_data))
+            surface = self._from_pil(image)
+            surface_cache.put(key, surface)
 
         surface_width = surface.get_width()
         surface_height = surface.get_height()
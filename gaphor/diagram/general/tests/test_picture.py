@@ -0,0 +1,76 @@
+"""Unit tests for the picture item."""
+
+import base64
+import io
+
+import cairo
+import pytest
+from PIL import Image
+
+from gaphor.core.modeling import Picture
+from gaphor.diagram.general.picture import PictureItem, SurfaceCache, surface_cache
+
+
+def png_content(width=10, height=10):
+    image = Image.new("RGB", (width, height))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+@pytest.fixture(autouse=True)
+def clear_surface_cache():
+    surface_cache.clear()
+    yield
+    surface_cache.clear()
+
+
+def test_surface_cache_evicts_least_recently_used():
+    cache = SurfaceCache(max_size=2 * 10 * 40)
+    surfaces = [cairo.ImageSurface(cairo.FORMAT_ARGB32, 10, 10) for _ in range(3)]
+
+    cache.put("a", surfaces[0])
+    cache.put("b", surfaces[1])
+    cache.get("a")
+    cache.put("c", surfaces[2])
+
+    assert cache.get("a") is surfaces[0]
+    assert cache.get("b") is None
+    assert cache.get("c") is surfaces[2]
+    assert cache.size == 2 * 10 * 40
+
+
+def test_picture_surface_is_cached(diagram, element_factory):
+    item = diagram.create(PictureItem, subject=element_factory.create(Picture))
+    item.subject.content = png_content()
+
+    _, surface1 = item.create_content_surface()
+    _, surface2 = item.create_content_surface()
+
+    assert surface1 is surface2
+    assert len(surface_cache) == 1
+
+
+def test_picture_surface_is_shared_by_content(diagram, element_factory):
+    content = png_content()
+    item1 = diagram.create(PictureItem, subject=element_factory.create(Picture))
+    item1.subject.content = content
+    item2 = diagram.create(PictureItem, subject=element_factory.create(Picture))
+    item2.subject.content = content
+
+    _, surface1 = item1.create_content_surface()
+    _, surface2 = item2.create_content_surface()
+
+    assert surface1 is surface2
+
+
+def test_picture_surface_changes_with_content(diagram, element_factory):
+    item = diagram.create(PictureItem, subject=element_factory.create(Picture))
+    item.subject.content = png_content(10, 10)
+    _, surface1 = item.create_content_surface()
+
+    item.subject.content = png_content(20, 20)
+    _, surface2 = item.create_content_surface()
+
+    assert surface2.get_width() == 20
+    assert surface1 is not surface2
@@ -8,23 +8,91 @@ and handles).
 
 from __future__ import annotations
 
+from weakref import WeakKeyDictionary
+
+import cairo
 from cairo import LINE_JOIN_ROUND
 from gaphas.geometry import Rectangle
+from gaphas.painter.freehand import FreeHandCairoContext
 
 from gaphor.core.modeling.diagram import DrawContext, StyledDiagram, StyledItem
+from gaphor.core.modeling.presentation import Presentation
 from gaphor.diagram.diagramlabel import diagram_label
 from gaphor.diagram.selection import Selection
 from gaphor.diagram.shapes import Box, CssNode, Orientation, Text, cairo_state, stroke
 
+# Recordings are replayed when the diagram is painted, so they're made
+# with the paint tolerance of the view, not its bounding box tolerance.
+PAINT_TOLERANCE = 0.8
+
 
 class ItemPainter:
+    """Paint diagram items.
+
+    With ``cache_items``, the drawing of every item is recorded whenever
+    the item is painted individually (:meth:`paint_item`). The view does
+    that for each dirty item, to update its bounding box. Painting the
+    diagram (:meth:`paint`) replays those recordings.
+    """
+
     def __init__(
-        self, selection: Selection | None = None, dark_mode: bool | None = None
+        self,
+        selection: Selection | None = None,
+        dark_mode: bool | None = None,
+        cache_items: bool = False,
     ):
         self.selection: Selection = selection or Selection()
         self.dark_mode = dark_mode
+        self.cache_items = cache_items
+        self._recordings: WeakKeyDictionary[
+            Presentation, tuple[tuple[bool, ...], cairo.RecordingSurface]
+        ] = WeakKeyDictionary()
 
     def paint_item(self, item, cr):
+        if self.cache_items:
+            surface = cairo.RecordingSurface(cairo.Content.COLOR_ALPHA, None)
+            recording_cr = cairo.Context(surface)
+            recording_cr.set_tolerance(PAINT_TOLERANCE)
+            if isinstance(cr, FreeHandCairoContext):
+                recording_cr = FreeHandCairoContext(recording_cr, cr.sloppiness)
+            self._draw_item(item, recording_cr)
+            self._recordings[item] = (self._item_state(item), surface)
+            self._replay(surface, cr)
+        else:
+            self._draw_item(item, cr)
+
+    def paint(self, items, cr):
+        """Draw the items."""
+        if not self.cache_items:
+            for item in items:
+                self._draw_item(item, cr)
+            return
+
+        for item in items:
+            recording = self._recordings.get(item)
+            if recording and recording[0] == self._item_state(item):
+                self._replay(recording[1], cr)
+            else:
+                self.paint_item(item, cr)
+
+    def _item_state(self, item) -> tuple[bool, ...]:
+        selection = self.selection
+        return (
+            item in selection.selected_items,
+            item is selection.focused_item,
+            item is selection.hovered_item,
+            item is selection.dropzone_item,
+        )
+
+    def _replay(self, surface, cr):
+        cr.save()
+        try:
+            cr.set_source_surface(surface, 0, 0)
+            cr.paint()
+        finally:
+            cr.restore()
+
+    def _draw_item(self, item, cr):
         selection = self.selection
         if not (diagram := item.diagram):
             return
@@ -51,11 +119,6 @@ class ItemPainter:
         finally:
             cr.restore()
 
-    def paint(self, items, cr):
-        """Draw the items."""
-        for item in items:
-            self.paint_item(item, cr)
-
 
 class DiagramTypePainter:
     def __init__(self, diagram):
@@ -15,7 +15,15 @@ from gaphor.core.modeling.element import Id
 from gaphor.core.modeling.event import AttributeUpdated, RevertibleEvent
 from gaphor.core.modeling.presentation import Presentation, S, literal_eval
 from gaphor.core.modeling.properties import attribute
-from gaphor.diagram.shapes import CssNode, Shape, Text, stroke, traverse_css_nodes
+from gaphor.diagram.shapes import (
+    CssNode,
+    ElementShapes,
+    Shape,
+    Text,
+    size_statistics,
+    stroke,
+    traverse_css_nodes,
+)
 from gaphor.diagram.text import TextAlign, middle_segment, text_point_at_line
 
 DEFAULT_HEIGHT = 50
@@ -118,6 +126,8 @@ class ElementPresentation(gaphas.Element, HandlePositionUpdate, Presentation[S])
             height=height,
         )  # type: ignore[call-arg]
         self._shape = shape
+        self._shape_size_key: tuple | None = None
+        self._element_shapes: dict[str, ElementShapes] = {}
         for handle in self.handles():
             self.watch_handle(handle)
 
@@ -146,13 +156,35 @@ class ElementPresentation(gaphas.Element, HandlePositionUpdate, Presentation[S])
         """Updating the shape configuration, e.g. when extra elements have to
         be drawn or when styling changes."""
 
+    def element_shapes(self, compartment: str) -> ElementShapes:
+        """Shapes for the elements in a compartment, reused when the shape
+        configuration is updated."""
+        if not (shapes := self._element_shapes.get(compartment)):
+            shapes = self._element_shapes[compartment] = ElementShapes()
+        return shapes
+
+    def invalidate_shapes(self) -> None:
+        self._shape_size_key = None
+
     def update(self, context):
         if not self._shape:
             self.update_shapes()
-        if self._shape:
-            self.min_width, self.min_height = self._shape.size(
-                context, bounding_box=Rectangle(0, 0, self.width, self.height)
-            )
+        if not self._shape:
+            return
+
+        # Shapes are only sized again if the item's content, the style
+        # sheet or the item's size changed, not if the item is moved.
+        style_sheet = context.style.get("-gaphor-compiled-style-sheet")
+        key = (style_sheet and style_sheet.rules, self.width, self.height)
+        if key == self._shape_size_key:
+            size_statistics.hits += 1
+            return
+
+        size_statistics.misses += 1
+        self._shape_size_key = key
+        self.min_width, self.min_height = self._shape.size(
+            context, bounding_box=Rectangle(0, 0, self.width, self.height)
+        )
 
     def css_nodes(self) -> Iterator[CssNode]:
         return traverse_css_nodes(self._shape) if self._shape else iter(())
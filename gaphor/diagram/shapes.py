@@ -5,7 +5,7 @@ from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import replace
 from enum import Enum
 from math import pi
-from typing import Callable, Protocol
+from typing import Callable, Protocol, TypeVar
 
 from gaphas.geometry import Rectangle
 
@@ -206,6 +206,80 @@ class Shape(Iterable, Protocol):
 
 DEFAULT_PADDING = (0, 0, 0, 0)
 
+# Style properties that affect the size of a text
+TEXT_SIZE_PROPERTIES = (
+    "font-family",
+    "font-size",
+    "font-weight",
+    "font-style",
+    "text-decoration",
+    "text-align",
+    "min-width",
+    "min-height",
+    "padding",
+)
+
+
+class SizeStatistics:
+    """Count how often items could skip sizing their shapes.
+
+    Items only size their shapes if their content, the style sheet or
+    their size changed since the last update. For example, during a
+    drag most updates are skipped.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+
+size_statistics = SizeStatistics()
+
+C = TypeVar("C", UpdateContext, DrawContext)
+
+
+def without_padding(context: C) -> C:
+    """Child context, for shapes that apply the padding themselves."""
+    style = context.style
+    if "padding" not in style:
+        return context
+    return replace(context, style={k: v for k, v in style.items() if k != "padding"})  # type: ignore[arg-type]
+
+
+E = TypeVar("E", bound=Element)
+
+
+class ElementShapes:
+    """Shapes for the elements shown in a compartment.
+
+    When a compartment is rebuilt, the shapes of elements that are still
+    shown are reused, instead of creating new shapes for all elements.
+    """
+
+    def __init__(self) -> None:
+        self._shapes: dict[Element, Shape] = {}
+
+    def __call__(
+        self, elements: Iterable[E], factory: Callable[[E], Shape]
+    ) -> list[Shape]:
+        """Shapes for ``elements``; ``factory`` creates shapes for new
+        elements."""
+        shapes = self._shapes
+        self._shapes = {
+            element: shapes[element] if element in shapes else factory(element)
+            for element in elements
+        }
+        return list(self._shapes.values())
+
 
 class Box:
     """A box like shape.
@@ -242,10 +316,7 @@ class Box:
         new_bounds = rectangle_shrink(bounding_box, padding)
 
         if self.children:
-            child_context = replace(
-                context,
-                style={k: v for k, v in context.style.items() if k != "padding"},  # type: ignore[arg-type]
-            )
+            child_context = without_padding(context)
             self.sizes = sizes = [
                 c.size(child_context, new_bounds) for c in self.children
             ]
@@ -315,10 +386,7 @@ class Box:
             self._draw_border(self, context, bounding_box)
 
         if self.children:
-            child_context = replace(
-                context,
-                style={k: v for k, v in context.style.items() if k != "padding"},  # type: ignore[arg-type]
-            )
+            child_context = without_padding(context)
             x = bounding_box.x + padding_left
             w = bounding_box.width - padding_right - padding_left
             last_child = self.children[-1]
@@ -364,10 +432,7 @@ class Box:
             self._draw_border(self, context, bounding_box)
 
         if self.children:
-            child_context = replace(
-                context,
-                style={k: v for k, v in context.style.items() if k != "padding"},  # type: ignore[arg-type]
-            )
+            child_context = without_padding(context)
             y = bounding_box.y + padding_top
             h = bounding_box.height - padding_bottom - padding_top
             last_child = self.children[-1]
@@ -408,10 +473,7 @@ class IconBox:
         new_bounds = rectangle_shrink(bounding_box, padding)
         width, height = self.icon.size(context, new_bounds)
 
-        child_context = replace(
-            context,
-            style={k: v for k, v in context.style.items() if k != "padding"},  # type: ignore[arg-type]
-        )
+        child_context = without_padding(context)
         new_bounds.expand(new_bounds.width * 1.32)
         self.sizes = [c.size(child_context, new_bounds) for c in self.children]
 
@@ -460,10 +522,7 @@ class IconBox:
             rectangle_shrink(bounding_box, style.get("padding", DEFAULT_PADDING)),
         )
 
-        child_context = replace(
-            context,
-            style={k: v for k, v in context.style.items() if k != "padding"},  # type: ignore[arg-type]
-        )
+        child_context = without_padding(context)
         cx, cy, max_w, _total_h = self.child_pos(style, bounding_box)
         for c, (cw, ch) in zip(self.children, self.sizes):
             c.draw(child_context, Rectangle(cx + (max_w - cw) / 2, cy, cw, ch))
@@ -474,6 +533,8 @@ class Text:
     def __init__(self, text: str | Callable[[], str]):
         self._text = text if callable(text) else lambda: text
         self._layout = Layout()
+        self._size_key: tuple | None = None
+        self._size: tuple[Number, Number] = (0, 0)
 
     def __iter__(self):
         return iter(())
@@ -494,20 +555,29 @@ class Text:
 
     def size(self, context: UpdateContext, bounding_box: Rectangle | None = None):
         style = context.style
+        text = self.text(style)
+        white_space = style.get("white-space", WhiteSpace.NORMAL)
+        width = (
+            bounding_box.width
+            if bounding_box and white_space == WhiteSpace.NORMAL
+            else -1
+        )
+
+        key = (text, width, *(style.get(name) for name in TEXT_SIZE_PROPERTIES))
+        if key == self._size_key:
+            return self._size
+
+        self._size_key = key
+        self._size = self._compute_size(style, text, width)
+        return self._size
+
+    def _compute_size(self, style, text, width):
         min_w = style.get("min-width", 0)
         min_h = style.get("min-height", 0)
         text_align = style.get("text-align", TextAlign.CENTER)
-        white_space = style.get("white-space", WhiteSpace.NORMAL)
 
         layout = self._layout
-        layout.set(
-            text=self.text(style),
-            font=style,
-            width=bounding_box.width
-            if bounding_box and white_space == WhiteSpace.NORMAL
-            else -1,
-            text_align=text_align,
-        )
+        layout.set(text=text, font=style, width=width, text_align=text_align)
         width, height = layout.size()
         padding_top, padding_right, padding_bottom, padding_left = style.get(
             "padding", DEFAULT_PADDING
@@ -1,6 +1,15 @@
 import pytest
 
-from gaphor.diagram.copypaste import copy, paste
+from gaphor import UML
+from gaphor.diagram.copypaste import (
+    copy,
+    copy_full,
+    decode_copy_data,
+    encode_copy_data,
+    paste,
+    paste_full,
+)
+from gaphor.UML.classes import ClassItem
 
 
 def test_copy_unknown_type_raises_exception():
@@ -11,3 +20,30 @@ def test_copy_unknown_type_raises_exception():
 def test_paste_unknown_type_raises_exception(diagram, element_factory):
     with pytest.raises(ValueError):
         paste(None, diagram, element_factory.lookup)
+
+
+def test_encode_and_decode_copy_data(diagram, element_factory):
+    cls = element_factory.create(UML.Class)
+    cls.name = "Name"
+    cls_item = diagram.create(ClassItem, subject=cls)
+
+    copy_data = copy_full({cls_item})
+
+    assert decode_copy_data(encode_copy_data(copy_data)) == copy_data
+
+
+def test_paste_decoded_copy_data(diagram, element_factory):
+    cls = element_factory.create(UML.Class)
+    cls_item = diagram.create(ClassItem, subject=cls)
+
+    new_items = paste_full(
+        decode_copy_data(encode_copy_data(copy_full({cls_item}))), diagram
+    )
+
+    assert len(new_items) == 1
+    assert len(element_factory.lselect(UML.Class)) == 2
+
+
+def test_decode_invalid_copy_data():
+    with pytest.raises(ValueError):
+        decode_copy_data(b"invalid")
@@ -135,3 +135,13 @@ def test_copy_diagram_with_elements(diagram, element_factory):
     new_diagram = new_diagram_item.subject
 
     assert new_diagram.ownedPresentation
+
+
+def test_copy_deeply_nested_packages(element_factory):
+    root = package = element_factory.create(UML.Package)
+    for _ in range(2000):
+        package.nestedPackage = package = element_factory.create(UML.Package)
+
+    buffer = copy_full([root], element_factory.lookup)
+
+    assert len(buffer.elements) == 2001
@@ -187,3 +187,21 @@ def test_copy_to_new_diagram(diagram, element_factory):
 
     assert len(list(new_diagram.get_all_items())) == 1
     assert next(new_diagram.get_all_items()).diagram is new_diagram
+
+
+def test_paste_updates_diagram_once(diagram, element_factory, monkeypatch):
+    cls = element_factory.create(UML.Class)
+    items = {diagram.create(ClassItem, subject=cls) for _ in range(10)}
+    buffer = copy_full(items)
+    updates = []
+    update = diagram.update
+    monkeypatch.setattr(
+        diagram,
+        "update",
+        lambda dirty_items=(): updates.append(dirty_items) or update(dirty_items),
+    )
+
+    new_items = paste_link(buffer, diagram)
+
+    assert len(new_items) == 10
+    assert updates == [new_items]
@@ -3,11 +3,13 @@ import pytest
 from gaphor.diagram.export import (
     escape_filename,
     save_eps,
+    save_formats,
     save_pdf,
     save_png,
     save_svg,
 )
 from gaphor.diagram.general import Box
+from gaphor.diagram.painter import ItemPainter
 
 
 @pytest.fixture
@@ -57,3 +59,44 @@ def test_escape_filename():
     assert escape_filename(r"foo \ bar >") == "foo_bar_"
     assert escape_filename("çëÆØ") == "çëÆØ"
     assert escape_filename("こんにちは") == "こんにちは"  # should read: "hello"
+
+
+def test_items_are_painted_once(diagram_with_box, tmp_path, monkeypatch):
+    painted = []
+    paint_item = ItemPainter.paint_item
+
+    def counting_paint_item(self, item, cr):
+        painted.append(item)
+        paint_item(self, item, cr)
+
+    monkeypatch.setattr(ItemPainter, "paint_item", counting_paint_item)
+
+    save_svg(tmp_path / "test.svg", diagram_with_box)
+
+    assert len(painted) == 1
+
+
+def test_export_to_multiple_formats_paints_once(
+    diagram_with_box, tmp_path, monkeypatch
+):
+    painted = []
+    paint_item = ItemPainter.paint_item
+
+    def counting_paint_item(self, item, cr):
+        painted.append(item)
+        paint_item(self, item, cr)
+
+    monkeypatch.setattr(ItemPainter, "paint_item", counting_paint_item)
+
+    save_formats(
+        {"svg": tmp_path / "test.svg", "pdf": tmp_path / "test.pdf"}, diagram_with_box
+    )
+
+    assert len(painted) == 1
+    assert "<svg" in (tmp_path / "test.svg").read_text(encoding="utf-8")
+    assert b"%PDF" in (tmp_path / "test.pdf").read_bytes()
+
+
+def test_export_to_unknown_format(diagram_with_box, tmp_path):
+    with pytest.raises(ValueError):
+        save_formats({"gif": tmp_path / "test.gif"}, diagram_with_box)
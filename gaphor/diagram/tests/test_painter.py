@@ -0,0 +1,74 @@
+import cairo
+import pytest
+
+from gaphor.diagram.general import Box
+from gaphor.diagram.painter import PAINT_TOLERANCE, ItemPainter
+
+
+@pytest.fixture
+def box(diagram):
+    box = diagram.create(Box)
+    diagram.update({box})
+    return box
+
+
+@pytest.fixture
+def drawn(monkeypatch):
+    drawn = []
+    draw = Box.draw
+
+    def counting_draw(self, context):
+        drawn.append(self)
+        draw(self, context)
+
+    monkeypatch.setattr(Box, "draw", counting_draw)
+    return drawn
+
+
+def new_context(width=100, height=100):
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+    return cairo.Context(surface)
+
+
+def test_paint_items_without_cache(box, drawn):
+    painter = ItemPainter()
+
+    painter.paint([box], new_context())
+    painter.paint([box], new_context())
+
+    assert drawn == [box, box]
+
+
+def test_paint_recorded_item(box, drawn):
+    painter = ItemPainter(cache_items=True)
+
+    painter.paint_item(box, new_context())
+    painter.paint([box], new_context())
+
+    assert drawn == [box]
+
+
+def test_selection_change_invalidates_recording(box, drawn):
+    painter = ItemPainter(cache_items=True)
+
+    painter.paint_item(box, new_context())
+    painter.selection.select_items(box)
+    painter.paint([box], new_context())
+
+    assert drawn == [box, box]
+
+
+def test_record_with_paint_tolerance(box, monkeypatch):
+    tolerances = []
+    monkeypatch.setattr(
+        ItemPainter,
+        "_draw_item",
+        lambda self, item, cr: tolerances.append(cr.get_tolerance()),
+    )
+    painter = ItemPainter(cache_items=True)
+    cr = new_context()
+    cr.set_tolerance(1.0)
+
+    painter.paint_item(box, cr)
+
+    assert tolerances == [PAINT_TOLERANCE]
@@ -2,6 +2,7 @@ import pytest
 
 from gaphor import UML
 from gaphor.diagram.presentation import ElementPresentation, LinePresentation
+from gaphor.diagram.shapes import size_statistics
 from gaphor.diagram.tests.fixtures import connect
 from gaphor.UML import diagramitems
 
@@ -81,6 +82,64 @@ def test_element_loading(element_factory, diagram):
     assert p.subject is subject
 
 
+class CountingVisualComponent(DummyVisualComponent):
+    def __init__(self):
+        self.sized = 0
+
+    def size(self, ctx, bounding_box=None):
+        self.sized += 1
+        return 0, 0
+
+
+def test_moved_element_keeps_shape_size(diagram):
+    p = diagram.create(StubElement)
+    p.shape = shape = CountingVisualComponent()
+    diagram.update()
+
+    p.matrix.translate(10, 10)
+    diagram.update()
+
+    assert shape.sized == 1
+
+
+def test_drag_skips_sizing_shapes(diagram):
+    p = diagram.create(StubElement)
+    p.shape = CountingVisualComponent()
+    diagram.update()
+    size_statistics.reset()
+
+    for _ in range(10):
+        p.matrix.translate(5, 5)
+        diagram.update()
+
+    assert size_statistics.hits == 10
+    assert size_statistics.misses == 0
+    assert size_statistics.hit_rate == 1.0
+
+
+def test_element_shape_is_sized_on_update_request(diagram):
+    p = diagram.create(StubElement)
+    p.shape = shape = CountingVisualComponent()
+    diagram.update()
+
+    p.request_update()
+    diagram.update()
+
+    assert shape.sized == 2
+
+
+def test_resized_element_sizes_shape(diagram):
+    p = diagram.create(StubElement)
+    p.shape = shape = CountingVisualComponent()
+    diagram.update()
+
+    p.width = 200
+    diagram.request_update(p)
+    diagram.update()
+
+    assert shape.sized == 2
+
+
 def test_line_saving(element_factory, diagram):
     subject = element_factory.create(UML.Dependency)
     p = diagram.create(StubLine, subject=subject)
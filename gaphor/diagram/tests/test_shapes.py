@@ -4,6 +4,7 @@ import cairo
 import pytest
 from gaphas.geometry import Rectangle
 
+from gaphor.core.modeling import Element
 from gaphor.core.modeling.diagram import FALLBACK_STYLE
 from gaphor.core.styling import (
     CompiledStyleSheet,
@@ -16,6 +17,7 @@ from gaphor.diagram.shapes import (
     Box,
     CssNode,
     DrawContext,
+    ElementShapes,
     IconBox,
     Orientation,
     Shape,
@@ -300,6 +302,42 @@ def test_text_has_height(update_context, fixed_text_size):
     assert h == fixed_text_size[1]
 
 
+def test_text_size_is_reused(update_context, monkeypatch):
+    measured = []
+
+    def text_size(layout):
+        measured.append(layout.text)
+        return (60, 15)
+
+    monkeypatch.setattr("gaphor.diagram.text.Layout.size", text_size)
+    value = "some text"
+    text = Text(lambda: value)
+
+    text.size(update_context)
+    text.size(update_context)
+    value = "other text"
+    text.size(update_context)
+
+    assert measured == ["some text", "other text"]
+
+
+def test_text_size_changes_with_bounding_box_width(update_context, monkeypatch):
+    measured = []
+
+    def text_size(layout):
+        measured.append(layout.width)
+        return (60, 15)
+
+    monkeypatch.setattr("gaphor.diagram.text.Layout.size", text_size)
+    text = Text("some text")
+
+    text.size(update_context, Rectangle(0, 0, 100, 50))
+    text.size(update_context, Rectangle(10, 10, 100, 80))
+    text.size(update_context, Rectangle(0, 0, 200, 50))
+
+    assert measured == [100, 200]
+
+
 def test_text_with_min_width(update_context):
     style = {"min-width": 100, "min-height": 0}
     text = InlineStyle(style, Text("some text"))
@@ -347,3 +385,25 @@ def test_iterate_css_node(update_context):
         "first",
         "second",
     ]
+
+
+def test_element_shapes_are_reused():
+    shapes = ElementShapes()
+    a, b = Element(), Element()
+
+    first = shapes([a], lambda e: Text(e.id))
+    second = shapes([b, a], lambda e: Text(e.id))
+
+    assert second[1] is first[0]
+    assert second[0] is not first[0]
+
+
+def test_element_shapes_drop_removed_elements():
+    shapes = ElementShapes()
+    a = Element()
+
+    first = shapes([a], lambda e: Text(e.id))
+    shapes([], lambda e: Text(e.id))
+    second = shapes([a], lambda e: Text(e.id))
+
+    assert second[0] is not first[0]
@@ -6,6 +6,7 @@ from gaphor.diagram.text import (
     Layout,
     TextAlign,
     TextDecoration,
+    TextMeasurement,
     text_point_at_line,
 )
 
@@ -101,3 +102,78 @@ def test_text_with_just_font_as_dict():
     w, h = Layout("Example", {"font-family": "sans", "font-size": 10}).size()
     assert w
     assert h
+
+
+def test_text_size_is_cached():
+    measurement = TextMeasurement()
+    font_id = ("sans", 10, None, None, False)
+
+    size = measurement.size("Example", font_id, -1, TextAlign.CENTER)
+
+    assert measurement.size("Example", font_id, -1, TextAlign.CENTER) == size
+    assert measurement.hits == 1
+    assert measurement.misses == 1
+
+
+def test_text_measurement_cache_is_bounded():
+    measurement = TextMeasurement(max_size=2)
+    font_id = ("sans", 10, None, None, False)
+
+    for text in ("a", "b", "c"):
+        measurement.size(text, font_id, -1, TextAlign.CENTER)
+
+    assert len(measurement) == 2
+
+
+def test_layouts_are_pooled():
+    measurement = TextMeasurement()
+    font_id = ("sans", 10, None, None, False)
+
+    with measurement.layout("a", font_id, -1, TextAlign.CENTER) as layout:
+        pass
+
+    with measurement.layout("b", font_id, 100, TextAlign.LEFT) as other:
+        assert other is layout
+        assert other.get_text() == "b"
+
+
+def test_underlined_text_is_measured_separately():
+    plain = Layout("Example", {"font-family": "sans", "font-size": 10})
+    underlined = Layout(
+        "Example",
+        {
+            "font-family": "sans",
+            "font-size": 10,
+            "text-decoration": TextDecoration.UNDERLINE,
+        },
+    )
+
+    assert plain.font_id != underlined.font_id
+
+
+def test_text_without_font_uses_default_font():
+    w, h = Layout("Example").size()
+
+    assert w
+    assert h
+
+
+def test_shaped_layouts_are_reused():
+    measurement = TextMeasurement()
+    font_id = ("sans", 10, None, None, False)
+
+    layout = measurement.shaped_layout("a", font_id, -1, TextAlign.CENTER)
+
+    assert measurement.shaped_layout("a", font_id, -1, TextAlign.CENTER) is layout
+    assert measurement.shaped_layout("b", font_id, -1, TextAlign.CENTER) is not layout
+
+
+def test_shaped_layouts_are_bounded_and_pooled():
+    measurement = TextMeasurement(max_shaped=1)
+    font_id = ("sans", 10, None, None, False)
+
+    layout = measurement.shaped_layout("a", font_id, -1, TextAlign.CENTER)
+    measurement.shaped_layout("b", font_id, -1, TextAlign.CENTER)
+
+    with measurement.layout("c", font_id, -1, TextAlign.CENTER) as other:
+        assert other is layout
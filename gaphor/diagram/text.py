@@ -1,14 +1,201 @@
 """Support classes for dealing with text."""
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING
+
 from gaphas.canvas import instant_cairo_context
 from gaphas.painter.freehand import FreeHandCairoContext
-from gi.repository import Pango, PangoCairo
 
 from gaphor.core.styling import FontStyle, FontWeight, Style, TextAlign, TextDecoration
 
+if TYPE_CHECKING:
+    from gi.repository import Pango
+
+# Maximum number of text sizes kept in the measurement cache
+MAX_CACHED_TEXT_SIZES = 8192
+
+# Maximum number of shaped layouts kept for drawing
+MAX_SHAPED_LAYOUTS = 256
+
+# Pango widths are 32 bit signed integers
+MAX_PANGO_WIDTH = 2147483647
+
+FontId = tuple[str, float | str, FontWeight | None, FontStyle | None, bool]
+
+# Font used for text without a font, same as the default diagram style
+DEFAULT_FONT_ID: FontId = ("sans", 14, None, None, False)
+
+
+@cache
+def pango():
+    """Pango and PangoCairo.
+
+    They're imported when text is measured or drawn for the first time,
+    so models can be loaded without the Pango libraries.
+    """
+    import gi
+
+    gi.require_version("Pango", "1.0")
+    gi.require_version("PangoCairo", "1.0")
+
+    from gi.repository import Pango, PangoCairo
+
+    return Pango, PangoCairo
+
+
+class TextMeasurement:
+    """Measure and draw text with a small pool of shared Pango layouts.
+
+    Text sizes are cached by ``(text, font id, width, alignment)``. Least
+    recently used sizes are evicted once more than ``max_size`` sizes
+    are cached.
+
+    Layouts used for drawing are kept shaped, by the same key, so text
+    that is drawn again is not shaped again. At most ``max_shaped``
+    layouts are kept. Least recently drawn layouts go back to the pool.
+    """
+
+    def __init__(
+        self,
+        max_size: int = MAX_CACHED_TEXT_SIZES,
+        max_shaped: int = MAX_SHAPED_LAYOUTS,
+    ):
+        self.max_size = max_size
+        self.max_shaped = max_shaped
+        self.hits = 0
+        self.misses = 0
+        self._sizes: OrderedDict[
+            tuple[str, FontId, float, TextAlign], tuple[int, int]
+        ] = OrderedDict()
+        self._shaped: OrderedDict[
+            tuple[str, FontId, float, TextAlign], Pango.Layout
+        ] = OrderedDict()
+        self._pool: list[Pango.Layout] = []
+
+    def size(
+        self, text: str, font_id: FontId, width: float, text_align: TextAlign
+    ) -> tuple[int, int]:
+        key = (text, font_id, width, text_align)
+        if (size := self._sizes.get(key)) is not None:
+            self.hits += 1
+            self._sizes.move_to_end(key)
+            return size
+
+        self.misses += 1
+        with self.layout(text, font_id, width, text_align) as layout:
+            size = layout.get_pixel_size()
+        self._sizes[key] = size
+        if len(self._sizes) > self.max_size:
+            self._sizes.popitem(last=False)
+        return size  # type: ignore[no-any-return]
+
+    @contextmanager
+    def layout(
+        self, text: str, font_id: FontId, width: float, text_align: TextAlign
+    ) -> Iterator[Pango.Layout]:
+        """Borrow a layout from the pool, configured for the text."""
+        layout = self._pool.pop() if self._pool else _create_layout()
+        try:
+            _configure_layout(layout, text, font_id, width, text_align)
+            yield layout
+        finally:
+            self._pool.append(layout)
+
+    def shaped_layout(
+        self, text: str, font_id: FontId, width: float, text_align: TextAlign
+    ) -> Pango.Layout:
+        """A layout, configured for the text, to draw the text with.
+
+        The layout is owned by the measurement: it should only be used
+        until the next text is drawn.
+        """
+        key = (text, font_id, width, text_align)
+        if (layout := self._shaped.get(key)) is not None:
+            self._shaped.move_to_end(key)
+            return layout
+
+        layout = self._pool.pop() if self._pool else _create_layout()
+        _configure_layout(layout, text, font_id, width, text_align)
+        self._shaped[key] = layout
+        if len(self._shaped) > self.max_shaped:
+            self._pool.append(self._shaped.popitem(last=False)[1])
+        return layout
+
+    def clear(self) -> None:
+        self._pool.extend(self._shaped.values())
+        self._shaped.clear()
+        self._sizes.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+
+def _create_layout() -> Pango.Layout:
+    _, PangoCairo = pango()
+    return PangoCairo.create_layout(instant_cairo_context())
+
+
+def _configure_layout(
+    layout: Pango.Layout,
+    text: str,
+    font_id: FontId,
+    width: float,
+    text_align: TextAlign,
+) -> None:
+    Pango, _ = pango()
+    layout.set_font_description(_font_description(font_id[:4]))
+    layout.set_attributes(_text_attributes(font_id[4]))
+    layout.set_text(text, length=-1)
+    layout.set_width(
+        -1 if width == -1 else min(int(width * Pango.SCALE), MAX_PANGO_WIDTH)
+    )
+    layout.set_alignment(getattr(Pango.Alignment, text_align.name))
+
+
+@lru_cache(maxsize=64)
+def _font_description(font_id) -> Pango.FontDescription:
+    Pango, _ = pango()
+    font_family, font_size, font_weight, font_style = font_id
+    fd = Pango.FontDescription.new()
+    fd.set_family(font_family)
+    fd.set_absolute_size(font_size * Pango.SCALE)
+
+    if font_weight:
+        assert isinstance(font_weight, FontWeight)
+        fd.set_weight(getattr(Pango.Weight, font_weight.name))
+    if font_style:
+        assert isinstance(font_style, FontStyle)
+        fd.set_style(getattr(Pango.Style, font_style.name))
+    return fd
+
+
+def _text_attributes(underline: bool) -> Pango.AttrList:
+    Pango, _ = pango()
+    attrs = Pango.AttrList.new()
+    attrs.insert(
+        Pango.attr_underline_new(
+            Pango.Underline.SINGLE if underline else Pango.Underline.NONE
+        )
+    )
+    return attrs
+
+
+text_measurement = TextMeasurement()
+
 
 class Layout:
+    """Text, font, width and alignment of a piece of text.
+
+    A layout does not hold any Pango resources: text is measured and
+    drawn with the shared ``text_measurement``.
+    """
+
     def __init__(
         self,
         text: str = "",
@@ -17,12 +204,10 @@ class Layout:
         text_align: TextAlign = TextAlign.CENTER,
         default_size: tuple[int, int] = (0, 0),
     ):
-        self.layout = PangoCairo.create_layout(instant_cairo_context())
-        self.font_id: (
-            tuple[str, float | str, FontWeight | None, FontStyle | None] | None
-        ) = None
+        self.font_id: FontId | None = None
         self.text = ""
-        self.width = -1
+        self.width: float = -1
+        self.text_align = text_align
         self.default_size = default_size
 
         if text:
@@ -31,7 +216,6 @@ class Layout:
             self.set_width(width)
         if font:
             self.set_font(font)
-        self.set_alignment(text_align)
 
     def set(self, text=None, font=None, width=None, text_align=None):
         # Since text expressions can return False, we should also accommodate for that
@@ -47,70 +231,44 @@ class Layout:
     def set_font(self, font: Style) -> None:
         font_family = font.get("font-family")
         font_size = font.get("font-size")
-        font_weight = font.get("font-weight")
-        font_style = font.get("font-style")
         assert font_family, "Font family should be set"
         assert font_size, "Font size should be set"
 
-        font_id = (font_family, font_size, font_weight, font_style)
-        if font_id == self.font_id:
-            return
-
-        self.font_id = font_id
-
-        fd = Pango.FontDescription.new()
-        fd.set_family(font_family)
-        fd.set_absolute_size(font_size * Pango.SCALE)
-
-        if font_weight:
-            assert isinstance(font_weight, FontWeight)
-            fd.set_weight(getattr(Pango.Weight, font_weight.name))
-        if font_style:
-            assert isinstance(font_style, FontStyle)
-            fd.set_style(getattr(Pango.Style, font_style.name))
-
-        self.layout.set_font_description(fd)
-
-        underline = (
-            font.get("text-decoration", TextDecoration.NONE) == TextDecoration.UNDERLINE
-        )
-
-        attrs = Pango.AttrList.new()
-        attrs.insert(
-            Pango.attr_underline_new(
-                Pango.Underline.SINGLE if underline else Pango.Underline.NONE
-            )
+        self.font_id = (
+            font_family,
+            font_size,
+            font.get("font-weight"),
+            font.get("font-style"),
+            font.get("text-decoration", TextDecoration.NONE)
+            == TextDecoration.UNDERLINE,
         )
-        self.layout.set_attributes(attrs)
 
     def set_text(self, text: str) -> None:
-        if text != self.text:
-            self.text = text
-            self.layout.set_text(self.text, length=-1)
+        self.text = text
 
-    def set_width(self, width: int) -> None:
+    def set_width(self, width: float) -> None:
         self.width = width
-        if width == -1:
-            self.layout.set_width(-1)
-        else:
-            self.layout.set_width(int(width * Pango.SCALE))
 
     def set_alignment(self, text_align: TextAlign) -> None:
-        self.layout.set_alignment(getattr(Pango.Alignment, text_align.name))
+        self.text_align = text_align
 
     def size(self) -> tuple[int, int]:
         if not self.text:
             return self.default_size
-        self.set_width(self.width)
-        return self.layout.get_pixel_size()  # type: ignore[no-any-return]
+        return text_measurement.size(
+            self.text, self.font_id or DEFAULT_FONT_ID, self.width, self.text_align
+        )
 
     def show_layout(self, cr, width=None, default_size=None):
-        layout = self.layout
         if not self.text:
             return default_size or self.default_size
-        if width is not None:
-            layout.set_width(min(int(width * Pango.SCALE), 2147483647))
-
+        layout = text_measurement.shaped_layout(
+            self.text,
+            self.font_id or DEFAULT_FONT_ID,
+            self.width if width is None else width,
+            self.text_align,
+        )
+        _, PangoCairo = pango()
         if isinstance(cr, FreeHandCairoContext):
             PangoCairo.show_layout(cr.cr, layout)
         else:
@@ -19,13 +19,15 @@ def list_entry_points(group):
 
 
 def load_entry_points(scope, services=None) -> Dict[str, type]:
-    """Load services from resources."""
+    """Load services from resources.
+
+    If ``services`` is provided, only those entry points are loaded.
+    """
     uninitialized_services = {}
     for ep in list_entry_points(scope):
-        cls = ep.load()
         if not services or ep.name in services:
             logger.debug(f'found entry point "{scope}.{ep.name}"')
-            uninitialized_services[ep.name] = cls
+            uninitialized_services[ep.name] = ep.load()
     return uninitialized_services
 
 
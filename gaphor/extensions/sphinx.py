@@ -10,7 +10,7 @@ from docutils.parsers.rst.directives import images
 from sphinx.util import logging
 
 from gaphor.core.modeling import Diagram, ElementFactory
-from gaphor.diagram.export import save_pdf, save_svg
+from gaphor.diagram.export import save_formats
 from gaphor.i18n import gettext
 from gaphor.services.modelinglanguage import ModelingLanguageService
 from gaphor.storage import storage
@@ -91,8 +91,10 @@ class DiagramDirective(sphinx.util.docutils.SphinxDirective):
             )
 
         outfile = outdir / f"{diagram.id}"
-        save_svg(outfile.with_suffix(".svg"), diagram)
-        save_pdf(outfile.with_suffix(".pdf"), diagram)
+        save_formats(
+            {"svg": outfile.with_suffix(".svg"), "pdf": outfile.with_suffix(".pdf")},
+            diagram,
+        )
 
         # Image needs a relative path. Make our outfile path relative to the doc
         outdir = outdir.relative_to(self.env.srcdir)
@@ -57,10 +57,16 @@ def translation(lang) -> _gettext.GNUTranslations | _gettext.NullTranslations:
     return _gettext.NullTranslations()
 
 
-if settings.use_english:
-    gettext = translation("en_US.UTF-8").gettext
-else:
-    gettext = translation(os.getenv("LANG") or _get_os_language()).gettext
+@functools.cache
+def _translation() -> _gettext.GNUTranslations | _gettext.NullTranslations:
+    # Settings are looked up on first use, not when Gaphor is imported
+    if settings.use_english:
+        return translation("en_US.UTF-8")
+    return translation(os.getenv("LANG") or _get_os_language())
+
+
+def gettext(message: str) -> str:
+    return _translation().gettext(message)
 
 
 def i18nize(message):
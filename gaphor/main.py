@@ -4,7 +4,7 @@ import os
 import sys
 
 from gaphor.application import distribution
-from gaphor.entrypoint import initialize
+from gaphor.entrypoint import initialize, list_entry_points
 from gaphor.plugins import default_plugin_path, enable_plugins
 
 LOG_FORMAT = "%(name)s %(levelname)s %(message)s"
@@ -18,13 +18,28 @@ def main(argv=None) -> int:
     logging_config()
 
     with enable_plugins(default_plugin_path()):
-        commands: dict[str, argparse.ArgumentParser] = initialize("gaphor.argparsers")
+        commands: dict[str, argparse.ArgumentParser] = initialize(
+            "gaphor.argparsers", requested_command(argv[1:])
+        )
 
         args = parse_args(argv[1:], commands)
 
+        if args.import_times:
+            return run_import_times(argv)
         return run_profiler(args) if args.profiler else args.command(args)  # type: ignore[no-any-return]
 
 
+def requested_command(args: list[str]) -> list[str] | None:
+    """The subcommand to load, if one is provided.
+
+    Other subcommands are not loaded, so they do not add to the start up
+    time.
+    """
+    if args and args[0] in {ep.name for ep in list_entry_points("gaphor.argparsers")}:
+        return [args[0]]
+    return None
+
+
 def run_profiler(args):
     import cProfile
     import pstats
@@ -37,6 +52,43 @@ def run_profiler(args):
     return exit_code
 
 
+def run_import_times(argv, top=25) -> int:
+    """Run a command in a new process, and report module import times, as
+    measured by ``python -X importtime``."""
+    import subprocess
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-m",
+            "gaphor",
+            *(arg for arg in argv[1:] if arg != "--import-times"),
+        ],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            print(line, file=sys.stderr)  # noqa: T201
+            continue
+        self_time, cumulative, module = line[len("import time:") :].split("|")
+        if self_time.strip().isdigit():
+            timings.append((int(self_time), int(cumulative), module.rstrip()))
+
+    print(  # noqa: T201
+        f"Imported {len(timings)} modules in "
+        f"{sum(t[0] for t in timings) / 1000:.0f} ms. Slowest imports:"
+    )
+    print(f"{'self [ms]':>10} {'cumulative [ms]':>16}  module")  # noqa: T201
+    for self_time, cumulative, module in sorted(timings, key=lambda t: -t[1])[:top]:
+        print(f"{self_time / 1000:10.1f} {cumulative / 1000:16.1f} {module}")  # noqa: T201
+    return result.returncode
+
+
 def parse_args(args: list[str], commands: dict[str, argparse.ArgumentParser]):
     defaults = default_parser()
     parser = argparse.ArgumentParser(
@@ -99,6 +151,11 @@ def default_parser():
     parser.add_argument(
         "--profiler", help="run in profiler (cProfile)", action="store_true"
     )
+    parser.add_argument(
+        "--import-times",
+        help="report module import times of a command",
+        action="store_true",
+    )
     return parser
 
 
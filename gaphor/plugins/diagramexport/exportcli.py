@@ -8,7 +8,7 @@ from typing import List
 
 from gaphor.application import Session
 from gaphor.core.modeling import Diagram
-from gaphor.diagram.export import escape_filename, save_pdf, save_png, save_svg
+from gaphor.diagram.export import escape_filename, save_formats
 from gaphor.storage import storage
 
 log = logging.getLogger(__name__)
@@ -23,6 +23,15 @@ def pkg2dir(package):
     return "/".join(name)
 
 
+def formats(value: str) -> list[str]:
+    formats = [f.strip() for f in value.split(",")]
+    if unknown := [f for f in formats if f not in ("pdf", "svg", "png")]:
+        raise argparse.ArgumentTypeError(
+            f"invalid format: {', '.join(unknown)} (choose from pdf, svg, png)"
+        )
+    return formats
+
+
 def export_parser():
     parser = argparse.ArgumentParser(description="Export diagrams from a Gaphor model.")
 
@@ -40,9 +49,9 @@ def export_parser():
         "-f",
         "--format",
         metavar="format",
-        help="output file format, default pdf",
-        default="pdf",
-        choices=["pdf", "svg", "png"],
+        help="output file format(s), pdf, svg or png, comma separated, default pdf",
+        default=["pdf"],
+        type=formats,
     )
     parser.add_argument(
         "-r",
@@ -98,19 +107,12 @@ def export_command(args):
             if args.dir:
                 odir = f"{args.dir}/{odir}"
 
-            outfilename = f"{odir}/{dname}.{args.format}"
+            outfilenames = {fmt: f"{odir}/{dname}.{fmt}" for fmt in args.format}
 
             if not Path(odir).exists():
                 log.debug("creating dir %s", odir)
                 Path(odir).mkdir(parents=True)
 
-            log.debug("rendering: %s -> %s...", pname, outfilename)
+            log.debug("rendering: %s -> %s...", pname, ", ".join(outfilenames.values()))
 
-            if args.format == "pdf":
-                save_pdf(outfilename, diagram)
-            elif args.format == "svg":
-                save_svg(outfilename, diagram)
-            elif args.format == "png":
-                save_png(outfilename, diagram)
-            else:
-                raise RuntimeError(f"Unknown file format: {args.format}")
+            save_formats(outfilenames, diagram)
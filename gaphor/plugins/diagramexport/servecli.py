@@ -0,0 +1,243 @@
+"""Serve diagram images of Gaphor models over HTTP.
+
+Models are loaded once, and reloaded when the model file changes.
+Diagrams can be requested as ``/<model>/<diagram>.<format>``, where
+``<model>`` is the model file name, ``<diagram>`` is the diagram id or
+qualified name (e.g. ``New model.main``), and ``<format>`` is one of
+``svg``, ``png`` or ``pdf``. ``/`` lists the available diagrams.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import logging
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from gaphor.core.modeling import Diagram, ElementFactory
+from gaphor.diagram.export import save_pdf, save_png, save_svg
+from gaphor.services.modelinglanguage import ModelingLanguageService
+from gaphor.storage import storage
+
+log = logging.getLogger(__name__)
+
+# Maximum number of rendered diagrams kept in the cache
+MAX_CACHED_RENDERS = 64
+
+CONTENT_TYPES = {
+    "svg": "image/svg+xml",
+    "png": "image/png",
+    "pdf": "application/pdf",
+}
+
+SAVE_FUNCTIONS = {
+    "svg": save_svg,
+    "png": save_png,
+    "pdf": save_pdf,
+}
+
+
+def serve_parser():
+    parser = argparse.ArgumentParser(
+        description="Serve diagram images of Gaphor models on localhost."
+    )
+    parser.add_argument(
+        "-p", "--port", type=int, default=8700, help="port to listen on, default 8700"
+    )
+    parser.add_argument("model", nargs="+", help="model file(s) to serve")
+    parser.set_defaults(command=serve_command)
+
+    return parser
+
+
+def serve_command(args):
+    server = RenderServer(("127.0.0.1", args.port), [Path(m) for m in args.model])
+    log.info("Serving diagrams on http://127.0.0.1:%d/", server.server_port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+class ModelFile:
+    """A model, loaded from file.
+
+    The model is loaded again when the file content has changed.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.digest = ""
+        self.element_factory = ElementFactory()
+        self._modeling_language = ModelingLanguageService()
+        self._mtime: int | None = None
+
+    def refresh(self) -> None:
+        mtime = self.path.stat().st_mtime_ns
+        if mtime == self._mtime:
+            return
+
+        content = self.path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        if digest != self.digest:
+            self._load(content)
+            self.digest = digest
+        # Only remember the file once it's loaded, so a model that failed
+        # to load is loaded again on the next request
+        self._mtime = mtime
+
+    def _load(self, content: bytes) -> None:
+        log.info("Loading model %s", self.path)
+        element_factory = ElementFactory()
+        try:
+            storage.load(
+                io.StringIO(content.decode("utf-8")),
+                element_factory,
+                self._modeling_language,
+                update_diagrams=False,
+            )
+        except Exception:
+            element_factory.shutdown()
+            raise
+        self.element_factory.shutdown()
+        self.element_factory = element_factory
+
+    def diagrams(self) -> list[Diagram]:
+        return self.element_factory.lselect(Diagram)
+
+    def lookup_diagram(self, name: str) -> Diagram | None:
+        """Find a diagram by id or qualified name."""
+        if isinstance(diagram := self.element_factory.lookup(name), Diagram):
+            return diagram
+        return next(
+            (d for d in self.diagrams() if ".".join(d.qualifiedName) == name),
+            None,
+        )
+
+
+def diagram_fingerprint(model: ModelFile, diagram: Diagram, format: str) -> str:
+    """Fingerprint of a rendered diagram.
+
+    A diagram is rendered from the content of the model file it was
+    loaded from.
+    """
+    return hashlib.blake2b(
+        f"{model.digest}:{diagram.id}:{format}".encode(), digest_size=16
+    ).hexdigest()
+
+
+class RenderCache:
+    """Rendered diagrams, by diagram fingerprint.
+
+    Least recently used renders are evicted once more than ``max_size``
+    renders are cached.
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_RENDERS):
+        self.max_size = max_size
+        self._renders: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, fingerprint: str) -> bytes | None:
+        if (data := self._renders.get(fingerprint)) is not None:
+            self._renders.move_to_end(fingerprint)
+        return data
+
+    def put(self, fingerprint: str, data: bytes) -> None:
+        self._renders[fingerprint] = data
+        self._renders.move_to_end(fingerprint)
+        if len(self._renders) > self.max_size:
+            self._renders.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._renders)
+
+
+class RenderServer(HTTPServer):
+    """Render diagrams on request.
+
+    Requests are handled one at a time, so models are never accessed
+    concurrently.
+    """
+
+    def __init__(self, server_address, models: list[Path]):
+        super().__init__(server_address, RenderRequestHandler)
+        self.models = {path.name: ModelFile(path) for path in models}
+        self.render_cache = RenderCache()
+
+    def model(self, name: str) -> ModelFile | None:
+        if model := self.models.get(name):
+            model.refresh()
+        return model
+
+    def render(self, model: ModelFile, diagram: Diagram, format: str) -> bytes:
+        fingerprint = diagram_fingerprint(model, diagram, format)
+        if (data := self.render_cache.get(fingerprint)) is not None:
+            log.debug("Using cached render of %s", diagram.id)
+            return data
+
+        buffer = io.BytesIO()
+        SAVE_FUNCTIONS[format](buffer, diagram)
+        data = buffer.getvalue()
+        self.render_cache.put(fingerprint, data)
+        return data
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    server: RenderServer
+
+    def do_GET(self):
+        path = unquote(urlsplit(self.path).path).strip("/")
+        try:
+            if not path:
+                self.send_index()
+            else:
+                self.send_diagram(path)
+        except Exception as e:
+            # Includes errors while loading a model, such as parse errors
+            log.exception("Failed to render %s", path)
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+
+    def send_index(self):
+        index = {}
+        for name in self.server.models:
+            model = self.server.model(name)
+            assert model
+            index[name] = [
+                {"id": d.id, "name": ".".join(d.qualifiedName)}
+                for d in model.diagrams()
+            ]
+        self.send_data(json.dumps(index).encode("utf-8"), "application/json")
+
+    def send_diagram(self, path: str):
+        model_name, _, diagram_file = path.partition("/")
+        diagram_name, _, format = diagram_file.rpartition(".")
+
+        if format not in CONTENT_TYPES:
+            self.send_error(HTTPStatus.NOT_FOUND, f"Unsupported format '{format}'")
+        elif not (model := self.server.model(model_name)):
+            self.send_error(HTTPStatus.NOT_FOUND, f"Unknown model '{model_name}'")
+        elif not (diagram := model.lookup_diagram(diagram_name)):
+            self.send_error(HTTPStatus.NOT_FOUND, f"Unknown diagram '{diagram_name}'")
+        else:
+            self.send_data(
+                self.server.render(model, diagram, format), CONTENT_TYPES[format]
+            )
+
+    def send_data(self, data: bytes, content_type: str):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        log.debug(format, *args)
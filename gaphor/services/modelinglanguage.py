@@ -3,6 +3,7 @@ from typing import Dict, Iterable
 from gaphor.abc import ActionProvider, ModelingLanguage, Service
 from gaphor.action import action
 from gaphor.core import event_handler
+from gaphor.core.modeling.modelinglanguage import ElementTypeTable
 from gaphor.entrypoint import initialize
 from gaphor.services.properties import PropertyChanged
 
@@ -30,6 +31,7 @@ class ModelingLanguageService(Service, ActionProvider, ModelingLanguage):
         self._modeling_languages: Dict[str, ModelingLanguage] = initialize(
             "gaphor.modelinglanguages"
         )
+        self.rebuild_element_types()
         if event_manager:
             self.event_manager.subscribe(self.on_property_changed)
 
@@ -37,6 +39,14 @@ class ModelingLanguageService(Service, ActionProvider, ModelingLanguage):
         if self.event_manager:
             self.event_manager.unsubscribe(self.on_property_changed)
 
+    def rebuild_element_types(self) -> None:
+        """Look up element types in the current modeling languages.
+
+        Call this after the modeling languages have changed.
+        """
+        # Element types are looked up in all languages, in registration order
+        self._element_types = ElementTypeTable(self._modeling_languages.values())
+
     @property
     def modeling_languages(self) -> Iterable[tuple[str, str]]:
         """An Iterator, returns tuples (id, localized name)."""
@@ -72,16 +82,7 @@ class ModelingLanguageService(Service, ActionProvider, ModelingLanguage):
         return self._modeling_language().element_types
 
     def lookup_element(self, name):
-        return next(
-            filter(
-                None,
-                [
-                    provider.lookup_element(name)
-                    for provider in self._modeling_languages.values()
-                ],
-            ),
-            None,
-        )
+        return self._element_types.lookup(name)
 
     @action(name="select-modeling-language")
     def select_modeling_language(self, modeling_language: str):
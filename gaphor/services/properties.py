@@ -12,8 +12,6 @@ import pprint
 from pathlib import Path
 from typing import Dict
 
-from gi.repository import GLib
-
 from gaphor.abc import Service
 from gaphor.core import event_handler
 from gaphor.core.modeling.event import ModelFlushed
@@ -28,6 +26,8 @@ def get_config_dir() -> Path:
     This varies depending on platform.
     """
 
+    from gi.repository import GLib
+
     config_dir = Path(GLib.get_user_config_dir()) / "gaphor"
     config_dir.mkdir(exist_ok=True, parents=True)
 
@@ -40,6 +40,8 @@ def get_cache_dir() -> Path:
     This varies depending on platform.
     """
 
+    from gi.repository import GLib
+
     cache_dir = Path(GLib.get_user_cache_dir()) / "gaphor"
     cache_dir.mkdir(exist_ok=True, parents=True)
 
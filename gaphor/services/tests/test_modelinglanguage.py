@@ -1,5 +1,6 @@
 import pytest
 
+from gaphor.core.modeling.modelinglanguage import CoreModelingLanguage
 from gaphor.services.modelinglanguage import ModelingLanguageService
 
 
@@ -23,3 +24,15 @@ def test_lookup_sysml_element(modeling_language):
 
 def test_lookup_c4model_element(modeling_language):
     assert modeling_language.lookup_element("C4Database")
+
+
+def test_lookup_element_after_modeling_languages_change(modeling_language):
+    assert modeling_language.lookup_element("Class")
+
+    modeling_language._modeling_languages = {  # noqa: SLF001
+        "Core": CoreModelingLanguage()
+    }
+    modeling_language.rebuild_element_types()
+
+    assert modeling_language.lookup_element("Class") is None
+    assert modeling_language.lookup_element("Diagram")
@@ -1,11 +1,10 @@
 """Application settings support for Gaphor."""
 
+import functools
 import logging
 import sys
 from enum import Enum
 
-from gi.repository import Gio
-
 APPLICATION_ID = "org.gaphor.Gaphor"
 
 logger = logging.getLogger(__name__)
@@ -18,21 +17,28 @@ class StyleVariant(Enum):
 
 
 class Settings:
-    """Gaphor settings."""
+    """Gaphor settings.
+
+    The settings backend (Gio) is only loaded when a setting is accessed.
+    """
+
+    @functools.cached_property
+    def _gio_settings(self):
+        from gi.repository import Gio
 
-    def __init__(self):
         schema_source = Gio.SettingsSchemaSource.get_default()
-        self._gio_settings = (
+        gio_settings = (
             Gio.Settings.new(APPLICATION_ID)
             if schema_source and schema_source.lookup(APPLICATION_ID, False)
             else None
         )
-        if not self._gio_settings:
+        if not gio_settings:
             # Workaround: do not show this message if we're installing schemas
             if "install-schemas" not in sys.argv:
                 logger.warning(
                     "Settings schema not found and settings won’t be saved. Run `gaphor install-schemas`."
                 )
+        return gio_settings
 
     @property
     def style_variant(self) -> StyleVariant:
@@ -72,6 +78,8 @@ class Settings:
         )
 
     def bind_use_english(self, target, prop):
+        from gi.repository import Gio
+
         if self._gio_settings:
             self._gio_settings.bind(
                 "use-english", target, prop, Gio.SettingsBindFlags.DEFAULT
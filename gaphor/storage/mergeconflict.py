@@ -1,40 +1,149 @@
 from __future__ import annotations
 
+import contextlib
 import io
+import logging
+import marshal
+import os
+import tempfile
 from pathlib import Path
+from typing import NamedTuple
 
 from dulwich.errors import NotGitRepository
-from dulwich.index import IndexEntry
+from dulwich.index import ConflictedIndexEntry, IndexEntry
 from dulwich.repo import Repo
 
+from gaphor.application import distribution
+from gaphor.storage.parser import element
+from gaphor.storage.storage import parse_file
+
+log = logging.getLogger(__name__)
+
+# Maximum number of parsed blobs kept in the cache
+MAX_CACHED_BLOBS = 32
+
+# Version of the parsed records in the cache. Change it when the layout
+# of the records, or the way values are parsed, changes.
+RECORD_FORMAT = 1
+
+
+class ConflictBlobs(NamedTuple):
+    """Git blob ids (SHA's) of a conflicted file."""
+
+    ancestor: str
+    current: str
+    incoming: str
+
 
 def split_ours_and_theirs(
     filename: Path,
     ancestor: io.BufferedIOBase,
     current: io.BufferedIOBase,
     incoming: io.BufferedIOBase,
-) -> bool:
+) -> ConflictBlobs | None:
     """For a file name, find the current (this/ours), incoming (theirs/other),
     and ancestor (common) blobs and seralize those to the IO buffers.
+
+    Returns the blob ids, or ``None`` if the file is not in conflict.
     """
     try:
         repo = Repo.discover(filename)
     except NotGitRepository:
-        return False
+        return None
 
-    work_path = Path(repo.path)
     index = repo.open_index()
     if not index.has_conflicts():
-        return False
+        return None
+
+    try:
+        relpath = filename.resolve().relative_to(Path(repo.path).resolve())
+        entry = index[relpath.as_posix().encode("utf-8")]
+    except (ValueError, KeyError):
+        return None
+
+    if not isinstance(entry, ConflictedIndexEntry):
+        return None
 
-    def _write(index_entry: IndexEntry, destination: io.BufferedIOBase):
+    def _write(index_entry: IndexEntry, destination: io.BufferedIOBase) -> str:
         for data in repo.get_object(index_entry.sha).as_raw_chunks():
             destination.write(data)
+        return index_entry.sha.decode("ascii")
+
+    return ConflictBlobs(
+        ancestor=_write(entry.ancestor, ancestor),
+        current=_write(entry.this, current),
+        incoming=_write(entry.other, incoming),
+    )
+
+
+class ParsedBlobCache:
+    """Parsed element records of model files, by git blob id.
+
+    Blobs are immutable, so parsed records can be reused whenever a
+    conflicted model (or a shared ancestor) is opened again.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def parse(self, filename: Path, blob_id: str) -> tuple[dict[str, element], str]:
+        """Parse ``filename``, the content of blob ``blob_id``."""
+        if parsed := self.get(blob_id):
+            log.debug("Using cached model for blob %s", blob_id)
+            return parsed
+        elements, gaphor_version = parse_file(filename)
+        self.put(blob_id, elements, gaphor_version)
+        return elements, gaphor_version
+
+    def get(self, blob_id: str) -> tuple[dict[str, element], str] | None:
+        path = self._path(blob_id)
+        try:
+            data = path.read_bytes()
+            record_format, version, gaphor_version, records = marshal.loads(data)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if record_format != RECORD_FORMAT or version != distribution().version:
+            return None
+
+        # Mark the blob as recently used, so it's pruned last
+        with contextlib.suppress(OSError):
+            os.utime(path)
+
+        elements = {}
+        for id, type, values, references in records:
+            e = element(id, type)
+            e.values = values
+            e.references = references
+            elements[id] = e
+        return elements, gaphor_version
+
+    def put(
+        self, blob_id: str, elements: dict[str, element], gaphor_version: str
+    ) -> None:
+        records = [(e.id, e.type, e.values, e.references) for e in elements.values()]
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, prefix=".", suffix=".tmp", delete=False
+            ) as tmp_file:
+                marshal.dump(
+                    (RECORD_FORMAT, distribution().version, gaphor_version, records),
+                    tmp_file,
+                )
+            os.replace(tmp_file.name, self._path(blob_id))
+            self.prune()
+        except (OSError, ValueError):
+            log.warning("Could not cache model for blob %s", blob_id, exc_info=True)
+
+    def _path(self, blob_id: str) -> Path:
+        return self.cache_dir / f"{blob_id}-{RECORD_FORMAT}"
 
-    for relpath, entry in index.iteritems():
-        if work_path / relpath.decode("utf-8") == filename:
-            _write(entry.ancestor, ancestor)
-            _write(entry.this, current)
-            _write(entry.other, incoming)
-            return True
-    return False
+    def prune(self, max_blobs: int = MAX_CACHED_BLOBS) -> None:
+        """Remove the least recently used blobs."""
+        blobs = sorted(
+            (p for p in self.cache_dir.iterdir() if p.suffix != ".tmp"),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for blob in blobs[:-max_blobs]:
+            blob.unlink(missing_ok=True)
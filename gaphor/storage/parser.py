@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import logging
 import os
+import sys
 from collections import OrderedDict
 from xml.sax import SAXParseException, handler, xmlreader
 
@@ -44,6 +45,9 @@ class base:
         self.references: dict[str, str | list[str]] = {}
 
     def __getattr__(self, key):
+        # Keep special lookups (e.g. by pickle) away from the values
+        if key.startswith("__"):
+            raise AttributeError(key)
         try:
             return self.__getitem__(key)
         except KeyError as e:
@@ -101,6 +105,10 @@ class MergeConflictDetected(Exception):
 
 State = int
 
+# Values up to this length are shared between elements while loading,
+# such as visibility, booleans and diagram types
+SHARED_VALUE_LENGTH = 32
+
 
 class GaphorLoader(handler.ContentHandler):
     """Create a list of elements.
@@ -108,6 +116,9 @@ class GaphorLoader(handler.ContentHandler):
     an element may contain a canvas and a canvas may contain canvas
     items. Each element can have values and references to other
     elements.
+
+    Ids, type names and attribute names are interned. Short values are
+    shared, so equal values take memory only once.
     """
 
     def __init__(self):
@@ -147,7 +158,8 @@ class GaphorLoader(handler.ContentHandler):
         self.gaphor_version = ""
         self.elements: dict[str, element] = OrderedDict()
         self._stack: list[tuple[element | canvas, State]] = []
-        self.text = ""
+        self._text: list[str] = []
+        self._values: dict[str, str] = {}
         self._start_element_handlers = (
             self.start_element,
             self.start_canvas,
@@ -160,11 +172,23 @@ class GaphorLoader(handler.ContentHandler):
         )
 
     def endDocument(self):
+        self._values.clear()
         if len(self._stack) != 0:
             raise ParserException("Invalid XML document.")
 
+    @property
+    def text(self) -> str:
+        """Text read since the last start tag."""
+        return "".join(self._text)
+
+    def shared_value(self, value: str) -> str:
+        """Return an equal value read before, if there is one."""
+        if len(value) > SHARED_VALUE_LENGTH:
+            return value
+        return self._values.setdefault(value, value)
+
     def startElement(self, name, attrs):
-        self.text = ""
+        self._text = []
 
         state = self.state()
 
@@ -177,8 +201,8 @@ class GaphorLoader(handler.ContentHandler):
         if state == GAPHOR:
             if "id" not in attrs:
                 log.exception(f"File corrupt: Element {name} has no id")
-            id = attrs["id"]
-            e = element(id, name)
+            id = sys.intern(attrs["id"])
+            e = element(id, sys.intern(name))
             if id in self.elements.keys():
                 log.exception(
                     f"File corrupt: duplicate element. Remove element {name} with id {id} and try again"
@@ -217,7 +241,7 @@ class GaphorLoader(handler.ContentHandler):
         # to store the <ref>, <reflist> or <val> content:
         if state in (ELEMENT, DIAGRAM, CANVAS, ITEM):
             # handle 'normal' attributes
-            self.push(name, ATTR)
+            self.push(sys.intern(name), ATTR)
             return True
 
     def start_reference(self, state, name, attrs):
@@ -229,7 +253,7 @@ class GaphorLoader(handler.ContentHandler):
         # Reference with multiplicity 1:
         elif state == ATTR and name == "ref":
             n = self.peek()
-            self.peek(2).references[n] = attrs["refid"]
+            self.peek(2).references[n] = sys.intern(attrs["refid"])
             self.push(None, REF)
             return True
 
@@ -238,7 +262,7 @@ class GaphorLoader(handler.ContentHandler):
             n = self.peek()
             # Fetch the element instance from the stack
             r = self.peek(3).references
-            refid = attrs["refid"]
+            refid = sys.intern(attrs["refid"])
             try:
                 r[n].append(refid)
             except KeyError:
@@ -272,7 +296,7 @@ class GaphorLoader(handler.ContentHandler):
             # Two levels up: the attribute name
             n = self.peek(2)
             # Three levels up: the element instance
-            self.peek(3).values[n] = self.text
+            self.peek(3).values[n] = self.shared_value(self.text)
         elif self.state() == ITEM:
             item = self.pop()
             new_canvasitems = upgrade_canvasitem(item, self.gaphor_version)
@@ -291,8 +315,12 @@ class GaphorLoader(handler.ContentHandler):
             self.endElement(name[1])
 
     def characters(self, content):
-        """Read characters."""
-        self.text = self.text + content
+        """Read characters.
+
+        Long values are delivered in many chunks. Chunks are joined once,
+        when the value is complete.
+        """
+        self._text.append(content)
 
 
 def parse(filename) -> dict[str, element]:
@@ -0,0 +1,316 @@
+"""Report statistics of a Gaphor model.
+
+``gaphor stats MODEL`` loads a model and reports the number of elements
+per type, the fan-out of associations, approximate memory use per type,
+the time it takes to load, save and render the model, and the largest
+attribute values.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import io
+import json
+import statistics
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+from gaphor.abc import Service
+from gaphor.application import Session
+from gaphor.core.modeling import Diagram, Element, ElementFactory, Presentation
+from gaphor.core.modeling.collection import collection
+from gaphor.core.modeling.properties import association, attribute, unioncache
+from gaphor.storage import storage
+
+
+def stats_parser():
+    parser = argparse.ArgumentParser(
+        description="Report element counts, memory use and timings of a Gaphor model."
+    )
+    parser.add_argument(
+        "-n",
+        "--top",
+        type=int,
+        default=10,
+        help="number of associations and attribute values to report, default 10",
+    )
+    parser.add_argument(
+        "--no-render", action="store_true", help="do not measure rendering time"
+    )
+    parser.add_argument("--json", action="store_true", help="write statistics as JSON")
+    parser.add_argument("model")
+    parser.set_defaults(command=stats_command)
+
+    return parser
+
+
+def stats_command(args):
+    session = Session(
+        services=[
+            "event_manager",
+            "component_registry",
+            "element_factory",
+            "element_dispatcher",
+            "modeling_language",
+        ]
+    )
+    element_factory = session.get_service("element_factory")
+    modeling_language = session.get_service("modeling_language")
+
+    stats = model_statistics(
+        args.model,
+        element_factory,
+        modeling_language,
+        top=args.top,
+        render=not args.no_render,
+    )
+
+    if args.json:
+        json.dump(asdict(stats), sys.stdout, indent=2)
+    else:
+        print_statistics(stats)
+    session.shutdown()
+    return 0
+
+
+@dataclass
+class TypeStatistics:
+    """Number of elements of a type, and their approximate memory use in
+    bytes."""
+
+    count: int = 0
+    elements: int = 0
+    collections: int = 0
+    unioncaches: int = 0
+    shapes: int = 0
+
+    @property
+    def memory(self) -> int:
+        return self.elements + self.collections + self.unioncaches + self.shapes
+
+
+@dataclass
+class FanOut:
+    """Distribution of the number of elements referenced by an
+    association."""
+
+    type: str
+    association: str
+    count: int
+    mean: float
+    median: float
+    max: int
+
+
+@dataclass
+class AttributeValue:
+    id: str
+    type: str
+    attribute: str
+    size: int
+
+
+@dataclass
+class ModelStatistics:
+    elements: int
+    timings: dict[str, float]
+    types: dict[str, TypeStatistics] = field(default_factory=dict)
+    fan_out: list[FanOut] = field(default_factory=list)
+    largest_values: list[AttributeValue] = field(default_factory=list)
+
+
+def model_statistics(
+    filename, element_factory: ElementFactory, modeling_language, top=10, render=True
+) -> ModelStatistics:
+    """Load a model and gather its statistics."""
+    timings = {}
+
+    with timer(timings, "load"):
+        with open(filename, encoding="utf-8") as file_obj:
+            storage.load(file_obj, element_factory, modeling_language)
+
+    with timer(timings, "save"):
+        storage.save(io.StringIO(), element_factory)
+
+    if render:
+        from gaphor.diagram.export import save_svg
+
+        with timer(timings, "render"):
+            for diagram in element_factory.select(Diagram):
+                save_svg(io.BytesIO(), diagram)
+
+    return ModelStatistics(
+        elements=element_factory.size(),
+        timings=timings,
+        types=type_statistics(element_factory.values()),
+        fan_out=fan_out(element_factory.values())[:top],
+        largest_values=largest_values(element_factory.values())[:top],
+    )
+
+
+class timer:
+    def __init__(self, timings: dict[str, float], name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.timings[self.name] = time.perf_counter() - self.start
+
+
+def type_statistics(elements: Iterable[Element]) -> dict[str, TypeStatistics]:
+    """Element count and memory use per element type.
+
+    Objects shared by elements, such as the constraint solver of a
+    diagram, are counted once.
+    """
+    types: dict[str, TypeStatistics] = defaultdict(TypeStatistics)
+    seen: set[int] = set()
+    for element in elements:
+        stats = types[type(element).__name__]
+        stats.count += 1
+        stats.elements += sys.getsizeof(element) + sys.getsizeof(vars(element))
+        stats.elements += sum(
+            sizeof(getattr(element, slot, None), seen) for slot in _slots(type(element))
+        )
+        for name, value in vars(element).items():
+            if isinstance(value, collection):
+                stats.collections += sys.getsizeof(value) + sys.getsizeof(value.items)
+            elif isinstance(value, unioncache):
+                stats.unioncaches += sys.getsizeof(value) + sizeof(value.data, seen)
+            elif isinstance(element, Presentation) and name != "_id":
+                stats.shapes += sizeof(value, seen)
+            else:
+                stats.elements += sizeof(value, seen)
+    return dict(sorted(types.items(), key=lambda t: -t[1].memory))
+
+
+def sizeof(obj: object, seen: set[int] | None = None) -> int:
+    """Approximate size of an object in bytes, including the objects it
+    refers to.
+
+    Model elements, services, functions, types and modules are not
+    included.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen or isinstance(
+        obj,
+        (
+            Element,
+            Service,
+            type,
+            ModuleType,
+            FunctionType,
+            MethodType,
+            BuiltinFunctionType,
+            collection,
+        ),
+    ):
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sizeof(k, seen) + sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(sizeof(v, seen) for v in obj)
+    elif hasattr(obj, "__dict__"):
+        size += sizeof(vars(obj), seen)
+    for slot in getattr(type(obj), "__slots__", ()):
+        size += sizeof(getattr(obj, slot, None), seen)
+    return size
+
+
+@functools.cache
+def _slots(element_type: type) -> list[str]:
+    return [
+        slot
+        for cls in element_type.__mro__
+        for slot in getattr(cls, "__slots__", ())
+        if slot not in ("__dict__", "__weakref__")
+    ]
+
+
+@functools.cache
+def _properties(element_type: type[Element], kind: type) -> list:
+    return [p for p in element_type.umlproperties() if isinstance(p, kind)]
+
+
+def fan_out(elements: Iterable[Element]) -> list[FanOut]:
+    """Fan-out of all many-valued associations, widest first."""
+    sizes: dict[tuple[str, str], list[int]] = defaultdict(list)
+    for element in elements:
+        for prop in _properties(type(element), association):
+            if prop.upper != 1:
+                sizes[(type(element).__name__, prop.name)].append(
+                    len(prop.get(element))
+                )
+
+    return sorted(
+        (
+            FanOut(
+                type=type_name,
+                association=name,
+                count=len(values),
+                mean=statistics.fmean(values),
+                median=statistics.median(values),
+                max=max(values),
+            )
+            for (type_name, name), values in sizes.items()
+            if any(values)
+        ),
+        key=lambda f: (-f.max, -f.mean),
+    )
+
+
+def largest_values(elements: Iterable[Element]) -> list[AttributeValue]:
+    """Attribute values, largest first."""
+
+    def values() -> Iterator[AttributeValue]:
+        for element in elements:
+            for prop in _properties(type(element), attribute):
+                value = prop.get(element)
+                if isinstance(value, str) and value:
+                    yield AttributeValue(
+                        element.id, type(element).__name__, prop.name, len(value)
+                    )
+
+    return sorted(values(), key=lambda v: -v.size)
+
+
+def print_statistics(stats: ModelStatistics) -> None:
+    print(f"{stats.elements} elements")  # noqa: T201
+    for name, seconds in stats.timings.items():
+        print(f"{name:>8}: {seconds * 1000:.0f} ms")  # noqa: T201
+
+    print()  # noqa: T201
+    print(  # noqa: T201
+        f"{'type':30} {'count':>7} {'memory':>10} {'elements':>10} "
+        f"{'colls':>10} {'unions':>10} {'shapes':>10}"
+    )
+    for name, t in stats.types.items():
+        print(  # noqa: T201
+            f"{name:30} {t.count:7} {t.memory:10} {t.elements:10} "
+            f"{t.collections:10} {t.unioncaches:10} {t.shapes:10}"
+        )
+
+    print()  # noqa: T201
+    print(f"{'association':50} {'count':>7} {'mean':>7} {'median':>7} {'max':>7}")  # noqa: T201
+    for f in stats.fan_out:
+        print(  # noqa: T201
+            f"{f.type + '.' + f.association:50} {f.count:7} {f.mean:7.1f} "
+            f"{f.median:7.1f} {f.max:7}"
+        )
+
+    print()  # noqa: T201
+    print(f"{'attribute':50} {'size':>7}  id")  # noqa: T201
+    for v in stats.largest_values:
+        print(f"{v.type + '.' + v.attribute:50} {v.size:7}  {v.id}")  # noqa: T201
@@ -8,7 +8,9 @@ __all__ = ["load", "save"]
 
 import io
 import logging
+from contextlib import ExitStack
 from functools import partial
+from pathlib import Path
 from typing import Callable, Iterable
 
 from gaphor import application
@@ -124,9 +126,15 @@ def save_element(name, value, element_factory, writer):
         save_value(name, value)
 
 
-def load_elements(elements, element_factory, modeling_language, gaphor_version="1.0.0"):
+def load_elements(
+    elements,
+    element_factory,
+    modeling_language,
+    gaphor_version="1.0.0",
+    update_diagrams=True,
+):
     for _ in load_elements_generator(
-        elements, element_factory, modeling_language, gaphor_version
+        elements, element_factory, modeling_language, gaphor_version, update_diagrams
     ):
         pass
 
@@ -136,9 +144,14 @@ def load_elements_generator(
     element_factory: ElementFactory,
     modeling_language: ModelingLanguage,
     gaphor_version: str,
+    update_diagrams: bool = True,
 ) -> Iterable[float]:
     """Load a file and create a model if possible.
 
+    If ``update_diagrams`` is false, diagrams are not updated after
+    loading. Their items are updated (and text is measured) once the
+    diagram is updated, e.g. when it is rendered.
+
     Exceptions: IOError, ValueError.
     """
     log.debug(f"Loading {len(elements)} elements")
@@ -166,13 +179,19 @@ def load_elements_generator(
 
     upgrade_ensure_style_sheet_is_present(element_factory)
 
-    for _id, elem in list(elements.items()):
-        yield from update_status_queue()
-        assert elem.element
-        elem.element.postload()
+    with ExitStack() as deferred:
+        if not update_diagrams:
+            for diagram in element_factory.select(Diagram):
+                deferred.enter_context(diagram.deferred_updates())
 
-    for diagram in element_factory.select(Diagram):
-        diagram.update()
+        for _id, elem in list(elements.items()):
+            yield from update_status_queue()
+            assert elem.element
+            elem.element.postload()
+
+    if update_diagrams:
+        for diagram in element_factory.select(Diagram):
+            diagram.update()
 
 
 def _load_elements_and_canvasitems(
@@ -264,14 +283,23 @@ def _load_attributes_and_references(elements, update_status_queue):
 
 
 def load(
-    file_obj: io.TextIOBase, element_factory, modeling_language, status_queue=None
+    file_obj: io.TextIOBase,
+    element_factory,
+    modeling_language,
+    status_queue=None,
+    update_diagrams=True,
 ):
     """Load a file and create a model if possible.
 
     Optionally, a status queue function can be given, to which the
     progress is written (as status_queue(progress)).
+
+    Scripts that only query the model can set ``update_diagrams`` to
+    false. Diagrams are then updated when they are rendered.
     """
-    for status in load_generator(file_obj, element_factory, modeling_language):
+    for status in load_generator(
+        file_obj, element_factory, modeling_language, update_diagrams
+    ):
         if status_queue:
             status_queue(status)
 
@@ -280,6 +308,7 @@ def load_generator(
     file_obj: io.TextIOBase,
     element_factory: ElementFactory,
     modeling_language: ModelingLanguage,
+    update_diagrams: bool = True,
 ) -> Iterable[int]:
     """Load a file and create a model if possible.
 
@@ -296,9 +325,46 @@ def load_generator(
         else:
             yield percentage
 
-    elements = loader.elements
-    gaphor_version = loader.gaphor_version
+    for percentage in load_parsed_generator(
+        loader.elements,
+        loader.gaphor_version,
+        element_factory,
+        modeling_language,
+        update_diagrams,
+    ):
+        if percentage:
+            yield percentage / 2 + 50
+        else:
+            yield percentage
+
+    yield 100
+
 
+def parse_file(filename: Path) -> tuple[dict[str, element], str]:
+    """Parse a model file into element records and the Gaphor version.
+
+    No model elements are created. Element records can be pickled,
+    so this function can be run in a worker process.
+    """
+    loader = GaphorLoader()
+    with filename.open(encoding="utf-8", errors="replace") as file_obj:
+        for _ in parse_generator(file_obj, loader):
+            pass
+    return loader.elements, loader.gaphor_version
+
+
+def load_parsed_generator(
+    elements: dict[str, element],
+    gaphor_version: str,
+    element_factory: ElementFactory,
+    modeling_language: ModelingLanguage,
+    update_diagrams: bool = True,
+) -> Iterable[float]:
+    """Create a model from parsed element records.
+
+    This function is a generator. It will yield values from 0 to 100 (%)
+    to indicate its progression.
+    """
     if version_lower_than(gaphor_version, (0, 17, 0)):
         raise ValueError(
             f"Gaphor model version should be at least 0.17.0 (found {gaphor_version})"
@@ -308,15 +374,13 @@ def load_generator(
 
     element_factory.flush()
     with element_factory.block_events():
-        for percentage in load_elements_generator(
-            elements, element_factory, modeling_language, gaphor_version
-        ):
-            if percentage:
-                yield percentage / 2 + 50
-            else:
-                yield percentage
-
-    yield 100
+        yield from load_elements_generator(
+            elements,
+            element_factory,
+            modeling_language,
+            gaphor_version,
+            update_diagrams,
+        )
 
 
 def version_lower_than(gaphor_version, version):
@@ -1,9 +1,12 @@
 import io
+import os
 
 import pytest
 from dulwich.repo import Repo
 
-from gaphor.storage.mergeconflict import split_ours_and_theirs
+from gaphor import UML
+from gaphor.storage import mergeconflict
+from gaphor.storage.mergeconflict import ParsedBlobCache, split_ours_and_theirs
 from gaphor.storage.tests.fixtures import create_merge_conflict
 
 
@@ -30,3 +33,89 @@ def test_split_git_repo(tmp_path):
     assert ancestor.getbuffer() == b"Initial commit"
     assert ours.getbuffer() == b"Second commit"
     assert theirs.getbuffer() == b"Branch commit"
+
+
+@pytest.mark.filterwarnings("ignore:use .* Repo._get_user_identity:DeprecationWarning")
+def test_split_file_in_subdirectory(tmp_path):
+    repo = Repo.init(tmp_path)
+    (tmp_path / "models").mkdir()
+    test_file = tmp_path / "models" / "testfile.txt"
+
+    create_merge_conflict(
+        repo,
+        test_file,
+        initial_text="Initial commit",
+        our_text="Second commit",
+        their_text="Branch commit",
+    )
+
+    ancestor = io.BytesIO()
+    ours = io.BytesIO()
+    theirs = io.BytesIO()
+    result = split_ours_and_theirs(test_file, ancestor, ours, theirs)
+
+    assert result
+    assert result.current == repo.open_index()[b"models/testfile.txt"].this.sha.decode()
+    assert ours.getbuffer() == b"Second commit"
+
+
+def test_split_file_without_repo(tmp_path):
+    test_file = tmp_path / "testfile.txt"
+    test_file.write_text("text")
+
+    result = split_ours_and_theirs(test_file, io.BytesIO(), io.BytesIO(), io.BytesIO())
+
+    assert result is None
+
+
+def test_parsed_blob_cache(element_factory, saver, tmp_path):
+    element_factory.create(UML.Class)
+    model_file = tmp_path / "model.gaphor"
+    model_file.write_text(saver(), encoding="utf-8")
+    cache = ParsedBlobCache(tmp_path / "cache")
+
+    elements, gaphor_version = cache.parse(model_file, "1234")
+    model_file.unlink()
+    cached_elements, cached_gaphor_version = cache.parse(model_file, "1234")
+
+    assert cached_gaphor_version == gaphor_version
+    assert [(e.id, e.type, e.values, e.references) for e in elements.values()] == [
+        (e.id, e.type, e.values, e.references) for e in cached_elements.values()
+    ]
+
+
+def test_parsed_blob_cache_ignores_other_record_formats(
+    element_factory, saver, tmp_path, monkeypatch
+):
+    element_factory.create(UML.Class)
+    model_file = tmp_path / "model.gaphor"
+    model_file.write_text(saver(), encoding="utf-8")
+    cache = ParsedBlobCache(tmp_path / "cache")
+    cache.parse(model_file, "1234")
+
+    monkeypatch.setattr(mergeconflict, "RECORD_FORMAT", mergeconflict.RECORD_FORMAT + 1)
+
+    assert cache.get("1234") is None
+
+
+def test_parsed_blob_cache_prunes_old_blobs(tmp_path):
+    cache = ParsedBlobCache(tmp_path)
+
+    for n in range(5):
+        cache.put(f"blob{n}", {}, "1.0.0")
+    cache.prune(max_blobs=2)
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_parsed_blob_cache_prunes_least_recently_used_blobs(tmp_path):
+    cache = ParsedBlobCache(tmp_path)
+
+    for n in range(3):
+        cache.put(f"blob{n}", {}, "1.0.0")
+        os.utime(cache.cache_dir / f"blob{n}-{mergeconflict.RECORD_FORMAT}", (n, n))
+    cache.get("blob0")
+    cache.prune(max_blobs=2)
+
+    assert cache.get("blob0")
+    assert cache.get("blob1") is None
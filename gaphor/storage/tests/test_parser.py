@@ -61,3 +61,62 @@ def test_parsing_of_xml_external_entities_should_fail():
 
     with pytest.raises(EntitiesForbidden):
         parse(model)
+
+
+def test_parsing_of_large_values():
+    # The parser feeds a file line by line, so this value arrives
+    # in 100,000 chunks. Accumulating those should take linear time.
+    value = ("QUJDREVGR0hJSktM" * 5 + "\n") * 100_000
+    model = StringIO(
+        f"""<?xml version="1.0" encoding="utf-8"?>
+        <gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="2.25.1">
+         <Picture id="0">
+          <content>
+           <val>{value}</val>
+          </content>
+         </Picture>
+        </gaphor>"""
+    )
+
+    elements = parse(model)
+
+    assert elements["0"].values["content"] == value
+
+
+def test_parsing_shares_ids_and_values():
+    model = StringIO(
+        """<?xml version="1.0" encoding="utf-8"?>
+        <gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="2.25.1">
+         <Package id="1">
+          <ownedType>
+           <reflist>
+            <ref refid="2"/>
+            <ref refid="3"/>
+           </reflist>
+          </ownedType>
+         </Package>
+         <Class id="2">
+          <package>
+           <ref refid="1"/>
+          </package>
+          <isAbstract>
+           <val>1</val>
+          </isAbstract>
+         </Class>
+         <Class id="3">
+          <package>
+           <ref refid="1"/>
+          </package>
+          <isAbstract>
+           <val>1</val>
+          </isAbstract>
+         </Class>
+        </gaphor>"""
+    )
+
+    elements = parse(model)
+
+    assert elements["2"].references["package"] is elements["1"].id
+    assert elements["1"].references["ownedType"][1] is elements["3"].id
+    assert elements["2"].type is elements["3"].type
+    assert elements["2"].values["isAbstract"] is elements["3"].values["isAbstract"]
@@ -1,13 +1,14 @@
 """Unittest the storage and parser modules."""
 
+import pickle
 import re
 from io import StringIO
 
 import pytest
 
 from gaphor import UML
-from gaphor.core.modeling import Comment, Diagram, StyleSheet
-from gaphor.diagram.general import CommentItem
+from gaphor.core.modeling import Comment, Diagram, Picture, StyleSheet
+from gaphor.diagram.general import Box, CommentItem
 from gaphor.diagram.tests.fixtures import connect
 from gaphor.storage import storage
 from gaphor.UML.classes import AssociationItem, ClassItem, InterfaceItem
@@ -327,3 +328,59 @@ def test_save_and_load_with_invalid_reference(element_factory, saver, loader):
 
     assert not hasattr(package, "foobar")
     assert not package.name
+
+
+def test_parsed_elements_can_be_loaded_from_another_process(
+    element_factory, modeling_language, saver, tmp_path
+):
+    p = element_factory.create(UML.Package)
+    p.name = "name"
+    model_file = tmp_path / "model.gaphor"
+    model_file.write_text(saver(), encoding="utf-8")
+
+    elements, gaphor_version = pickle.loads(
+        pickle.dumps(storage.parse_file(model_file))
+    )
+    element_factory.flush()
+    for _ in storage.load_parsed_generator(
+        elements, gaphor_version, element_factory, modeling_language
+    ):
+        pass
+
+    package = next(element_factory.select(UML.Package))
+
+    assert package.name == "name"
+
+
+def test_load_picture_content_in_line(element_factory, loader):
+    loader(
+        """<?xml version="1.0" encoding="utf-8"?>
+<gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="2.25.1">
+<Picture id="1"><content><val>aW1hZ2UgZGF0YQ==</val></content></Picture>
+</gaphor>"""
+    )
+
+    picture = next(element_factory.select(Picture))
+
+    assert picture.content == "aW1hZ2UgZGF0YQ=="
+
+
+def test_load_model_without_updating_diagrams(
+    element_factory, modeling_language, test_models, monkeypatch
+):
+    updated = []
+    monkeypatch.setattr(Box, "update", lambda self, context: updated.append(self))
+
+    with open(test_models / "simple-items.gaphor", encoding="utf-8") as ifile:
+        storage.load(
+            ifile,
+            element_factory=element_factory,
+            modeling_language=modeling_language,
+            update_diagrams=False,
+        )
+
+    assert not updated
+
+    next(element_factory.select(Diagram)).update()
+
+    assert updated == [next(element_factory.select(Box))]
@@ -1,4 +1,4 @@
-from gaphor.entrypoint import init_entry_points
+from gaphor.entrypoint import init_entry_points, load_entry_points
 
 
 class ServiceA:
@@ -48,3 +48,27 @@ def test_load_multi_dependent_service():
     assert isinstance(initialized["service_c"], ServiceC)
     assert initialized["service_a"] is initialized["service_c"].service_a
     assert initialized["service_b"] is initialized["service_c"].service_b
+
+
+class EntryPoint:
+    def __init__(self, name, cls):
+        self.name = name
+        self.cls = cls
+        self.loaded = False
+
+    def load(self):
+        self.loaded = True
+        return self.cls
+
+
+def test_only_requested_entry_points_are_loaded(monkeypatch):
+    entry_points = [EntryPoint("service_a", ServiceA), EntryPoint("other", ServiceB)]
+    monkeypatch.setattr(
+        "gaphor.entrypoint.list_entry_points", lambda scope: entry_points
+    )
+
+    services = load_entry_points("test.scope", ["service_a"])
+
+    assert services == {"service_a": ServiceA}
+    assert entry_points[0].loaded
+    assert not entry_points[1].loaded
@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 import gaphor.ui
-from gaphor.main import main
+from gaphor.main import main, requested_command
 
 APP_NAME = sys.argv[0]
 
@@ -59,3 +59,21 @@ def test_run_script(capsys):
     main([APP_NAME, "exec", str(run_script)])
 
     assert "Running a test script for Gaphor" in capsys.readouterr().out
+
+
+def test_only_requested_command_is_loaded():
+    assert requested_command(["exec", "script.py"]) == ["exec"]
+
+
+def test_all_commands_are_loaded_for_default_command():
+    assert requested_command(["model.gaphor"]) is None
+    assert requested_command([]) is None
+
+
+def test_import_times(capsys):
+    run_script = Path(__file__).parent / "run_script.py"
+
+    exit_code = main([APP_NAME, "exec", "--import-times", str(run_script)])
+
+    assert exit_code == 0
+    assert "Slowest imports" in capsys.readouterr().out
@@ -14,6 +14,8 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Gdk", "4.0")
 gi.require_version("GtkSource", "5")
 gi.require_version("Adw", "1")
+gi.require_version("Pango", "1.0")
+gi.require_version("PangoCairo", "1.0")
 
 from gi.repository import Adw, Gio, GtkSource
 
@@ -2,22 +2,26 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Callable, Collection
 
-from gi.repository import Gdk, GLib, GObject
+from gi.repository import Gdk, Gio, GLib
 
 from gaphor.abc import ActionProvider, Service
 from gaphor.core import Transaction, action
 from gaphor.core.modeling import Diagram, Presentation
-from gaphor.diagram.copypaste import Opaque, copy_full, paste_full, paste_link
+from gaphor.diagram.copypaste import (
+    Opaque,
+    copy_full,
+    decode_copy_data,
+    encode_copy_data,
+    paste_full,
+    paste_link,
+)
 
+COPY_MIME_TYPE = "application/x-gaphor-copy-data"
 
-class CopyBuffer(GObject.Object):
-    def __init__(self, buffer):
-        super().__init__()
-        self.buffer = buffer
-
-    buffer = GObject.Property(type=object)
+log = logging.getLogger(__name__)
 
 
 class CopyService(Service, ActionProvider):
@@ -46,10 +50,17 @@ class CopyService(Service, ActionProvider):
         pass
 
     def copy(self, items: Collection[Presentation]) -> None:
+        """Copy items to the clipboard.
+
+        Copy data is stored in a serialized form, so it can be pasted in
+        other Gaphor processes, and is only decoded when pasted.
+        """
         if items:
             copy_buffer = copy_full(items, self.element_factory.lookup)
-            v = GObject.Value(CopyBuffer.__gtype__, CopyBuffer(buffer=copy_buffer))
-            self.clipboard.set_content(Gdk.ContentProvider.new_for_value(v))
+            data = GLib.Bytes.new(encode_copy_data(copy_buffer))
+            self.clipboard.set_content(
+                Gdk.ContentProvider.new_for_bytes(COPY_MIME_TYPE, data)
+            )
 
     def paste_link(
         self,
@@ -71,17 +82,40 @@ class CopyService(Service, ActionProvider):
         paster: Callable[[Opaque, Diagram], set[Presentation]],
         callback: Callable[[set[Presentation]], None] | None,
     ) -> None:
-        def on_paste(_source_object, result):
+        def on_read(_source_object, result):
             try:
-                copy_buffer = self.clipboard.read_value_finish(result)
+                stream, _mime_type = self.clipboard.read_finish(result)
             except GLib.GError as e:
                 if str(e).startswith("g-io-error-quark:"):
                     return
                 raise
 
+            buffer = Gio.MemoryOutputStream.new_resizable()
+            buffer.splice_async(
+                stream,
+                Gio.OutputStreamSpliceFlags.CLOSE_SOURCE
+                | Gio.OutputStreamSpliceFlags.CLOSE_TARGET,
+                GLib.PRIORITY_DEFAULT,
+                None,
+                on_paste,
+            )
+
+        def on_paste(buffer, result):
+            try:
+                buffer.splice_finish(result)
+            except GLib.GError as e:
+                log.warning("Could not read clipboard data: %s", e)
+                return
+
+            try:
+                copy_buffer = decode_copy_data(buffer.steal_as_bytes().get_data())
+            except ValueError:
+                log.warning("Clipboard does not contain valid copy data")
+                return
+
             with Transaction(self.event_manager):
                 # Create new id's that have to be used to create the items:
-                new_items = paster(copy_buffer.buffer, diagram)
+                new_items = paster(copy_buffer, diagram)
 
                 # move pasted items a bit, so user can see result of his action :)
                 for item in new_items:
@@ -91,11 +125,11 @@ class CopyService(Service, ActionProvider):
             if callback:
                 callback(new_items)
 
-        self.clipboard.read_value_async(
-            CopyBuffer.__gtype__,
+        self.clipboard.read_async(
+            [COPY_MIME_TYPE],
             io_priority=GLib.PRIORITY_DEFAULT,
             cancellable=None,
-            callback=on_paste,
+            callback=on_read,
         )
 
     @action(
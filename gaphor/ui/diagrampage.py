@@ -258,7 +258,7 @@ class DiagramPage:
         )
 
         view = self.view
-        item_painter = ItemPainter(view.selection, dark_mode)
+        item_painter = ItemPainter(view.selection, dark_mode, cache_items=True)
 
         if sloppiness := style.get("line-style", 0.0):
             item_painter = FreeHandPainter(item_painter, sloppiness=sloppiness)
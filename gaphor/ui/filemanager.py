@@ -3,8 +3,15 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import tempfile
-from functools import partial
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
 from typing import Callable
 
@@ -23,8 +30,13 @@ from gaphor.event import (
     SessionShutdown,
     SessionShutdownRequested,
 )
+from gaphor.services.properties import get_cache_dir
 from gaphor.storage import storage
-from gaphor.storage.mergeconflict import split_ours_and_theirs
+from gaphor.storage.mergeconflict import (
+    ConflictBlobs,
+    ParsedBlobCache,
+    split_ours_and_theirs,
+)
 from gaphor.storage.parser import MergeConflictDetected
 from gaphor.ui.errorhandler import error_handler
 from gaphor.ui.filedialog import GAPHOR_FILTER, save_file_dialog
@@ -33,6 +45,9 @@ from gaphor.ui.statuswindow import StatusWindow
 DEFAULT_EXT = ".gaphor"
 MAX_RECENT = 10
 
+# Below this (combined) file size, starting worker processes costs more than parsing
+PARALLEL_PARSE_THRESHOLD = 1_000_000
+
 log = logging.getLogger(__name__)
 
 
@@ -110,7 +125,12 @@ class FileManager(Service, ActionProvider):
     def load_template(self, template):
         storage.load(template, self.element_factory, self.modeling_language)
 
-    def load(self, filename: Path, on_load_done: Callable[[], None] | None = None):
+    def load(
+        self,
+        filename: Path,
+        on_load_done: Callable[[], None] | None = None,
+        blob_id: str | None = None,
+    ):
         """Load the Gaphor model from the supplied file name.
 
         A status window displays the loading progress. The load
@@ -134,7 +154,9 @@ class FileManager(Service, ActionProvider):
             else:
                 self.event_manager.handle(ModelReady(self))
 
-        for _ in self._load_async(filename, status_window.progress, done):
+        for _ in self._load_async(
+            filename, status_window.progress, done, blob_id=blob_id
+        ):
             pass
 
     @action("file-reload")
@@ -149,6 +171,7 @@ class FileManager(Service, ActionProvider):
         current_filename: Path,
         incoming_filename: Path,
         on_load_done: Callable[[], None] | None = None,
+        blob_ids: ConflictBlobs | None = None,
     ):
         status_window = StatusWindow(
             gettext("Loading…"),
@@ -159,33 +182,7 @@ class FileManager(Service, ActionProvider):
         ancestor_element_factory = ElementFactory()
         incoming_element_factory = ElementFactory()
 
-        def progress(percentage, completed=0):
-            status_window.progress(completed + percentage / 3)
-
-        # Make this callback async, so we can call _load_async again: it's a generator and we can only run one at a time
-        @g_async()
-        def current_done():
-            log.debug("Loading ancestor model from %s", ancestor_filename)
-            for _ in self._load_async(
-                ancestor_filename,
-                partial(progress, completed=33),
-                ancestor_done,
-                element_factory=ancestor_element_factory,
-            ):
-                pass
-
-        @g_async()
-        def ancestor_done():
-            log.debug("Loading incoming model from %s", incoming_filename)
-            for _ in self._load_async(
-                incoming_filename,
-                partial(progress, completed=66),
-                incoming_done,
-                element_factory=incoming_element_factory,
-            ):
-                pass
-
-        def incoming_done():
+        def done():
             try:
                 log.debug("Comparing models")
                 with self.element_factory.block_events():
@@ -202,10 +199,93 @@ class FileManager(Service, ActionProvider):
             finally:
                 status_window.destroy()
 
-        log.debug("Loading current model from %s", current_filename)
-        for _ in self._load_async(current_filename, progress, current_done):
+        for _ in self._merge_async(
+            [
+                (
+                    current_filename,
+                    self.element_factory,
+                    blob_ids and blob_ids.current,
+                ),
+                (
+                    ancestor_filename,
+                    ancestor_element_factory,
+                    blob_ids and blob_ids.ancestor,
+                ),
+                (
+                    incoming_filename,
+                    incoming_element_factory,
+                    blob_ids and blob_ids.incoming,
+                ),
+            ],
+            status_window.progress,
+            done,
+            status_window.destroy,
+        ):
             pass
 
+    @g_async()
+    def _merge_async(
+        self,
+        models: list[tuple[Path, ElementFactory, str | None]],
+        progress: Callable[[float], None],
+        done: Callable[[], None],
+        failed: Callable[[], None],
+    ):
+        """Load the models for a merge.
+
+        The files are parsed concurrently. Once parsed, the element
+        factories are populated one after another in the main thread.
+        Files with a blob id are parsed through the blob cache.
+        """
+        blob_cache = self.blob_cache
+        executor: Executor | None = None
+        try:
+            executor = parse_executor([filename for filename, *_ in models])
+            log.debug("Parsing models %s", [str(f) for f, *_ in models])
+            # Keep futures in model order, so results go to the right factory
+            futures = [
+                executor.submit(blob_cache.parse, filename, blob_id)
+                if blob_id
+                else executor.submit(storage.parse_file, filename)
+                for filename, _, blob_id in models
+            ]
+            pending = set(futures)
+            while pending:
+                # Wait in small steps, so the user interface stays responsive
+                _, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                progress((len(models) - len(pending)) * 50 / len(models))
+                yield
+
+            for n, ((filename, factory, _), future) in enumerate(zip(models, futures)):
+                log.debug("Loading model from %s", filename)
+                elements, gaphor_version = future.result()
+                for percentage in storage.load_parsed_generator(
+                    elements, gaphor_version, factory, self.modeling_language
+                ):
+                    progress(50 + (n * 100 + percentage) * 50 / (len(models) * 100))
+                    yield
+        except Exception:
+            # Do not block the user interface on workers that are still busy
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+            log.exception("Unable to load models for merge")
+            self.filename = None
+            failed()
+            error_handler(
+                message=gettext("Unable to open model “{filename}”.").format(
+                    filename=models[0][0].name
+                ),
+                secondary_message=gettext(
+                    "This file does not contain a valid Gaphor model."
+                ),
+                window=self.parent_window,
+                close=lambda: self.event_manager.handle(SessionShutdown(self)),
+            )
+        else:
+            assert executor
+            executor.shutdown()
+            done()
+
     @g_async()
     def _load_async(
         self,
@@ -213,18 +293,18 @@ class FileManager(Service, ActionProvider):
         progress: Callable[[int], None] | None = None,
         done=None,
         element_factory=None,
+        blob_id: str | None = None,
     ):
         factory = element_factory or self.element_factory
         try:
-            with filename.open(encoding="utf-8", errors="replace") as file_obj:
-                for percentage in storage.load_generator(
-                    file_obj,
-                    factory,
-                    self.modeling_language,
-                ):
-                    if progress:
-                        progress(percentage)
-                    yield percentage
+            if blob_id:
+                loading = self._load_blob_generator(filename, blob_id, factory)
+            else:
+                loading = self._load_file_generator(filename, factory)
+            for percentage in loading:
+                if progress:
+                    progress(percentage)
+                yield percentage
         except MergeConflictDetected:
             self.filename = None
             self.resolve_merge_conflict(filename)
@@ -244,6 +324,25 @@ class FileManager(Service, ActionProvider):
             if done:
                 done()
 
+    def _load_file_generator(self, filename: Path, element_factory: ElementFactory):
+        with filename.open(encoding="utf-8", errors="replace") as file_obj:
+            yield from storage.load_generator(
+                file_obj, element_factory, self.modeling_language
+            )
+
+    def _load_blob_generator(
+        self, filename: Path, blob_id: str, element_factory: ElementFactory
+    ):
+        elements, gaphor_version = self.blob_cache.parse(filename, blob_id)
+        yield from storage.load_parsed_generator(
+            elements, gaphor_version, element_factory, self.modeling_language
+        )
+        yield 100
+
+    @property
+    def blob_cache(self) -> ParsedBlobCache:
+        return ParsedBlobCache(get_cache_dir() / "blobs")
+
     def resolve_merge_conflict(self, filename: Path):
         temp_dir = tempfile.TemporaryDirectory()
         ancestor_filename = Path(temp_dir.name) / f"ancestor-{filename.name}"
@@ -265,18 +364,20 @@ class FileManager(Service, ActionProvider):
             self.event_manager.handle(ModelReady(self, modified=True))
 
         def handle_merge_conflict(answer):
+            assert split
             if answer == "cancel":
                 self.event_manager.handle(SessionShutdown(self))
             elif answer == "current":
-                self.load(current_filename, on_load_done=done)
+                self.load(current_filename, on_load_done=done, blob_id=split.current)
             elif answer == "incoming":
-                self.load(incoming_filename, on_load_done=done)
+                self.load(incoming_filename, on_load_done=done, blob_id=split.incoming)
             elif answer == "manual":
                 self.merge(
                     ancestor_filename,
                     current_filename,
                     incoming_filename,
                     on_load_done=done,
+                    blob_ids=split,
                 )
             else:
                 raise ValueError(f"Unknown resolution for merge conflict: {answer}")
@@ -435,6 +536,20 @@ class FileManager(Service, ActionProvider):
             confirm_shutdown()
 
 
+def parse_executor(filenames: list[Path]) -> Executor:
+    """Create an executor suitable for parsing the given model files.
+
+    Large models are parsed in separate processes, so they are not
+    bound by the GIL. Worker processes are spawned, not forked: forking
+    a process that runs GTK is not safe.
+    """
+    if sum(f.stat().st_size for f in filenames) < PARALLEL_PARSE_THRESHOLD:
+        return ThreadPoolExecutor(max_workers=len(filenames))
+    return ProcessPoolExecutor(
+        max_workers=len(filenames), mp_context=multiprocessing.get_context("spawn")
+    )
+
+
 def resolve_merge_conflict_dialog(window: Gtk.Window, handler) -> None:
     dialog = Adw.MessageDialog.new(
         window,
@@ -5,6 +5,7 @@ from gi.repository import Gio, Gtk
 
 from gaphor.core import event_handler
 from gaphor.core.changeset.apply import applicable, apply_change
+from gaphor.core.changeset.index import PendingChangeIndex
 from gaphor.core.modeling import ModelReady, PendingChange
 from gaphor.event import (
     TransactionBegin,
@@ -24,6 +25,7 @@ class ModelMerge:
         self.model = Gio.ListStore.new(Node.__gtype__)
         self.selection = None
         self.tree_view = None
+        self.pending_changes: PendingChangeIndex | None = None
         self._tx_depth = 0
 
     @property
@@ -32,8 +34,11 @@ class ModelMerge:
 
     def refresh_model(self):
         self.model.remove_all()
+        self.pending_changes = PendingChangeIndex(self.element_factory)
 
-        for node in organize_changes(self.element_factory, self.modeling_language):
+        for node in organize_changes(
+            self.element_factory, self.modeling_language, self.pending_changes
+        ):
             self.model.append(node)
 
     def open(self, builder):
@@ -70,7 +75,12 @@ class ModelMerge:
         def do_apply(node):
             for element in node.elements:
                 if applicable(element, self.element_factory):
-                    apply_change(element, self.element_factory, self.modeling_language)
+                    apply_change(
+                        element,
+                        self.element_factory,
+                        self.modeling_language,
+                        self.pending_changes,
+                    )
             if node.children:
                 for n in node.children:
                     do_apply(n)
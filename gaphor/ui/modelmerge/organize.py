@@ -6,6 +6,7 @@ from typing import Iterable, Sequence
 from gi.repository import Gio, GObject
 
 from gaphor.core.changeset.apply import applicable
+from gaphor.core.changeset.index import PendingChangeIndex
 from gaphor.core.modeling import (
     Diagram,
     ElementChange,
@@ -69,16 +70,18 @@ def as_list_store(list) -> Gio.ListStore:
     return store
 
 
-def organize_changes(element_factory, modeling_language):
+def organize_changes(
+    element_factory,
+    modeling_language,
+    pending_changes: PendingChangeIndex | None = None,
+):
+    if pending_changes is None:
+        pending_changes = PendingChangeIndex(element_factory)
+
     def lookup_element(element_id: str):
         if element := element_factory.lookup(element_id):
             return type(element)
-        elif element_change := next(
-            element_factory.select(
-                lambda e: isinstance(e, ElementChange) and e.element_id == element_id
-            ),
-            None,
-        ):
+        elif element_change := pending_changes.element_change(element_id):
             element_type = modeling_language.lookup_element(element_change.element_name)
             assert element_type
             return element_type
@@ -110,7 +113,9 @@ def organize_changes(element_factory, modeling_language):
     for change in element_factory.select(
         lambda e: isinstance(e, ElementChange) and e.element_name == "Diagram"
     ):
-        node = _element_change_node(change, element_factory, *nesting_rules)
+        node = _element_change_node(
+            change, element_factory, pending_changes, *nesting_rules
+        )
         seen_change_ids.update(_all_change_ids(node))
         yield node
 
@@ -119,13 +124,17 @@ def organize_changes(element_factory, modeling_language):
         lambda e: isinstance(e, Diagram) and e.id not in seen_change_ids
     ):
         value_changes: list[PendingChange] = list(
-            _value_changes(diagram.id, element_factory)
+            pending_changes.value_changes(diagram.id)
         )
         ref_changes = list(
-            _ref_change_nodes(diagram.id, element_factory, *nesting_rules)
+            _ref_change_nodes(
+                diagram.id, element_factory, pending_changes, *nesting_rules
+            )
         )
         presentation_updates = list(
-            _presentation_updates(diagram, element_factory, *nesting_rules[1:])
+            _presentation_updates(
+                diagram, element_factory, pending_changes, *nesting_rules[1:]
+            )
         )
         if value_changes or ref_changes:
             node = Node(
@@ -150,7 +159,10 @@ def organize_changes(element_factory, modeling_language):
             (c for c in changes if isinstance(c, ElementChange)), None
         ):
             node = _element_change_node(
-                element_change, element_factory, composite_and_not_presentation
+                element_change,
+                element_factory,
+                pending_changes,
+                composite_and_not_presentation,
             )
             seen_change_ids.update(_all_change_ids(node))
             yield node
@@ -159,7 +171,10 @@ def organize_changes(element_factory, modeling_language):
                 [c for c in changes if isinstance(c, ValueChange)],
                 list(
                     _ref_change_nodes(
-                        element.id, element_factory, composite_and_not_presentation
+                        element.id,
+                        element_factory,
+                        pending_changes,
+                        composite_and_not_presentation,
                     )
                 ),
                 gettext("Update element “{name}”").format(
@@ -182,61 +197,58 @@ def _all_change_ids(node: Node):
             yield from _all_change_ids(c)
 
 
-def _element_change_node(change, element_factory, *nesting_rules):
+def _element_change_node(change, element_factory, pending_changes, *nesting_rules):
     if change.op == "add":
         return Node(
-            [change, *_value_changes(change.element_id, element_factory)],
+            [change, *pending_changes.value_changes(change.element_id)],
             list(
-                _ref_change_nodes(change.element_id, element_factory, *nesting_rules),
+                _ref_change_nodes(
+                    change.element_id, element_factory, pending_changes, *nesting_rules
+                ),
             ),
-            _create_label(change, element_factory),
+            _create_label(change, element_factory, pending_changes),
         )
     elif change.op == "remove":
         return Node(
-            [*_value_changes(change.element_id, element_factory), change],
+            [*pending_changes.value_changes(change.element_id), change],
             list(
-                _ref_change_nodes(change.element_id, element_factory, *nesting_rules),
+                _ref_change_nodes(
+                    change.element_id, element_factory, pending_changes, *nesting_rules
+                ),
             ),
-            _create_label(change, element_factory),
+            _create_label(change, element_factory, pending_changes),
         )
     else:
         raise ValueError(f"Unknown operation for {change}: {change.op}")
 
 
-def _value_changes(element_id, element_factory) -> Iterable[ValueChange]:
-    return element_factory.select(  # type: ignore[no-any-return]
-        lambda e: isinstance(e, ValueChange) and e.element_id == element_id
-    )
-
-
 def _ref_change_nodes(
-    element_id, element_factory, nesting_rule, *nesting_rules
+    element_id, element_factory, pending_changes, nesting_rule, *nesting_rules
 ) -> Iterable[Node]:
-    for change in element_factory.select(
-        lambda e: isinstance(e, RefChange) and e.element_id == element_id
-    ):
+    for change in pending_changes.ref_changes(element_id):
         if nesting_rule(change) and (
-            element_change := next(
-                element_factory.select(
-                    lambda e: isinstance(e, ElementChange)
-                    and e.element_id == change.property_ref  # noqa: B023
-                ),
-                None,
-            )
+            element_change := pending_changes.element_change(change.property_ref)
         ):
             yield _element_change_node(
-                element_change, element_factory, *(nesting_rules or [nesting_rule])
+                element_change,
+                element_factory,
+                pending_changes,
+                *(nesting_rules or [nesting_rule]),
             )
-        yield Node([change], [], _create_label(change, element_factory))
+        yield Node(
+            [change], [], _create_label(change, element_factory, pending_changes)
+        )
 
 
-def _presentation_updates(diagram, element_factory, *nesting_rules):
+def _presentation_updates(diagram, element_factory, pending_changes, *nesting_rules):
     for presentation in diagram.ownedPresentation:
         value_changes: list[PendingChange] = list(
-            _value_changes(presentation.id, element_factory)
+            pending_changes.value_changes(presentation.id)
         )
         ref_changes = list(
-            _ref_change_nodes(presentation.id, element_factory, *nesting_rules)
+            _ref_change_nodes(
+                presentation.id, element_factory, pending_changes, *nesting_rules
+            )
         )
         if value_changes or ref_changes:
             yield Node(
@@ -246,22 +258,13 @@ def _presentation_updates(diagram, element_factory, *nesting_rules):
             )
 
 
-def _create_label(change, element_factory):
+def _create_label(change, element_factory, pending_changes):
     element = element_factory.lookup(change.element_id)
     name = (
         element.name
         if hasattr(element, "name")
         else v.property_value
-        if (
-            v := next(
-                element_factory.select(
-                    lambda e: isinstance(e, ValueChange)
-                    and e.element_id == change.element_id
-                    and e.property_name == "name"
-                ),
-                None,
-            )
-        )
+        if (v := pending_changes.value_change(change.element_id, "name"))
         else None
     )
 
@@ -311,7 +314,9 @@ def _create_label(change, element_factory):
                 )
             )
     elif isinstance(change, RefChange):
-        if ref_name := _resolve_ref(change.property_ref, element_factory):
+        if ref_name := _resolve_ref(
+            change.property_ref, element_factory, pending_changes
+        ):
             return (
                 gettext("Add relation “{name}” to “{ref_name}”")
                 if op == "add"
@@ -334,17 +339,10 @@ def _create_label(change, element_factory):
             )
 
 
-def _resolve_ref(ref, element_factory):
+def _resolve_ref(ref, element_factory, pending_changes):
     element = element_factory.lookup(ref)
     if element and hasattr(element, "name"):
         return element.name
-    if value_changed := next(
-        element_factory.select(
-            lambda e: isinstance(e, ValueChange)
-            and e.element_id == ref
-            and e.property_name == "name"
-        ),
-        None,
-    ):
+    if value_changed := pending_changes.value_change(ref, "name"):
         return value_changed.property_value
     return None
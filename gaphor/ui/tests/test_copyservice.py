@@ -1,12 +1,20 @@
 import pytest
+from gi.repository import Gio, GLib
 
 from gaphor import UML
 from gaphor.core.modeling import Comment, Diagram
+from gaphor.diagram.copypaste import decode_copy_data
 from gaphor.diagram.general import CommentItem
-from gaphor.ui.copyservice import CopyService
+from gaphor.ui.copyservice import COPY_MIME_TYPE, CopyService
 from gaphor.UML.classes import PackageItem
 
 
+def iterate_main_loop():
+    ctx = GLib.main_context_default()
+    while ctx.pending():
+        ctx.iteration(False)
+
+
 class DiagramsStub:
     def get_current_view(self):
         return None
@@ -23,22 +31,21 @@ def copy_service(event_manager, element_factory, diagrams, monkeypatch):
 
     def set_content(self, content_provider):
         nonlocal copy_buffer
-        copy_buffer = content_provider.get_value()
+        copy_buffer = content_provider
 
-    def read_value_async(self, gtype, io_priority, cancellable, callback):
+    def read_async(self, mime_types, io_priority, cancellable, callback):
+        assert COPY_MIME_TYPE in mime_types
         callback(None, None)
 
-    def read_value_finish(self, res):
-        return copy_buffer
+    def read_finish(self, res):
+        return Gio.MemoryInputStream.new_from_bytes(copy_buffer), COPY_MIME_TYPE
 
-    monkeypatch.setattr("gi.repository.Gdk.ContentProvider.new_for_value", lambda v: v)
-    monkeypatch.setattr("gi.repository.Gdk.Clipboard.set_content", set_content)
-    monkeypatch.setattr(
-        "gi.repository.Gdk.Clipboard.read_value_async", read_value_async
-    )
     monkeypatch.setattr(
-        "gi.repository.Gdk.Clipboard.read_value_finish", read_value_finish
+        "gi.repository.Gdk.ContentProvider.new_for_bytes", lambda _mime, data: data
     )
+    monkeypatch.setattr("gi.repository.Gdk.Clipboard.set_content", set_content)
+    monkeypatch.setattr("gi.repository.Gdk.Clipboard.read_async", read_async)
+    monkeypatch.setattr("gi.repository.Gdk.Clipboard.read_finish", read_finish)
 
     return CopyService(event_manager, element_factory, diagrams)
 
@@ -51,6 +58,7 @@ def test_copy_link(copy_service, element_factory):
     assert list(diagram.get_all_items()) == [ci]
 
     copy_service.paste_link(diagram)
+    iterate_main_loop()
 
     assert len(list(diagram.get_all_items())) == 2, list(diagram.get_all_items())
 
@@ -65,5 +73,23 @@ def test_copy_full_with_owned_element(copy_service, element_factory):
     copy_service.copy({package_item})
 
     copy_service.paste_full(diagram)
+    iterate_main_loop()
 
     assert len(element_factory.lselect(UML.Package)) == 4
+
+
+def test_copy_data_is_serialized(copy_service, element_factory, monkeypatch):
+    diagram = element_factory.create(Diagram)
+    ci = diagram.create(CommentItem, subject=element_factory.create(Comment))
+    copied = []
+    monkeypatch.setattr(
+        "gi.repository.Gdk.Clipboard.set_content",
+        lambda self, content: copied.append(content),
+    )
+
+    copy_service.copy({ci})
+    copy_data = decode_copy_data(copied[0].get_data())
+
+    assert ci.id in copy_data.elements
+    assert ci.subject.id in copy_data.elements
+    assert copy_data.diagram_refs == {diagram.id}
@@ -1,6 +1,7 @@
 import sys
 import textwrap
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import pytest
 from dulwich.repo import Repo
@@ -8,9 +9,10 @@ from gi.repository import GLib
 
 from gaphor import UML
 from gaphor.core import event_handler
+from gaphor.core.modeling import ElementFactory
 from gaphor.event import ModelChangedOnDisk
 from gaphor.storage.tests.fixtures import create_merge_conflict
-from gaphor.ui.filemanager import FileManager
+from gaphor.ui.filemanager import FileManager, parse_executor
 
 
 def iteration(sentinel):
@@ -211,3 +213,108 @@ def merge_conflict(tmp_path):
     create_merge_conflict(repo, model, initial_model, current_model, incoming_model)
 
     return model
+
+
+def test_small_models_are_parsed_in_threads(tmp_path):
+    model = tmp_path / "model.gaphor"
+    model.write_text("<gaphor/>")
+
+    with parse_executor([model, model, model]) as executor:
+        assert isinstance(executor, ThreadPoolExecutor)
+
+
+def test_large_models_are_parsed_in_worker_processes(tmp_path, monkeypatch):
+    model = tmp_path / "model.gaphor"
+    model.write_text("<gaphor/>")
+    monkeypatch.setattr("gaphor.ui.filemanager.PARALLEL_PARSE_THRESHOLD", 1)
+
+    with parse_executor([model, model, model]) as executor:
+        assert isinstance(executor, ProcessPoolExecutor)
+
+
+def test_merge_loads_models_in_their_own_factory(
+    file_manager: FileManager, element_factory, tmp_path, monkeypatch
+):
+    def model_file(name):
+        path = tmp_path / f"{name}.gaphor"
+        path.write_text(
+            textwrap.dedent(
+                f"""\
+                <?xml version="1.0" encoding="utf-8"?>
+                <gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="2.12.1">
+                <Package id="{name}">
+                <name>
+                <val>{name}</val>
+                </name>
+                </Package>
+                </gaphor>"""
+            ),
+            encoding="utf-8",
+        )
+        return path
+
+    compared = []
+
+    def compare(current, ancestor, incoming):
+        compared.extend(
+            next(factory.select(UML.Package)).name
+            for factory in (current, ancestor, incoming)
+        )
+        return iter(())
+
+    monkeypatch.setattr("gaphor.ui.filemanager.compare", compare)
+
+    file_manager.merge(
+        model_file("ancestor"), model_file("current"), model_file("incoming")
+    )
+
+    assert compared == ["current", "ancestor", "incoming"]
+
+
+def test_merge_does_not_wait_for_workers_on_error(
+    file_manager: FileManager, tmp_path, monkeypatch
+):
+    model = tmp_path / "broken.gaphor"
+    model.write_text("<gaphor")
+    shutdowns = []
+
+    class Executor(ThreadPoolExecutor):
+        def shutdown(self, wait=True, *, cancel_futures=False):
+            shutdowns.append((wait, cancel_futures))
+            super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    monkeypatch.setattr(
+        "gaphor.ui.filemanager.parse_executor", lambda filenames: Executor()
+    )
+    monkeypatch.setattr("gaphor.ui.filemanager.error_handler", lambda **kwargs: None)
+    failed = []
+
+    for _ in file_manager._merge_async(  # noqa: SLF001
+        [(model, ElementFactory(), None)],
+        lambda p: None,
+        lambda: None,
+        lambda: failed.append(True),
+    ):
+        pass
+
+    assert failed
+    assert shutdowns == [(False, True)]
+
+
+def test_load_from_blob_finishes_progress(
+    file_manager: FileManager, element_factory, tmp_path, monkeypatch
+):
+    model = tmp_path / "model.gaphor"
+    element_factory.create(UML.Class)
+    file_manager.save(filename=model)
+    monkeypatch.setattr(
+        "gaphor.ui.filemanager.get_cache_dir", lambda: tmp_path / "cache"
+    )
+    progress: list[int] = []
+
+    for _ in file_manager._load_async(  # noqa: SLF001
+        model, progress.append, element_factory=ElementFactory(), blob_id="1234"
+    ):
+        pass
+
+    assert progress[-1] == 100
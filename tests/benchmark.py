@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Benchmark hot paths of Gaphor.
+
+Run all benchmarks, and write the results as JSON::
+
+    python tests/benchmark.py -o results.json
+
+Only run benchmarks which name matches a regular expression, and compare
+the results with an earlier run::
+
+    python tests/benchmark.py -k load --compare results.json
+
+Every benchmark is run a number of rounds. The minimum and median time
+of a round are reported, in seconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import cairo
+
+from gaphor import UML
+from gaphor.C4Model.modelinglanguage import C4ModelLanguage
+from gaphor.core.changeset.compare import compare
+from gaphor.core.eventmanager import EventManager
+from gaphor.core.modeling import Comment, Diagram, ElementFactory
+from gaphor.core.modeling.diagram import StyledItem
+from gaphor.core.modeling.elementdispatcher import ElementDispatcher
+from gaphor.core.modeling.modelinglanguage import (
+    CoreModelingLanguage,
+    MockModelingLanguage,
+)
+from gaphor.diagram.painter import ItemPainter
+from gaphor.RAAML.modelinglanguage import RAAMLModelingLanguage
+from gaphor.services.undomanager import UndoManager
+from gaphor.storage import storage
+from gaphor.SysML.modelinglanguage import SysMLModelingLanguage
+from gaphor.transaction import Transaction
+from gaphor.UML.modelinglanguage import UMLModelingLanguage
+from gaphor.UML.syntheticmodel import ModelSize, generate
+
+workspace = Path(__file__).parent.parent
+
+modeling_language = MockModelingLanguage(
+    CoreModelingLanguage(),
+    UMLModelingLanguage(),
+    SysMLModelingLanguage(),
+    RAAMLModelingLanguage(),
+    C4ModelLanguage(),
+)
+
+# A benchmark prepares its data, and returns the function to time
+Benchmark = Callable[[], Callable[[], object]]
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str):
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def new_element_factory() -> ElementFactory:
+    event_manager = EventManager()
+    return ElementFactory(
+        event_manager, ElementDispatcher(event_manager, modeling_language)
+    )
+
+
+def load(text: str, element_factory: ElementFactory | None = None) -> ElementFactory:
+    element_factory = element_factory or new_element_factory()
+    storage.load(io.StringIO(text), element_factory, modeling_language)
+    return element_factory
+
+
+def model_benchmarks(kind: str, paths: list[Path]):
+    """Register a benchmark for each model file."""
+
+    def register(func: Callable[[str], Callable[[], object]]):
+        for path in paths:
+            BENCHMARKS[f"{kind}:{path.parent.name}/{path.stem}"] = (
+                lambda path=path: func(path.read_text(encoding="utf-8"))
+            )
+        return func
+
+    return register
+
+
+MODELS = sorted((workspace / "models").glob("*.gaphor"))
+EXAMPLES = sorted((workspace / "examples").glob("*.gaphor"))
+
+
+@model_benchmarks("load", MODELS)
+def load_model(text):
+    return lambda: load(text)
+
+
+@model_benchmarks("save", MODELS)
+def save_model(text):
+    element_factory = load(text)
+    return lambda: storage.save(io.StringIO(), element_factory)
+
+
+@model_benchmarks("update-and-paint", EXAMPLES)
+def update_and_paint(text):
+    diagrams = load(text).lselect(Diagram)
+
+    def run():
+        for diagram in diagrams:
+            diagram.update(diagram.ownedPresentation)
+            surface = cairo.RecordingSurface(cairo.Content.COLOR_ALPHA, None)
+            ItemPainter().paint(diagram.get_all_items(), cairo.Context(surface))
+
+    return run
+
+
+@model_benchmarks("style", EXAMPLES)
+def style(text):
+    diagrams = load(text).lselect(Diagram)
+
+    def run():
+        for diagram in diagrams:
+            diagram.update()  # Clears the compiled style sheet
+            for item in diagram.get_all_items():
+                diagram.style(StyledItem(item))
+
+    return run
+
+
+@benchmark("dispatcher")
+def dispatcher():
+    element_factory = new_element_factory()
+    dispatcher = element_factory.element_dispatcher
+    assert dispatcher
+    classes = [element_factory.create(UML.Class) for _ in range(1000)]
+    for cls in classes:
+        cls.ownedAttribute = element_factory.create(UML.Property)
+    rounds = iter(range(sys.maxsize))
+
+    def handler(event):
+        pass
+
+    def run():
+        name = f"name{next(rounds)}"
+        for cls in classes:
+            dispatcher.subscribe(handler, cls, "ownedAttribute.name")
+        for cls in classes:
+            cls.ownedAttribute[0].name = name
+        dispatcher.unsubscribe(handler)
+
+    return run
+
+
+@benchmark("undo-redo")
+def undo_redo():
+    event_manager = EventManager()
+    element_factory = ElementFactory(event_manager)
+    undo_manager = UndoManager(event_manager, element_factory)
+
+    with Transaction(event_manager):
+        classes = [element_factory.create(UML.Class) for _ in range(1000)]
+
+    with Transaction(event_manager):
+        for n, cls in enumerate(classes):
+            cls.name = f"Class{n}"
+            cls.ownedAttribute = element_factory.create(UML.Property)
+
+    def run():
+        undo_manager.undo_transaction()
+        undo_manager.redo_transaction()
+
+    return run
+
+
+@benchmark("compare:RAAML")
+def compare_raaml():
+    ancestor = load(
+        (workspace / "test-models" / "RAAML-original.gaphor").read_text("utf-8")
+    )
+    incoming = load(
+        (workspace / "test-models" / "RAAML-incoming.gaphor").read_text("utf-8")
+    )
+
+    def run():
+        current = ElementFactory()
+        list(compare(current, ancestor, incoming))
+
+    return run
+
+
+# 20 packages of 100 classes, about 26,000 elements
+SYNTHETIC_MODEL = ModelSize(packages=20, classes=100, attributes=5, relationships=2)
+
+
+@benchmark("synthetic:create")
+def synthetic_create():
+    return lambda: generate(new_element_factory(), SYNTHETIC_MODEL)
+
+
+@benchmark("synthetic:load")
+def synthetic_load():
+    element_factory = new_element_factory()
+    generate(element_factory, SYNTHETIC_MODEL)
+    text = io.StringIO()
+    storage.save(text, element_factory)
+    return lambda: load(text.getvalue())
+
+
+@benchmark("synthetic:save")
+def synthetic_save():
+    element_factory = new_element_factory()
+    generate(element_factory, SYNTHETIC_MODEL)
+    return lambda: storage.save(io.StringIO(), element_factory)
+
+
+@benchmark("load:large-values")
+def load_large_values():
+    element_factory = new_element_factory()
+    for n in range(4):
+        comment = element_factory.create(Comment)
+        # 5 MB of text, split over lines like a pasted document
+        comment.body = f"Comment {n}, line of text.\n" * 200_000
+    text = io.StringIO()
+    storage.save(text, element_factory)
+    return lambda: load(text.getvalue())
+
+
+def run_benchmark(func: Benchmark, rounds: int) -> dict[str, float]:
+    run = func()
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "rounds": rounds,
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=workspace,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark hot paths of Gaphor.")
+    parser.add_argument(
+        "-k", metavar="regex", help="only run benchmarks that match a regex"
+    )
+    parser.add_argument(
+        "-r", "--rounds", type=int, default=5, help="rounds per benchmark, default 5"
+    )
+    parser.add_argument("-o", "--output", help="write results to a JSON file")
+    parser.add_argument(
+        "--compare", metavar="results", help="compare with earlier results"
+    )
+    args = parser.parse_args(argv)
+
+    baseline = (
+        json.loads(Path(args.compare).read_text(encoding="utf-8"))["benchmarks"]
+        if args.compare
+        else {}
+    )
+    name_re = re.compile(args.k) if args.k else None
+
+    results = {}
+    for name, func in BENCHMARKS.items():
+        if name_re and not name_re.search(name):
+            continue
+        results[name] = result = run_benchmark(func, args.rounds)
+        line = f"{name:50} {result['min']:10.4f} {result['median']:10.4f}"
+        if old := baseline.get(name):
+            line += f" {result['min'] / old['min']:8.2f}x"
+        print(line)  # noqa: T201
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(
+                {
+                    "commit": git_commit(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "benchmarks": results,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
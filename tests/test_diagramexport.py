@@ -48,3 +48,17 @@ def test_export_svg(tmp_path, model):
 
     assert model_path.exists()
     assert (model_path / "main.svg").exists()
+
+
+def test_export_multiple_formats(tmp_path, model):
+    main(["gaphor", "export", "-f", "svg,pdf", "-o", str(tmp_path), str(model)])
+
+    model_path = tmp_path / "New model"
+
+    assert (model_path / "main.svg").exists()
+    assert (model_path / "main.pdf").exists()
+
+
+def test_export_unknown_format(tmp_path, model):
+    with pytest.raises(SystemExit, match="2"):
+        main(["gaphor", "export", "-f", "svg,gif", "-o", str(tmp_path), str(model)])
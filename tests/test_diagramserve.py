@@ -0,0 +1,116 @@
+import importlib
+import json
+import os
+import shutil
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from gaphor.main import main
+from gaphor.plugins.diagramexport.servecli import RenderCache, RenderServer
+
+
+def test_help_output(capsys):
+    with pytest.raises(SystemExit, match="0"):
+        main(["gaphor", "serve", "--help"])
+
+    captured = capsys.readouterr()
+    assert "--port" in captured.out
+
+
+@pytest.fixture
+def model(tmp_path):
+    model = tmp_path / "all-elements.gaphor"
+    shutil.copy(importlib.resources.files("test-models") / "all-elements.gaphor", model)
+    return model
+
+
+@pytest.fixture
+def server(model):
+    server = RenderServer(("127.0.0.1", 0), [model])
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, path):
+    with urllib.request.urlopen(
+        f"http://127.0.0.1:{server.server_port}{path}"
+    ) as response:
+        return response.headers["Content-Type"], response.read()
+
+
+def test_list_diagrams(server):
+    content_type, data = get(server, "/")
+
+    assert content_type == "application/json"
+    assert "New model.main" in [
+        d["name"] for d in json.loads(data)["all-elements.gaphor"]
+    ]
+
+
+@pytest.mark.parametrize(
+    "format,content",
+    [["svg", b"<svg"], ["png", b"PNG"], ["pdf", b"%PDF"]],
+)
+def test_render_diagram(server, format, content):
+    _, data = get(server, f"/all-elements.gaphor/New%20model.main.{format}")
+
+    assert content in data
+
+
+def test_render_is_cached(server):
+    get(server, "/all-elements.gaphor/New%20model.main.svg")
+    get(server, "/all-elements.gaphor/New%20model.main.svg")
+
+    assert len(server.render_cache) == 1
+
+
+def test_unknown_diagram(server):
+    with pytest.raises(urllib.error.HTTPError, match="404"):
+        get(server, "/all-elements.gaphor/unknown.svg")
+
+
+def test_model_is_reloaded_when_changed(server, model):
+    get(server, "/")
+    factory = server.models[model.name].element_factory
+
+    model.write_text(model.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    get(server, "/")
+
+    assert server.models[model.name].element_factory is not factory
+
+
+def test_invalid_model_is_an_internal_server_error(server, model):
+    model.write_text("<gaphor", encoding="utf-8")
+
+    with pytest.raises(urllib.error.HTTPError, match="500"):
+        get(server, "/")
+
+
+def test_model_is_loaded_again_after_a_failed_load(server, model):
+    content = model.read_text(encoding="utf-8")
+    model.write_text("<gaphor", encoding="utf-8")
+    with pytest.raises(urllib.error.HTTPError, match="500"):
+        get(server, "/")
+
+    mtime = model.stat().st_mtime_ns
+    model.write_text(content, encoding="utf-8")
+    os.utime(model, ns=(mtime, mtime))
+    _, data = get(server, "/")
+
+    assert json.loads(data)["all-elements.gaphor"]
+
+
+def test_render_cache_is_bounded():
+    cache = RenderCache(max_size=1)
+
+    cache.put("a", b"a")
+    cache.put("b", b"b")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"b"
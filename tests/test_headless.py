@@ -0,0 +1,37 @@
+import subprocess
+import sys
+from pathlib import Path
+
+MODEL = Path(__file__).parent.parent / "models" / "Core.gaphor"
+
+SCRIPT = """
+import sys
+
+from gaphor.core.modeling import Diagram, ElementFactory
+from gaphor.services.modelinglanguage import ModelingLanguageService
+from gaphor.storage import storage
+
+element_factory = ElementFactory()
+with open(sys.argv[1], encoding="utf-8") as model:
+    storage.load(
+        model, element_factory, ModelingLanguageService(), update_diagrams=False
+    )
+
+assert element_factory.lselect(Diagram)
+print(" ".join(m for m in sys.modules if m.startswith("gi.repository.")))
+"""
+
+
+def test_load_model_without_text_rendering_backend():
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, str(MODEL)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    imported = result.stdout.split()
+
+    assert "gi.repository.Pango" not in imported
+    assert "gi.repository.PangoCairo" not in imported
+    assert "gi.repository.Gtk" not in imported
@@ -0,0 +1,87 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+from gaphor import UML
+from gaphor.core.modeling import Comment
+from gaphor.main import main
+from gaphor.storage.statscli import fan_out, largest_values, sizeof, type_statistics
+
+
+@pytest.fixture
+def model():
+    return importlib.resources.files("test-models") / "all-elements.gaphor"
+
+
+def test_help_output(capsys):
+    with pytest.raises(SystemExit, match="0"):
+        main(["gaphor", "stats", "--help"])
+
+    captured = capsys.readouterr()
+    assert "--top" in captured.out
+    assert "--json" in captured.out
+
+
+def test_stats_report(capsys, model):
+    main(["gaphor", "stats", str(model)])
+
+    captured = capsys.readouterr()
+    assert "elements" in captured.out
+    assert "load:" in captured.out
+    assert "render:" in captured.out
+    assert "ClassItem" in captured.out
+
+
+def test_stats_as_json(capsys, model):
+    main(["gaphor", "stats", "--json", "--no-render", "-n", "3", str(model)])
+
+    stats = json.loads(capsys.readouterr().out)
+
+    assert stats["elements"] == sum(t["count"] for t in stats["types"].values())
+    assert set(stats["timings"]) == {"load", "save"}
+    assert len(stats["fan_out"]) == 3
+    assert len(stats["largest_values"]) == 3
+
+
+def test_type_statistics(element_factory):
+    element_factory.create(UML.Class)
+    element_factory.create(UML.Class).ownedAttribute = element_factory.create(
+        UML.Property
+    )
+
+    types = type_statistics(element_factory.values())
+
+    assert types["Class"].count == 2
+    assert types["Property"].count == 1
+    assert types["Class"].collections > 0
+
+
+def test_fan_out(element_factory):
+    package = element_factory.create(UML.Package)
+    for _ in range(3):
+        element_factory.create(UML.Class).package = package
+
+    widest = fan_out(element_factory.values())[0]
+
+    assert (widest.type, widest.association) == ("Package", "ownedType")
+    assert widest.max == 3
+
+
+def test_largest_values(element_factory):
+    element_factory.create(Comment).body = "x" * 100
+    element_factory.create(UML.Class).name = "Car"
+
+    values = largest_values(element_factory.values())
+
+    assert [(v.type, v.attribute, v.size) for v in values] == [
+        ("Comment", "body", 100),
+        ("Class", "name", 3),
+    ]
+
+
+def test_sizeof_does_not_follow_elements(element_factory):
+    cls = element_factory.create(UML.Class)
+
+    assert sizeof([cls]) == sys.getsizeof([cls])